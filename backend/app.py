@@ -10,7 +10,7 @@ load_dotenv()
 from routes.candidates import candidates_bp
 from routes.search import search_bp
 
-from services.database import Database
+from services.database import get_database
 
 # Create Flask app
 app = Flask(__name__)
@@ -19,13 +19,13 @@ app = Flask(__name__)
 CORS(app, resources={
     r"/api/*": {
         "origins": ["http://localhost:3000", "http://localhost:5173"],
-        "methods": ["GET", "POST", "PUT", "DELETE"],
+        "methods": ["GET", "POST", "PUT", "PATCH", "DELETE"],
         "allow_headers": ["Content-Type"]
     }
 })
 
-# Initialize database
-db = Database()
+# Initialize database (shared with the blueprints)
+db = get_database()
 db.init_schema()
 
 # Register blueprints
@@ -54,7 +54,10 @@ def health():
     return jsonify({
         'status': 'healthy',
         'grok_api_configured': bool(os.getenv('XAI_API_KEY')),
-        'supabase_configured': bool(os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_KEY'))
+        'supabase_configured': bool(os.getenv('SUPABASE_URL') and os.getenv('SUPABASE_KEY')),
+        'database_pool': db.pool_stats(),
+        'candidate_cache': db.cache_stats(),
+        'leaderboard': db.leaderboard.stats()
     })
 
 
@@ -0,0 +1,5 @@
+"""
+Benchmarks
+Seeded synthetic candidate populations and timing runs for the scoring path.
+Run from the backend directory: python -m benchmarks.scoring --help
+"""
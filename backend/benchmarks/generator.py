@@ -0,0 +1,164 @@
+"""
+Synthetic Candidate Generator
+Deterministic, seeded candidate populations with realistic field distributions
+"""
+
+import random
+from typing import Iterator, List
+from models.candidate import Candidate, Experience, Education, GitHubStats, SocialProfile, ResearchPublication
+from config import Config
+
+# Share of experience entries at each company category; the rest go to the long tail
+FAANG_SHARE = 0.12
+FRONTIER_SHARE = 0.05
+TOP_TECH_SHARE = 0.13
+
+OTHER_COMPANIES = [
+    'Acme Corp', 'Initech', 'Globex', 'Hooli', 'Pied Piper', 'Vandelay Industries', 'Wayne Enterprises',
+    'Stark Industries', 'Umbrella Labs', 'Cyberdyne Systems', 'Soylent Inc', 'Massive Dynamic',
+    'Xerox', 'Box', 'Metabase', 'Shopify', 'Atlassian', 'GitLab', 'Cloudflare', 'Twilio'
+]
+OTHER_UNIVERSITIES = [
+    'State University', 'City College', 'Tech Institute', 'Polytechnic University',
+    'University of Somewhere', 'Community College', 'National University'
+]
+LEVELS = ['', '', 'Senior ', 'Senior ', 'Staff ', 'Principal ', 'Lead ', 'Junior ']
+ROLES = [
+    'Software Engineer', 'Machine Learning Engineer', 'Research Scientist', 'Research Engineer',
+    'Data Scientist', 'Backend Engineer', 'Infrastructure Engineer', 'Product Engineer'
+]
+MANAGEMENT_TITLES = ['Engineering Manager', 'Director of Engineering', 'VP Engineering', 'Head of ML', 'CTO']
+DEGREES = ['BS Computer Science', 'B.S.', 'Bachelor of Engineering', 'MS Computer Science',
+           'Master of Science', 'PhD', 'Ph.D. Machine Learning', None]
+LANGUAGES = ['Python', 'Rust', 'Go', 'TypeScript', 'C++', 'Java', 'CUDA', 'Scala', 'Haskell']
+VENUES = ['NeurIPS', 'ICML', 'ICLR', 'ACL', 'CVPR', 'arXiv', 'KDD']
+
+
+class CandidateGenerator:
+    """
+    Build Candidate objects from a seeded RNG.
+
+    The same seed always yields the same sequence, so a population of n is
+    the first n candidates of any larger population with that seed.
+    """
+
+    def __init__(self, seed: int = 42):
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+    def generate(self, count: int) -> List[Candidate]:
+        """Generate ``count`` candidates."""
+        return [self.candidate(index) for index in range(count)]
+
+    def chunks(self, count: int, chunk_size: int = 10000) -> Iterator[List[Candidate]]:
+        """Generate ``count`` candidates ``chunk_size`` at a time, keeping memory flat for large runs."""
+        index = 0
+        while index < count:
+            size = min(chunk_size, count - index)
+            yield [self.candidate(index + offset) for offset in range(size)]
+            index += size
+
+    def candidate(self, index: int) -> Candidate:
+        """Generate one candidate."""
+        rng = self.rng
+        experiences = [self.experience() for _ in range(self._count((0.08, 0.2, 0.27, 0.22, 0.13, 0.07, 0.03)))]
+        months = sum(exp.duration_months for exp in experiences)
+        username = f"dev{self.seed}_{index}"
+
+        return Candidate(
+            name=f"Candidate {index}",
+            email=f"{username}@example.com" if rng.random() < 0.5 else None,
+            x_profile=self.x_profile(username) if rng.random() < 0.4 else None,
+            github_profile=self.github_profile(username) if rng.random() < 0.7 else None,
+            linkedin_url=f"https://www.linkedin.com/in/{username}" if rng.random() < 0.6 else None,
+            current_title=experiences[0].title if experiences else None,
+            current_company=experiences[0].company if experiences else None,
+            bio=f"Engineer working on {rng.choice(LANGUAGES)} and {rng.choice(ROLES).lower()} problems",
+            experiences=experiences,
+            total_years_experience=round(max(months / 12 + rng.gauss(0, 1), 0), 1),
+            education=[self.education() for _ in range(self._count((0.15, 0.55, 0.25, 0.05)))],
+            publications=self.publications(),
+            discovered_from=rng.choice(['github_search', 'x_search', 'manual'])
+        )
+
+    def experience(self) -> Experience:
+        """One work experience: mostly long-tail employers, log-normal tenure."""
+        rng = self.rng
+        roll = rng.random()
+        if roll < FAANG_SHARE:
+            company = rng.choice(Config.FAANG_COMPANIES)
+        elif roll < FAANG_SHARE + FRONTIER_SHARE:
+            company = rng.choice(Config.FRONTIER_LABS)
+        elif roll < FAANG_SHARE + FRONTIER_SHARE + TOP_TECH_SHARE:
+            company = rng.choice(Config.TOP_TECH_COMPANIES)
+        elif rng.random() < 0.5:
+            company = rng.choice(OTHER_COMPANIES)
+        else:
+            company = f"Startup {rng.randint(1, 50000)} Inc"
+
+        if rng.random() < 0.1:
+            title = rng.choice(MANAGEMENT_TITLES)
+        else:
+            title = rng.choice(LEVELS) + rng.choice(ROLES)
+
+        return Experience(
+            company=company,
+            title=title,
+            duration_months=min(int(rng.lognormvariate(3.0, 0.7)), 180)
+        )
+
+    def education(self) -> Education:
+        """One degree; about a quarter from a top university."""
+        rng = self.rng
+        top = rng.random() < 0.25
+        return Education(
+            institution=rng.choice(Config.TOP_UNIVERSITIES if top else OTHER_UNIVERSITIES),
+            degree=rng.choice(DEGREES),
+            field='Computer Science' if rng.random() < 0.7 else 'Mathematics',
+            end_year=rng.randint(1995, 2025)
+        )
+
+    def github_profile(self, username: str) -> GitHubStats:
+        """GitHub stats with heavy-tailed followers and stars."""
+        rng = self.rng
+        return GitHubStats(
+            username=username,
+            url=f"https://github.com/{username}",
+            followers=int(rng.paretovariate(1.2) * 5) - 5,
+            public_repos=int(rng.expovariate(1 / 25)),
+            total_stars=int(rng.paretovariate(1.1) * 10) - 10,
+            contributions_last_year=int(rng.expovariate(1 / 300)),
+            top_languages=rng.sample(LANGUAGES, rng.randint(1, 4)),
+            notable_projects=[{'name': f'project-{i}'} for i in range(self._count((0.5, 0.25, 0.12, 0.08, 0.05)))]
+        )
+
+    def x_profile(self, username: str) -> SocialProfile:
+        """X profile with engagement skewed low."""
+        rng = self.rng
+        return SocialProfile(
+            platform='X/Twitter',
+            username=username,
+            url=f"https://x.com/{username}",
+            followers=int(rng.paretovariate(1.1) * 50) - 50,
+            engagement_score=round(rng.betavariate(2, 5) * 100, 2)
+        )
+
+    def publications(self) -> List[ResearchPublication]:
+        """Most candidates have none; researchers have a few with heavy-tailed citations."""
+        rng = self.rng
+        if rng.random() >= 0.15:
+            return []
+        return [
+            ResearchPublication(
+                title=f"Paper {rng.randint(1, 10 ** 6)}",
+                authors=[f"Author {rng.randint(1, 1000)}" for _ in range(rng.randint(1, 6))],
+                venue=rng.choice(VENUES),
+                year=rng.randint(2010, 2025),
+                citations=int(rng.paretovariate(1.0) * 3) - 3
+            )
+            for _ in range(rng.randint(1, 20))
+        ]
+
+    def _count(self, weights) -> int:
+        """Draw 0..len(weights)-1 with the given weights."""
+        return self.rng.choices(range(len(weights)), weights=weights)[0]
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Scoring Benchmarks
+Times the scoring path over synthetic populations and prints JSON results
+
+Usage (from the backend directory):
+    python -m benchmarks.scoring --sizes 1000 100000 1000000 --output results.json
+    python -m benchmarks.scoring --sizes 1000 --baseline results.json
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+import numpy as np
+import pydantic
+from models.candidate import CandidateModel
+from services.database import Database
+from services.scoring_service import ScoringService
+from .generator import CandidateGenerator
+
+# Population sizes run by default
+DEFAULT_SIZES = (1000, 100000, 1000000)
+
+# Operations timed per chunk, in run order; each receives the chunk's state.
+# score_candidate_unclassified matches history text on the fly (fresh input);
+# score_candidate reads the flags classify_history stored (rows from the database)
+BENCHMARKS = (
+    'score_candidate_unclassified', 'classify_history', 'score_candidate', 'determine_priority_tier',
+    'score_batch', 'model_to_candidate', 'json_serialize'
+)
+
+
+def run_size(size: int, seed: int, chunk_size: int, scoring: ScoringService, database: Database) -> Dict[str, float]:
+    """
+    Time every benchmark over one population.
+
+    The population is generated ``chunk_size`` candidates at a time; only the
+    benchmarked calls are inside the timers.
+
+    Returns:
+        Total seconds per benchmark
+    """
+    totals = defaultdict(float)
+
+    def timed(name: str, operation: Callable):
+        start = time.perf_counter()
+        result = operation()
+        totals[name] += time.perf_counter() - start
+        return result
+
+    for chunk in CandidateGenerator(seed).chunks(size, chunk_size):
+        timed('score_candidate_unclassified', lambda: [scoring.score_candidate(candidate) for candidate in chunk])
+        timed('classify_history', lambda: [scoring.classify_history(candidate) for candidate in chunk])
+        scores = timed('score_candidate', lambda: [scoring.score_candidate(candidate) for candidate in chunk])
+        tiers = timed('determine_priority_tier', lambda: [scoring.determine_priority_tier(score) for score in scores])
+        timed('score_batch', lambda: scoring.score_batch(chunk))
+
+        for candidate, score, tier in zip(chunk, scores, tiers):
+            candidate.score = score
+            candidate.priority_tier = tier
+        # Rows as they come back from the database (last_updated is set by the column default)
+        models = [
+            CandidateModel(**database._candidate_to_dict(candidate), last_updated=candidate.last_updated)
+            for candidate in chunk
+        ]
+        timed('model_to_candidate', lambda: [database._model_to_candidate(model) for model in models])
+        timed('json_serialize', lambda: [json.dumps(candidate.dict(), default=str) for candidate in chunk])
+
+    return dict(totals)
+
+
+def run(sizes: List[int], seed: int = 42, chunk_size: int = 10000, repeat: int = 1) -> Dict:
+    """
+    Run the suite and build the machine-readable report.
+
+    With ``repeat`` > 1 each size is run that many times and the fastest run
+    of each benchmark is kept.
+    """
+    scoring = ScoringService()
+    # Only used for its model conversions; never connects
+    database = Database()
+    results = []
+
+    for size in sizes:
+        best: Dict[str, float] = {}
+        for _ in range(repeat):
+            for name, seconds in run_size(size, seed, chunk_size, scoring, database).items():
+                best[name] = min(seconds, best.get(name, seconds))
+
+        for name in BENCHMARKS:
+            seconds = best[name]
+            results.append({
+                'benchmark': name,
+                'size': size,
+                'seconds': round(seconds, 6),
+                'items_per_sec': round(size / seconds, 1) if seconds > 0 else None,
+                'us_per_item': round(seconds / size * 1e6, 3)
+            })
+            print(f"{name:>28} n={size:<8} {seconds:9.3f}s {seconds / size * 1e6:10.2f} us/item", file=sys.stderr)
+
+    return {'meta': _metadata(seed, chunk_size, repeat), 'results': results}
+
+
+def compare(report: Dict, baseline: Dict) -> None:
+    """Annotate each result with the baseline's us_per_item and the relative change."""
+    previous = {(entry['benchmark'], entry['size']): entry for entry in baseline.get('results', [])}
+    for entry in report['results']:
+        match = previous.get((entry['benchmark'], entry['size']))
+        if not match or not match.get('us_per_item'):
+            continue
+        entry['baseline_us_per_item'] = match['us_per_item']
+        entry['change_pct'] = round((entry['us_per_item'] / match['us_per_item'] - 1) * 100, 1)
+    report['meta']['baseline_commit'] = baseline.get('meta', {}).get('commit')
+
+
+def _metadata(seed: int, chunk_size: int, repeat: int) -> Dict:
+    """Environment details needed to compare runs across commits and machines."""
+    return {
+        'timestamp': datetime.utcnow().isoformat() + 'Z',
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pydantic': pydantic.VERSION,
+        'platform': platform.platform(),
+        'seed': seed,
+        'chunk_size': chunk_size,
+        'repeat': repeat
+    }
+
+
+def _git_commit() -> Optional[str]:
+    """Current commit hash, or None outside a git checkout."""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark candidate scoring on synthetic populations")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help="Population sizes")
+    parser.add_argument('--seed', type=int, default=42, help="Generator seed")
+    parser.add_argument('--chunk-size', type=int, default=10000, help="Candidates generated and timed at a time")
+    parser.add_argument('--repeat', type=int, default=1, help="Runs per size; the fastest is reported")
+    parser.add_argument('--output', help="Write the JSON report here instead of stdout")
+    parser.add_argument('--baseline', help="Earlier JSON report to compare against")
+    args = parser.parse_args()
+
+    report = run(args.sizes, seed=args.seed, chunk_size=args.chunk_size, repeat=args.repeat)
+    if args.baseline:
+        with open(args.baseline) as f:
+            compare(report, json.load(f))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
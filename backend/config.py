@@ -20,6 +20,53 @@ class Config:
     # GitHub API
     GITHUB_TOKEN = os.getenv('GITHUB_TOKEN')
 
+    # Database: PostgreSQL in production; sqlite:// for an in-memory database.
+    # Only an explicit FLASK_ENV=development falls back to a local SQLite file
+    DEV_DATABASE_URL = 'sqlite:///grok_talent.db'
+    DATABASE_URL = os.getenv('DATABASE_URL') or (
+        DEV_DATABASE_URL if os.getenv('FLASK_ENV') == 'development' else None
+    )
+    SQLITE_BUSY_TIMEOUT = float(os.getenv('SQLITE_BUSY_TIMEOUT', 5))
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 5))
+    DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', 5))
+    DB_POOL_TIMEOUT = int(os.getenv('DB_POOL_TIMEOUT', 30))
+    DB_POOL_PRE_PING = os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true'
+    DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', 1800))
+
+    # Candidate cache for GET /api/candidates/<id>: 'memory' (per-process LRU)
+    # or 'shared' (Redis at REDIS_URL, local stand-in when unavailable)
+    CANDIDATE_CACHE_BACKEND = os.getenv('CANDIDATE_CACHE_BACKEND', 'memory')
+    CANDIDATE_CACHE_SIZE = int(os.getenv('CANDIDATE_CACHE_SIZE', 2048))
+    CANDIDATE_CACHE_TTL = float(os.getenv('CANDIDATE_CACHE_TTL', 300))
+    REDIS_URL = os.getenv('REDIS_URL')
+
+    # Share of text relevance (vs. total_score) in `q` search ranking
+    SEARCH_RELEVANCE_WEIGHT = float(os.getenv('SEARCH_RELEVANCE_WEIGHT', 0.7))
+
+    # Seconds /api/search/stats results are reused before re-aggregating
+    STATS_CACHE_TTL = float(os.getenv('STATS_CACHE_TTL', 5))
+
+    # Candidates kept in the in-process /api/candidates/top leaderboard, and
+    # seconds before it is reloaded to pick up writes from other processes
+    LEADERBOARD_SIZE = int(os.getenv('LEADERBOARD_SIZE', 500))
+    LEADERBOARD_TTL = float(os.getenv('LEADERBOARD_TTL', 60))
+
+    # Seconds the in-process score snapshot behind /api/search/rerank is reused
+    RERANK_SNAPSHOT_TTL = float(os.getenv('RERANK_SNAPSHOT_TTL', 60))
+
+    # Rows written within this many seconds are held back from the change feed
+    # so a write still committing with an older timestamp is not skipped
+    CHANGE_FEED_SETTLE_SECONDS = float(os.getenv('CHANGE_FEED_SETTLE_SECONDS', 2))
+
+    # Distinct company / university names whose classification is memoized
+    ORG_CACHE_SIZE = int(os.getenv('ORG_CACHE_SIZE', 65536))
+
+    # Discovery skips enrichment for candidates whose optimistic score cannot
+    # reach this tier. 'low' (the default) enriches everyone; without stored
+    # history a discovery tops out below 'medium', so stricter tiers mostly
+    # enrich people already in the database
+    DISCOVERY_MIN_TIER = os.getenv('DISCOVERY_MIN_TIER', 'low')
+
     # Flask
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
     FLASK_ENV = os.getenv('FLASK_ENV', 'development')
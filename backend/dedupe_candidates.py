@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Dedupe Script
+Merges candidates sharing a GitHub, X or LinkedIn handle in databases created
+before identity deduplication, then creates the unique identity indexes
+"""
+
+import argparse
+import json
+import sys
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+from services.database import get_database
+from services.dedupe import Deduplicator
+
+
+def dedupe_candidates(dry_run: bool = False) -> dict:
+    """Merge duplicate candidates and print progress per group."""
+
+    db = get_database()
+    db.init_schema()
+
+    def progress(report: dict):
+        print(f"🔗 {report['merged']}/{report['groups']} groups merged, {report['removed']} duplicates removed")
+
+    report = Deduplicator(db).run(dry_run=dry_run, on_group=progress)
+    if not report['columns']:
+        print("✅ Unique identity indexes already exist, nothing to merge")
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Merge candidates that share a GitHub, X or LinkedIn handle")
+    parser.add_argument('--dry-run', action='store_true', help="Report duplicate groups without merging")
+    args = parser.parse_args()
+
+    report = dedupe_candidates(args.dry_run)
+    print(json.dumps(report, indent=2))
+    sys.exit(0 if report['failed'] == 0 else 1)
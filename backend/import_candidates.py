@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Bulk Import Script
+Loads candidates from an NDJSON file (one Candidate JSON object per line)
+"""
+
+import argparse
+import json
+import sys
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+from services.database import get_database
+from services.bulk_import import BulkImporter
+
+
+def import_candidates(path: str, batch_size: int) -> dict:
+    """Import an NDJSON file ('-' for stdin) and print progress per batch."""
+
+    db = get_database()
+    db.init_schema()
+    importer = BulkImporter(db, batch_size=batch_size)
+
+    def progress(report: dict):
+        print(f"📥 {report['rows']} rows read, {report['imported']} imported "
+              f"({report['rows_per_sec']} rows/sec)")
+
+    if path == '-':
+        return importer.import_lines(sys.stdin, on_batch=progress)
+
+    with open(path, 'rb') as lines:
+        return importer.import_lines(lines, on_batch=progress)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk-import candidates from NDJSON")
+    parser.add_argument('path', help="NDJSON file, or '-' for stdin")
+    parser.add_argument('--batch-size', type=int, default=5000, help="Candidates per COPY batch")
+    args = parser.parse_args()
+
+    report = import_candidates(args.path, args.batch_size)
+    print(json.dumps(report, indent=2))
+    sys.exit(0 if report['failed'] == 0 else 1)
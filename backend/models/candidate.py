@@ -1,13 +1,195 @@
+import re
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Tuple, TypedDict
 from datetime import datetime
-from sqlalchemy import Column, String, Float, DateTime, JSON, Integer
+from sqlalchemy import (
+    Column, String, Text, Float, DateTime, JSON, Integer, Boolean, ForeignKey, Index, DDL, event, func, literal_column
+)
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 import uuid
 
 Base = declarative_base()
 
+# CandidateScore fields, each stored as its own FLOAT column on candidates
+SCORE_COLUMNS = (
+    'total_score', 'faang_score', 'frontier_labs_score', 'top_tech_score',
+    'github_score', 'x_engagement_score', 'research_score', 'education_score',
+    'experience_score', 'open_source_score', 'leadership_score'
+)
+
+
+# Candidate fields that build_search_document() reads
+SEARCH_DOCUMENT_FIELDS = (
+    'name', 'current_title', 'current_company', 'experiences', 'bio', 'notes', 'github_profile'
+)
+
+
+def build_search_document(row: Dict[str, Any]) -> str:
+    """
+    Build the lowercased text that the candidate search index covers.
+
+    Args:
+        row: Candidate in storage form (nested profiles as plain dicts)
+
+    Returns:
+        Name, current role, past employers and titles, bio, notes and
+        GitHub languages joined into one string
+    """
+    parts = [row.get('name'), row.get('current_title'), row.get('current_company')]
+
+    for exp in row.get('experiences') or []:
+        parts.extend([exp.get('company'), exp.get('title')])
+
+    parts.extend([row.get('bio'), row.get('notes')])
+
+    github = row.get('github_profile') or {}
+    parts.extend(github.get('top_languages') or [])
+
+    return ' '.join(part for part in parts if part).lower()
+
+IDENTITY_COLUMNS = ('github_username', 'x_username', 'linkedin_slug')
+
+# Candidate field each identity column is derived from
+IDENTITY_SOURCES = {
+    'github_profile': 'github_username',
+    'x_profile': 'x_username',
+    'linkedin_url': 'linkedin_slug'
+}
+
+_LINKEDIN_SLUG = re.compile(r'linkedin\.com/in/([^/?#\s]+)', re.IGNORECASE)
+
+
+def normalize_handle(handle: Optional[str]) -> Optional[str]:
+    """Normalize a social handle for identity matching ('@Foo ' -> 'foo')."""
+    if not handle:
+        return None
+    handle = handle.strip().lstrip('@').lower()
+    return handle or None
+
+
+def linkedin_slug(url: Optional[str]) -> Optional[str]:
+    """Extract the normalized profile slug from a LinkedIn URL."""
+    if not url:
+        return None
+    match = _LINKEDIN_SLUG.search(url)
+    return normalize_handle(match.group(1)) if match else None
+
+
+def identity_keys(row: Dict[str, Any]) -> Dict[str, Optional[str]]:
+    """
+    Compute the natural-key columns of a candidate.
+
+    Args:
+        row: Candidate in storage form (nested profiles as plain dicts)
+
+    Returns:
+        Normalized github_username, x_username and linkedin_slug (None when absent)
+    """
+    return {
+        'github_username': normalize_handle((row.get('github_profile') or {}).get('username')),
+        'x_username': normalize_handle((row.get('x_profile') or {}).get('username')),
+        'linkedin_slug': linkedin_slug(row.get('linkedin_url'))
+    }
+
+
+def candidate_identity_keys(candidate: 'Candidate') -> Dict[str, Optional[str]]:
+    """identity_keys() of a Candidate model."""
+    return {
+        'github_username': normalize_handle(candidate.github_profile.username if candidate.github_profile else None),
+        'x_username': normalize_handle(candidate.x_profile.username if candidate.x_profile else None),
+        'linkedin_slug': linkedin_slug(candidate.linkedin_url)
+    }
+
+
+def conflicting_identity(a: Dict[str, Optional[str]], b: Dict[str, Optional[str]]) -> Optional[str]:
+    """
+    First identity column where two identity_keys() dicts hold different handles.
+
+    Candidates sharing one handle but holding different handles in another
+    column are two people (e.g. two GitHub users naming the same X account),
+    not one to merge.
+    """
+    return next((column for column in IDENTITY_COLUMNS if a[column] and b[column] and a[column] != b[column]), None)
+
+
+_COMPANY_SUFFIXES = re.compile(
+    r'(\s+(inc|llc|ltd|limited|corp|corporation|co|company|gmbh|plc|pbc|ag|sa))+$'
+)
+_NON_WORD = re.compile(r'[^\w\s]+')
+
+
+def normalize_org(name: Optional[str]) -> Optional[str]:
+    """
+    Normalize a company or institution name into a join key.
+
+    Lowercases, drops punctuation and trailing legal suffixes, and collapses
+    whitespace: 'OpenAI, Inc.' -> 'openai', 'Google LLC' -> 'google'.
+    """
+    if not name:
+        return None
+    key = ' '.join(_NON_WORD.sub(' ', name.lower()).split())
+    key = _COMPANY_SUFFIXES.sub('', key)
+    return key or None
+
+
+def build_history_rows(
+    candidate_id: str,
+    experiences: List[Dict[str, Any]],
+    education: List[Dict[str, Any]],
+    classify_company: Callable[[str], Dict[str, bool]],
+    is_top_university: Callable[[str], bool]
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Build the candidate_experiences and candidate_education rows of a candidate.
+
+    Args:
+        candidate_id: Owning candidate
+        experiences, education: Entries in storage form (plain dicts)
+        classify_company: Company -> {'is_faang', 'is_frontier_lab', 'is_top_tech'}
+        is_top_university: Institution -> flag
+
+    Returns:
+        (experience rows, education rows)
+    """
+    experience_rows = [
+        {
+            'candidate_id': candidate_id,
+            'position': position,
+            'company': exp.get('company') or '',
+            'company_key': normalize_org(exp.get('company')),
+            'title': exp.get('title'),
+            'duration_months': exp.get('duration_months') or 0,
+            **classify_company(exp.get('company'))
+        }
+        for position, exp in enumerate(experiences or [])
+    ]
+    education_rows = [
+        {
+            'candidate_id': candidate_id,
+            'position': position,
+            'institution': edu.get('institution') or '',
+            'institution_key': normalize_org(edu.get('institution')),
+            'degree': edu.get('degree'),
+            'field': edu.get('field'),
+            'end_year': edu.get('end_year'),
+            'is_top_university': is_top_university(edu.get('institution'))
+        }
+        for position, edu in enumerate(education or [])
+    ]
+    return experience_rows, education_rows
+
+
+def github_languages_expression(github_profile):
+    """
+    Lowercased github_profile top_languages as a JSONB array (PostgreSQL).
+
+    Shared by idx_candidates_github_languages and the ``language`` filter so
+    the planner can match the index expression.
+    """
+    return func.lower(github_profile['top_languages'].as_string()).cast(JSONB)
+
+
 class CandidateModel(Base):
     """SQLAlchemy model for candidates table."""
     __tablename__ = 'candidates'
@@ -16,14 +198,16 @@ class CandidateModel(Base):
     name = Column(String, nullable=False)
     email = Column(String, nullable=True)
     
-    # Social profiles (stored as JSON)
+    # Social profiles (stored as JSON; github_profile is JSONB on PostgreSQL for its indexes)
     x_profile = Column(JSON, nullable=True)
-    github_profile = Column(JSON, nullable=True)
+    github_profile = Column(JSON().with_variant(JSONB(), 'postgresql'), nullable=True)
     linkedin_url = Column(String, nullable=True)
     
     # Professional info
     current_title = Column(String, nullable=True)
     current_company = Column(String, nullable=True)
+    current_company_key = Column(String, nullable=True)  # normalize_org(current_company)
+    bio = Column(String, nullable=True)
     experiences = Column(JSON, default=list)
     total_years_experience = Column(Float, default=0.0)
     
@@ -33,8 +217,18 @@ class CandidateModel(Base):
     # Research
     publications = Column(JSON, default=list)
     
-    # Scoring
-    score = Column(JSON, default=dict)
+    # Scoring (one typed column per CandidateScore field)
+    total_score = Column(Float, nullable=False, default=0.0)
+    faang_score = Column(Float, nullable=False, default=0.0)
+    frontier_labs_score = Column(Float, nullable=False, default=0.0)
+    top_tech_score = Column(Float, nullable=False, default=0.0)
+    github_score = Column(Float, nullable=False, default=0.0)
+    x_engagement_score = Column(Float, nullable=False, default=0.0)
+    research_score = Column(Float, nullable=False, default=0.0)
+    education_score = Column(Float, nullable=False, default=0.0)
+    experience_score = Column(Float, nullable=False, default=0.0)
+    open_source_score = Column(Float, nullable=False, default=0.0)
+    leadership_score = Column(Float, nullable=False, default=0.0)
     priority_tier = Column(String, default='low')
     
     # Metadata
@@ -43,6 +237,64 @@ class CandidateModel(Base):
     last_updated = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     notes = Column(String, nullable=True)
 
+    # Normalized natural keys used to recognize rediscovered people, see identity_keys()
+    github_username = Column(String, nullable=True)
+    x_username = Column(String, nullable=True)
+    linkedin_slug = Column(String, nullable=True)
+
+    # Denormalized text for the `q` search, see build_search_document()
+    search_document = Column(Text, nullable=True)
+
+    __table_args__ = (
+        # Ranked listing: ORDER BY total_score DESC, id DESC
+        Index('idx_candidates_total_score', total_score.desc(), id.desc()),
+        # Tier-filtered ranked listing
+        Index('idx_candidates_tier_total_score', priority_tier, total_score.desc(), id.desc()),
+        # Change feed: WHERE (last_updated, id) > token ORDER BY last_updated, id
+        Index('idx_candidates_last_updated', last_updated, id),
+        # Company filter on the current employer
+        Index('idx_candidates_current_company_key', current_company_key),
+        # One candidate per handle
+        Index(
+            'uq_candidates_github_username', github_username, unique=True,
+            postgresql_where=github_username.isnot(None), sqlite_where=github_username.isnot(None)
+        ),
+        Index(
+            'uq_candidates_x_username', x_username, unique=True,
+            postgresql_where=x_username.isnot(None), sqlite_where=x_username.isnot(None)
+        ),
+        Index(
+            'uq_candidates_linkedin_slug', linkedin_slug, unique=True,
+            postgresql_where=linkedin_slug.isnot(None), sqlite_where=linkedin_slug.isnot(None)
+        ),
+        # GitHub filters: stars / followers as integer expression indexes
+        Index('idx_candidates_github_stars', github_profile['total_stars'].as_integer()),
+        Index('idx_candidates_github_followers', github_profile['followers'].as_integer()),
+        # Language filter: GIN over the lowercased top_languages array (PostgreSQL only)
+        Index(
+            'idx_candidates_github_languages',
+            github_languages_expression(github_profile),
+            postgresql_using='gin'
+        ).ddl_if(dialect='postgresql'),
+        # Full-text search (PostgreSQL only)
+        Index(
+            'idx_candidates_search_fts',
+            func.to_tsvector(literal_column("'simple'"), search_document),
+            postgresql_using='gin'
+        ).ddl_if(dialect='postgresql'),
+        # Substring / fuzzy search via pg_trgm (PostgreSQL only)
+        Index(
+            'idx_candidates_search_trgm',
+            search_document,
+            postgresql_using='gin',
+            postgresql_ops={'search_document': 'gin_trgm_ops'}
+        ).ddl_if(dialect='postgresql'),
+    )
+
+    def score_dict(self) -> Dict[str, float]:
+        """Return the score columns as a CandidateScore-shaped dictionary."""
+        return {column: getattr(self, column) or 0.0 for column in SCORE_COLUMNS}
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -53,11 +305,12 @@ class CandidateModel(Base):
             'linkedin_url': self.linkedin_url,
             'current_title': self.current_title,
             'current_company': self.current_company,
+            'bio': self.bio,
             'experiences': self.experiences,
             'total_years_experience': self.total_years_experience,
             'education': self.education,
             'publications': self.publications,
-            'score': self.score,
+            'score': self.score_dict(),
             'priority_tier': self.priority_tier,
             'discovered_from': self.discovered_from,
             'discovery_date': self.discovery_date.isoformat() if self.discovery_date else None,
@@ -65,6 +318,91 @@ class CandidateModel(Base):
             'notes': self.notes
         }
 
+
+class ExperienceModel(Base):
+    """
+    One row per work experience, mirrored from candidates.experiences.
+
+    Lets company-history filters run as indexed lookups instead of scans
+    over the JSON blob.
+    """
+    __tablename__ = 'candidate_experiences'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    candidate_id = Column(String, ForeignKey('candidates.id', ondelete='CASCADE'), nullable=False)
+    position = Column(Integer, nullable=False)  # index into candidates.experiences
+    company = Column(String, nullable=False)
+    company_key = Column(String, nullable=True)  # normalize_org(company)
+    title = Column(String, nullable=True)
+    duration_months = Column(Integer, nullable=False, default=0)
+    is_faang = Column(Boolean, nullable=False, default=False)
+    is_frontier_lab = Column(Boolean, nullable=False, default=False)
+    is_top_tech = Column(Boolean, nullable=False, default=False)
+
+    __table_args__ = (
+        Index('idx_experiences_candidate', candidate_id),
+        # "Worked at X (for at least N months)": covering (key, candidate, months)
+        Index('idx_experiences_company', company_key, candidate_id, duration_months),
+        # Background filters, each a partial index over the matching rows only
+        Index(
+            'idx_experiences_faang', candidate_id, duration_months,
+            postgresql_where=is_faang.is_(True), sqlite_where=is_faang.is_(True)
+        ),
+        Index(
+            'idx_experiences_frontier_lab', candidate_id, duration_months,
+            postgresql_where=is_frontier_lab.is_(True), sqlite_where=is_frontier_lab.is_(True)
+        ),
+        Index(
+            'idx_experiences_top_tech', candidate_id, duration_months,
+            postgresql_where=is_top_tech.is_(True), sqlite_where=is_top_tech.is_(True)
+        ),
+    )
+
+
+class EducationModel(Base):
+    """One row per education entry, mirrored from candidates.education."""
+    __tablename__ = 'candidate_education'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    candidate_id = Column(String, ForeignKey('candidates.id', ondelete='CASCADE'), nullable=False)
+    position = Column(Integer, nullable=False)  # index into candidates.education
+    institution = Column(String, nullable=False)
+    institution_key = Column(String, nullable=True)  # normalize_org(institution)
+    degree = Column(String, nullable=True)
+    field = Column(String, nullable=True)
+    end_year = Column(Integer, nullable=True)
+    is_top_university = Column(Boolean, nullable=False, default=False)
+
+    __table_args__ = (
+        Index('idx_education_candidate', candidate_id),
+        Index('idx_education_institution', institution_key, candidate_id),
+        Index(
+            'idx_education_top_university', candidate_id,
+            postgresql_where=is_top_university.is_(True), sqlite_where=is_top_university.is_(True)
+        ),
+    )
+
+
+class CandidateTombstoneModel(Base):
+    """Deleted candidate ids, kept so the change feed can report deletes."""
+    __tablename__ = 'candidate_tombstones'
+
+    id = Column(String, primary_key=True)
+    deleted_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index('idx_candidate_tombstones_deleted_at', deleted_at, id),
+    )
+
+
+# gin_trgm_ops needs the pg_trgm extension before the index is created
+event.listen(
+    Base.metadata,
+    'before_create',
+    DDL('CREATE EXTENSION IF NOT EXISTS pg_trgm').execute_if(dialect='postgresql')
+)
+
+
 class SocialProfile(BaseModel):
     """Social media profile information."""
     platform: str
@@ -82,9 +420,16 @@ class Experience(BaseModel):
     end_date: Optional[str] = None
     duration_months: Optional[int] = 0
     description: Optional[str] = None
+    # Derived at ingest by ScoringService.classify_history(); scoring trusts
+    # stored ones while classification_key matches the current lists
+    # (values sent by API clients or imports are always recomputed)
     is_faang: bool = False
     is_frontier_lab: bool = False
     is_top_tech: bool = False
+    is_senior: bool = False
+    is_research: bool = False
+    leadership_points: Optional[int] = None  # None: not a leadership title
+    classification_key: Optional[str] = None
 
 
 class Education(BaseModel):
@@ -94,7 +439,8 @@ class Education(BaseModel):
     field: Optional[str] = None
     start_year: Optional[int] = None
     end_year: Optional[int] = None
-    is_top_university: bool = False
+    is_top_university: bool = False  # see Experience
+    classification_key: Optional[str] = None
 
 
 class GitHubStats(BaseModel):
@@ -148,6 +494,7 @@ class Candidate(BaseModel):
     # Professional information
     current_title: Optional[str] = None
     current_company: Optional[str] = None
+    bio: Optional[str] = None
     experiences: List[Experience] = []
     total_years_experience: float = 0.0
 
@@ -171,3 +518,25 @@ class Candidate(BaseModel):
         json_encoders = {
             datetime: lambda v: v.isoformat()
         }
+
+
+class ExperienceHighlight(TypedDict):
+    """Company and background flags of one experience, for list cards."""
+    company: str
+    is_faang: bool
+    is_frontier_lab: bool
+    is_top_tech: bool
+
+
+class CandidateSummary(TypedDict):
+    """Lightweight list projection of a candidate, built straight from selected columns."""
+    id: str
+    name: str
+    current_title: Optional[str]
+    current_company: Optional[str]
+    priority_tier: str
+    total_score: float
+    github_username: Optional[str]
+    x_username: Optional[str]
+    avatar_url: Optional[str]
+    top_experiences: List[ExperienceHighlight]  # first SUMMARY_EXPERIENCES entries
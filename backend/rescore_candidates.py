@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Rescore Script
+Recomputes every stored score after SCORING_WEIGHTS or the company lists change
+"""
+
+import argparse
+import json
+import os
+import sys
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+from services.database import get_database
+from services.rescore import Rescorer
+
+
+def rescore_candidates(batch_size: int, after: str = None, limit: int = None, checkpoint: str = None) -> dict:
+    """Rescore the pool and print progress per batch, saving the resume point to ``checkpoint``."""
+
+    if checkpoint and not after and os.path.exists(checkpoint):
+        with open(checkpoint) as f:
+            after = f.read().strip() or None
+        print(f"⏩ Resuming after candidate {after}")
+
+    db = get_database()
+    db.init_schema()
+    rescorer = Rescorer(db, batch_size=batch_size)
+
+    def progress(report: dict):
+        print(f"🔁 {report['rows']} rows rescored, {report['changed']} changed "
+              f"({report['rows_per_sec']} rows/sec)")
+        if checkpoint:
+            with open(checkpoint, 'w') as f:
+                f.write(report['last_id'])
+
+    report = rescorer.run(after=after, limit=limit, on_batch=progress)
+    if checkpoint and report['done'] and os.path.exists(checkpoint):
+        os.remove(checkpoint)
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recompute stored candidate scores")
+    parser.add_argument('--batch-size', type=int, default=2000, help="Candidates scored per batch")
+    parser.add_argument('--after', help="Resume after this candidate id")
+    parser.add_argument('--limit', type=int, help="Stop after this many candidates")
+    parser.add_argument('--checkpoint', default='.rescore_checkpoint',
+                        help="File holding the resume point between runs ('' to disable)")
+    args = parser.parse_args()
+
+    report = rescore_candidates(args.batch_size, args.after, args.limit, args.checkpoint or None)
+    print(json.dumps(report, indent=2))
+    sys.exit(0 if report['failed'] == 0 else 1)
@@ -1,18 +1,27 @@
-from flask import Blueprint, request, jsonify
-from services.database import Database
+import csv
+import io
+import json
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from services.database import get_database, PRIORITY_TIERS
 from services.x_analyzer import XAnalyzer
 from services.github_analyzer import GitHubAnalyzer
 from services.linkedin_scraper import LinkedInScraper
 from services.scoring_service import ScoringService
 from services.grok_client import GrokClient
 from services.profile_enrichment import ProfileEnrichment
-from models.candidate import Candidate, Experience, Education, GitHubStats, SocialProfile
-from typing import Dict
+from services.bulk_import import BulkImporter
+from services.rescore import Rescorer
+from models.candidate import (
+    Candidate, Experience, Education, GitHubStats, SocialProfile, SCORE_COLUMNS, IDENTITY_SOURCES,
+    candidate_identity_keys, conflicting_identity
+)
+from typing import Dict, Iterator, List, Optional
+from config import Config
 
 candidates_bp = Blueprint('candidates', __name__, url_prefix='/api/candidates')
 
 # Initialize services
-db = Database()
+db = get_database()
 x_analyzer = XAnalyzer()
 github_analyzer = GitHubAnalyzer()
 linkedin_scraper = LinkedInScraper()
@@ -20,31 +29,122 @@ scoring_service = ScoringService()
 grok_client = GrokClient()
 profile_enrichment = ProfileEnrichment()
 
+# Flat columns of the CSV export; nested profiles are written as JSON strings
+EXPORT_CSV_COLUMNS = [
+    'id', 'name', 'email', 'linkedin_url', 'current_title', 'current_company', 'bio',
+    'total_years_experience', 'priority_tier', *SCORE_COLUMNS,
+    'x_profile', 'github_profile', 'experiences', 'education', 'publications',
+    'discovered_from', 'discovery_date', 'last_updated', 'notes'
+]
+
+# Largest list accepted by the bulk PATCH endpoint
+MAX_PATCH_BATCH = 1000
+
 
 @candidates_bp.route('/', methods=['GET'])
 def get_all_candidates():
-    """Get all candidates with optional filtering."""
+    """List candidate summaries with optional filtering (full profiles via /<candidate_id>)."""
     try:
         priority_tier = request.args.get('tier')
         min_score = request.args.get('min_score', type=float)
         company = request.args.get('company')
         limit = request.args.get('limit', 50, type=int)
         offset = request.args.get('offset', 0, type=int)
+        cursor = request.args.get('cursor')
 
-        candidates = db.search_candidates(
+        candidates = db.search_candidate_summaries(
             priority_tier=priority_tier,
             min_score=min_score,
             company=company,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor,
+            min_months=request.args.get('min_months', type=int),
+            background=request.args.get('background'),
+            school=request.args.get('school'),
+            language=request.args.get('language') or request.args.get('skill'),
+            min_stars=request.args.get('min_stars', type=int),
+            min_followers=request.args.get('min_followers', type=int)
         )
 
         return jsonify({
             'success': True,
             'count': len(candidates),
-            'candidates': [c.dict() for c in candidates]
+            'candidates': candidates,
+            'next_cursor': db.next_cursor(candidates, limit)
         })
 
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@candidates_bp.route('/export', methods=['GET'])
+def export_candidates():
+    """
+    Stream every matching candidate as NDJSON or CSV.
+
+    Query params:
+    - format: ndjson (default) or csv
+    - tier, min_score, company, min_months, background, school, language,
+      skill, min_stars, min_followers, q: Same filters as /api/search/candidates
+    """
+    export_format = request.args.get('format', 'ndjson')
+    if export_format not in ('ndjson', 'csv'):
+        return jsonify({'success': False, 'error': 'format must be ndjson or csv'}), 400
+
+    try:
+        rows = db.iter_candidates(
+            priority_tier=request.args.get('tier'),
+            min_score=request.args.get('min_score', type=float),
+            company=request.args.get('company'),
+            query=request.args.get('q'),
+            min_months=request.args.get('min_months', type=int),
+            background=request.args.get('background'),
+            school=request.args.get('school'),
+            language=request.args.get('language') or request.args.get('skill'),
+            min_stars=request.args.get('min_stars', type=int),
+            min_followers=request.args.get('min_followers', type=int)
+        )
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+
+    if export_format == 'csv':
+        body, mimetype = _csv_lines(rows), 'text/csv'
+    else:
+        body, mimetype = _ndjson_lines(rows), 'application/x-ndjson'
+
+    return Response(
+        stream_with_context(body),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename=candidates.{export_format}'}
+    )
+
+
+@candidates_bp.route('/changes', methods=['GET'])
+def get_candidate_changes():
+    """
+    Incremental change feed for polling clients.
+
+    Query params:
+    - since: next_token from the previous response, or an ISO-8601 timestamp
+      (omit for a full initial sync)
+    - limit: Maximum changed and deleted rows per page (default 500, max 1000)
+
+    Keep polling with next_token; when has_more is true, call again right away.
+    """
+    try:
+        limit = min(request.args.get('limit', 500, type=int), 1000)
+        changes = db.changes_since(since=request.args.get('since'), limit=limit)
+
+        if changes is None:
+            return jsonify({'success': False, 'error': 'Failed to read changes'}), 500
+
+        return jsonify({'success': True, **changes})
+
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -103,6 +203,56 @@ def create_candidate():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@candidates_bp.route('/import', methods=['POST'])
+def import_candidates():
+    """
+    Bulk-import candidates from an NDJSON request body.
+
+    Each line is one Candidate JSON object. Candidates are rescored and
+    loaded in batches; the response reports counts and rows/sec.
+    """
+    try:
+        batch_size = request.args.get('batch_size', 5000, type=int)
+        importer = BulkImporter(db, scoring_service, batch_size=batch_size)
+        report = importer.import_lines(request.stream)
+
+        return jsonify({
+            'success': report['failed'] == 0,
+            'report': report
+        })
+
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@candidates_bp.route('/rescore', methods=['POST'])
+def rescore_candidates():
+    """
+    Admin: recompute stored scores after the scoring config changed.
+
+    Candidates are rescored in id order and only changed rows are written.
+    At most ``limit`` candidates are processed per call; while the report's
+    ``done`` is false, call again with ``after`` set to its ``last_id``.
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        batch_size = int(data.get('batch_size', 2000))
+        limit = int(data.get('limit', 50000))
+        if batch_size < 1 or limit < 1:
+            return jsonify({'success': False, 'error': 'batch_size and limit must be positive'}), 400
+
+        rescorer = Rescorer(db, scoring_service, batch_size=batch_size)
+        report = rescorer.run(after=data.get('after'), limit=limit)
+
+        return jsonify({
+            'success': report['failed'] == 0,
+            'report': report
+        })
+
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
 @candidates_bp.route('/<candidate_id>', methods=['PUT'])
 def update_candidate(candidate_id):
     """Update a candidate's information."""
@@ -120,6 +270,67 @@ def update_candidate(candidate_id):
             'message': 'Candidate updated successfully'
         })
 
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@candidates_bp.route('/<candidate_id>', methods=['PATCH'])
+def patch_candidate(candidate_id):
+    """
+    Partially update a candidate, rescoring only what the change affects.
+
+    Returns the updated summary (total_score and priority_tier included).
+    """
+    try:
+        results = db.patch_candidates([{**(request.json or {}), 'id': candidate_id}])
+
+        if results is None:
+            return jsonify({'success': False, 'error': 'Failed to update candidate'}), 500
+        if results[0] is None:
+            return jsonify({'success': False, 'error': 'Candidate not found'}), 404
+
+        return jsonify({
+            'success': True,
+            'candidate': results[0]
+        })
+
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@candidates_bp.route('/', methods=['PATCH'])
+def patch_candidates():
+    """
+    Partially update many candidates in one transaction.
+
+    Body: a JSON list of updates, each with the candidate ``id`` and the
+    fields to change (at most MAX_PATCH_BATCH per request).
+    """
+    try:
+        patches = request.json
+        if not isinstance(patches, list):
+            return jsonify({'success': False, 'error': 'Body must be a list of updates'}), 400
+        if len(patches) > MAX_PATCH_BATCH:
+            return jsonify({'success': False, 'error': f'At most {MAX_PATCH_BATCH} updates per request'}), 400
+
+        results = db.patch_candidates(patches)
+
+        if results is None:
+            return jsonify({'success': False, 'error': 'Failed to update candidates'}), 500
+
+        return jsonify({
+            'success': True,
+            'updated_count': sum(1 for result in results if result),
+            'candidates': [result for result in results if result],
+            'not_found': [patch['id'] for patch, result in zip(patches, results) if result is None]
+        })
+
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -152,7 +363,7 @@ def get_top_candidates():
         return jsonify({
             'success': True,
             'count': len(candidates),
-            'candidates': [c.dict() for c in candidates]
+            'candidates': candidates
         })
 
     except Exception as e:
@@ -161,17 +372,26 @@ def get_top_candidates():
 
 @candidates_bp.route('/discover/x', methods=['POST'])
 def discover_from_x():
-    """Discover candidates from X/Twitter posts."""
+    """
+    Discover candidates from X/Twitter posts.
+
+    Candidates whose optimistic score (see ScoringService.score_upper_bound)
+    cannot reach ``min_tier`` (default Config.DISCOVERY_MIN_TIER) are saved
+    without profile enrichment.
+    """
     try:
         data = request.json
         query = data.get('query', 'software engineer')
         min_likes = data.get('min_likes', 100)
         min_retweets = data.get('min_retweets', 20)
+        min_tier = data.get('min_tier') or Config.DISCOVERY_MIN_TIER
+        if min_tier not in PRIORITY_TIERS:
+            return jsonify({'success': False, 'error': f"min_tier must be one of: {', '.join(PRIORITY_TIERS)}"}), 400
 
         # Search for high-engagement posts
         posts = x_analyzer.search_high_engagement_posts(query, min_likes, min_retweets)
 
-        discovered_candidates = []
+        found = []
 
         for post in posts:
             # Analyze post for candidate potential
@@ -182,24 +402,41 @@ def discover_from_x():
                 user_profile = x_analyzer.get_user_profile(post.get('username'))
 
                 if user_profile:
-                    # Create candidate
-                    candidate = _create_candidate_from_x_post(post, user_profile, analysis)
-
-                    # Save to database
-                    candidate_id = db.add_candidate(candidate)
-
-                    if candidate_id:
-                        discovered_candidates.append({
-                            'id': candidate_id,
-                            'name': candidate.name,
-                            'score': candidate.score.total_score,
-                            'tier': candidate.priority_tier
-                        })
+                    found.append((post, user_profile, analysis))
+
+        # Only enrich people who could still reach min_tier
+        partial = [
+            Candidate(
+                name=post.get('name') or 'Unknown',
+                x_profile=_x_profile(post, user_profile, analysis),
+                discovered_from='x_post'
+            )
+            for post, user_profile, analysis in found
+        ]
+        stored = db.find_by_identity(partial)
+        promising = _can_reach_tier(partial, stored, min_tier)
+
+        candidates = []
+        for (post, user_profile, analysis), candidate, enrich in zip(found, partial, promising):
+            if enrich:
+                candidate = _create_candidate_from_x_post(post, user_profile, analysis)
+            else:
+                _score(candidate)
+            candidates.append(candidate)
+
+        # Save the whole batch in one transaction, merging rediscovered people
+        result = _save_discovered(candidates, stored, promising)
+        if result is None:
+            return jsonify({'success': False, 'error': 'Failed to save discovered candidates'}), 500
 
         return jsonify({
             'success': True,
-            'discovered_count': len(discovered_candidates),
-            'candidates': discovered_candidates
+            'discovered_count': len(result['candidates']),
+            'inserted': result['inserted'],
+            'updated': result['updated'],
+            'unchanged': result['unchanged'],
+            'enrichment': _enrichment_report(promising, 'x', min_tier),
+            'candidates': result['candidates']
         })
 
     except Exception as e:
@@ -208,46 +445,297 @@ def discover_from_x():
 
 @candidates_bp.route('/discover/github', methods=['POST'])
 def discover_from_github():
-    """Discover candidates from GitHub."""
+    """
+    Discover candidates from GitHub.
+
+    Candidates whose optimistic score (see ScoringService.score_upper_bound)
+    cannot reach ``min_tier`` (default Config.DISCOVERY_MIN_TIER) are saved
+    without profile enrichment.
+    """
     try:
         data = request.json
         query = data.get('query', 'machine learning')
         min_followers = data.get('min_followers', 100)
+        min_tier = data.get('min_tier') or Config.DISCOVERY_MIN_TIER
+        if min_tier not in PRIORITY_TIERS:
+            return jsonify({'success': False, 'error': f"min_tier must be one of: {', '.join(PRIORITY_TIERS)}"}), 400
 
         # Search for GitHub users
         users = github_analyzer.search_users(query, min_followers)
 
-        discovered_candidates = []
+        found = []
 
         for user in users[:20]:  # Limit to 20 to avoid rate limits
             # Get detailed stats
             stats = github_analyzer.calculate_github_stats(user['username'])
 
             if stats.get('total_stars', 0) > 50:  # Filter for quality
-                # Create candidate
+                found.append((user, stats))
+
+        # Only enrich people who could still reach min_tier
+        partial = [
+            Candidate(
+                name=stats.get('username', 'Unknown'),
+                github_profile=GitHubStats(**stats),
+                discovered_from='github_search'
+            )
+            for _, stats in found
+        ]
+        stored = db.find_by_identity(partial)
+        promising = _can_reach_tier(partial, stored, min_tier)
+
+        candidates = []
+        for (user, stats), candidate, enrich in zip(found, partial, promising):
+            if enrich:
                 candidate = _create_candidate_from_github(user, stats)
+            else:
+                _score(candidate)
+            candidates.append(candidate)
 
-                # Save to database
-                candidate_id = db.add_candidate(candidate)
-
-                if candidate_id:
-                    discovered_candidates.append({
-                        'id': candidate_id,
-                        'name': candidate.name,
-                        'score': candidate.score.total_score,
-                        'tier': candidate.priority_tier
-                    })
+        # Save the whole batch in one transaction, merging rediscovered people
+        result = _save_discovered(candidates, stored, promising)
+        if result is None:
+            return jsonify({'success': False, 'error': 'Failed to save discovered candidates'}), 500
 
         return jsonify({
             'success': True,
-            'discovered_count': len(discovered_candidates),
-            'candidates': discovered_candidates
+            'discovered_count': len(result['candidates']),
+            'inserted': result['inserted'],
+            'updated': result['updated'],
+            'unchanged': result['unchanged'],
+            'enrichment': _enrichment_report(promising, 'github', min_tier),
+            'candidates': result['candidates']
         })
 
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+def _ndjson_lines(rows: Iterator[Dict]) -> Iterator[str]:
+    """Helper function to serialize candidate rows as newline-delimited JSON."""
+    for row in rows:
+        yield json.dumps(row, default=str) + '\n'
+
+
+def _csv_lines(rows: Iterator[Dict]) -> Iterator[str]:
+    """Helper function to serialize candidate rows as CSV, one line at a time."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush() -> str:
+        line = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return line
+
+    writer.writerow(EXPORT_CSV_COLUMNS)
+    yield flush()
+
+    for row in rows:
+        row.update(row.pop('score') or {})
+        writer.writerow([
+            json.dumps(row[column]) if isinstance(row.get(column), (dict, list)) else row.get(column)
+            for column in EXPORT_CSV_COLUMNS
+        ])
+        yield flush()
+
+
+def _save_discovered(
+    candidates: List[Candidate],
+    matches: List[Optional[Candidate]],
+    enriched: List[bool]
+) -> Optional[Dict]:
+    """
+    Helper function to save discovered candidates, merging people we already have.
+
+    Candidates matching a stored GitHub, X or LinkedIn identity (or an earlier
+    candidate of the same batch) are merged and rescored instead of inserted
+    again; merges that change nothing are not written at all. A match holding
+    a different handle in the same identity column is another person (see
+    _different_person). A handle that already belongs to someone else (e.g.
+    the GitHub account matched one stored candidate and the X account
+    another) is not merged in.
+
+    Args:
+        candidates: Discovered candidates
+        matches: Stored match of each candidate's discovery data, as looked
+            up for _can_reach_tier()
+        enriched: Whether each candidate was enriched; a candidate that was
+            not only carries its discovery profile, so the stored values of
+            every other field are kept
+
+    Returns:
+        Saved candidates and inserted/updated/unchanged counts, or None if
+        the write failed
+    """
+    owners = db.identity_owners(candidate_identity_keys(candidate) for candidate in candidates)
+    if owners is None:
+        return None
+
+    # Enrichment can turn up handles of a stored candidate the discovery data did not match
+    existing = list(matches)
+    rematch = [
+        index for index, candidate in enumerate(candidates)
+        if existing[index] is None and any(key in owners for key in candidate_identity_keys(candidate).items())
+    ]
+    if rematch:
+        for index, match in zip(rematch, db.find_by_identity([candidates[index] for index in rematch])):
+            existing[index] = match
+
+    pending = []      # (candidate, status) in write order
+    by_handle = {}    # identity key -> index into pending
+    unchanged = []
+
+    for candidate, stored, fetched_all in zip(candidates, existing, enriched):
+        candidate_keys = candidate_identity_keys(candidate)
+        keys = [key for key in candidate_keys.items() if key[1]]
+        previous = next((by_handle[key] for key in keys if key in by_handle), None)
+        if previous is not None and _different_person(pending[previous][0], candidate_keys):
+            previous = None
+        if stored is not None and _different_person(stored, candidate_keys):
+            stored = None
+
+        if previous is not None:
+            # Same person twice in one batch: fold into the earlier entry
+            target, status = pending[previous]
+            index = previous
+        elif stored is not None:
+            target, status, index = stored, 'updated', len(pending)
+        else:
+            target, status, index = None, 'inserted', len(pending)
+
+        fields = None if fetched_all else ProfileEnrichment.ENRICHED_FIELDS
+        merged = profile_enrichment.merge_profiles(target, candidate, fields) if target else candidate
+        _drop_foreign_handles(merged, target, index, owners, by_handle)
+        _score(merged)
+
+        if index < len(pending):
+            pending[index] = (merged, status)
+        elif stored is not None and _same_profile(merged, stored):
+            unchanged.append(stored)
+            continue
+        else:
+            pending.append((merged, status))
+
+        for key in candidate_identity_keys(merged).items():
+            if key[1]:
+                by_handle[key] = index
+
+    to_write = [candidate for candidate, _ in pending]
+    candidate_ids = db.upsert_candidates(to_write)
+    if to_write and not any(candidate_ids):
+        return None
+
+    saved = [
+        {
+            'id': candidate_id,
+            'name': candidate.name,
+            'score': candidate.score.total_score,
+            'tier': candidate.priority_tier,
+            'status': status
+        }
+        for (candidate, status), candidate_id in zip(pending, candidate_ids)
+        if candidate_id
+    ]
+    saved.extend(
+        {
+            'id': candidate.id,
+            'name': candidate.name,
+            'score': candidate.score.total_score,
+            'tier': candidate.priority_tier,
+            'status': 'unchanged'
+        }
+        for candidate in unchanged
+    )
+
+    return {
+        'candidates': saved,
+        'inserted': sum(1 for c in saved if c['status'] == 'inserted'),
+        'updated': sum(1 for c in saved if c['status'] == 'updated'),
+        'unchanged': len(unchanged)
+    }
+
+
+def _score(candidate: Candidate) -> None:
+    """Helper function to (re)score a candidate in place."""
+    candidate.score = scoring_service.score_candidate(candidate)
+    candidate.priority_tier = scoring_service.determine_priority_tier(candidate.score)
+
+
+def _can_reach_tier(candidates: List[Candidate], stored: List[Optional[Candidate]], min_tier: str) -> List[bool]:
+    """
+    Helper function to decide which discovered candidates are worth enriching.
+
+    What we already know about a person (the partial discovery data merged
+    into their stored profile ``stored``, if any) is scored optimistically:
+    whatever enrichment could still fill in counts at its maximum.
+    """
+    promising = []
+    for candidate, existing in zip(candidates, stored):
+        fields = ProfileEnrichment.ENRICHED_FIELDS
+        known = profile_enrichment.merge_profiles(existing, candidate, fields) if existing else candidate
+        pending = [field for field in ProfileEnrichment.ENRICHED_FIELDS if getattr(known, field) is None]
+        promising.append(scoring_service.can_reach_tier(known, min_tier, pending))
+    return promising
+
+
+def _enrichment_report(promising: List[bool], source: str, min_tier: str) -> Dict:
+    """Helper function to summarize enrichment pruning for a discovery response."""
+    skipped = promising.count(False)
+    return {
+        'min_tier': min_tier,
+        'enriched': len(promising) - skipped,
+        'skipped': skipped,
+        # Lower bound: optional lookups (linked profiles, Grok insights) are not counted
+        'upstream_calls_saved': skipped * ProfileEnrichment.MIN_UPSTREAM_CALLS[source]
+    }
+
+
+def _different_person(known: Candidate, keys: Dict[str, Optional[str]]) -> bool:
+    """
+    Helper function to tell apart people who share one handle but not another.
+
+    E.g. two GitHub users whose profiles name the same X account are kept
+    apart instead of merged.
+    """
+    column = conflicting_identity(candidate_identity_keys(known), keys)
+    if column:
+        print(f"Warning: discovered candidate shares a handle with {known.name} but not the {column}, keeping both")
+    return column is not None
+
+
+def _drop_foreign_handles(
+    merged: Candidate,
+    target: Optional[Candidate],
+    index: int,
+    owners: Dict,
+    by_handle: Dict
+) -> None:
+    """
+    Helper function to keep handles owned by other people out of a merged candidate.
+
+    A handle stored on another candidate, or claimed by another entry of the
+    batch, would violate its unique identity index and roll back the whole
+    batch. The field falls back to the merge target's value instead.
+    """
+    for field, column in IDENTITY_SOURCES.items():
+        handle = candidate_identity_keys(merged)[column]
+        if not handle:
+            continue
+        owner = owners.get((column, handle))
+        claim = by_handle.get((column, handle))
+        if (owner is None or owner == merged.id) and (claim is None or claim == index):
+            continue
+        print(f"Warning: {column} {handle} belongs to another candidate, not merging it into {merged.name}")
+        setattr(merged, field, getattr(target, field) if target else None)
+
+
+def _same_profile(a: Candidate, b: Candidate) -> bool:
+    """Helper function to compare two candidates ignoring timestamps."""
+    exclude = {'discovery_date', 'last_updated'}
+    return a.dict(exclude=exclude) == b.dict(exclude=exclude)
+
+
 def _create_candidate_from_x_post(post: Dict, user_profile: Dict, analysis: Dict) -> Candidate:
     """Helper function to create a Candidate from X/Twitter data with profile enrichment."""
 
@@ -260,18 +748,13 @@ def _create_candidate_from_x_post(post: Dict, user_profile: Dict, analysis: Dict
         email=enriched_profile.get('email'),
         current_title=enriched_profile.get('current_title'),
         current_company=enriched_profile.get('current_company'),
+        bio=enriched_profile.get('bio'),
         linkedin_url=enriched_profile.get('linkedin_url'),
         discovered_from='x_post'
     )
 
     # Add X profile
-    candidate.x_profile = SocialProfile(
-        platform='X/Twitter',
-        username=x_username,
-        url=f"https://x.com/{x_username}",
-        followers=user_profile.get('followers', 0),
-        engagement_score=analysis.get('engagement_score', 0)
-    )
+    candidate.x_profile = _x_profile(post, user_profile, analysis)
 
     # Add GitHub profile if found
     if enriched_profile.get('github_profile'):
@@ -284,6 +767,18 @@ def _create_candidate_from_x_post(post: Dict, user_profile: Dict, analysis: Dict
     return candidate
 
 
+def _x_profile(post: Dict, user_profile: Dict, analysis: Dict) -> SocialProfile:
+    """Helper function to build the X profile of a discovered post author."""
+    x_username = post.get('username', '')
+    return SocialProfile(
+        platform='X/Twitter',
+        username=x_username,
+        url=f"https://x.com/{x_username}",
+        followers=user_profile.get('followers', 0),
+        engagement_score=analysis.get('engagement_score', 0)
+    )
+
+
 def _create_candidate_from_github(user: Dict, stats: Dict) -> Candidate:
     """Helper function to create a Candidate from GitHub data with profile enrichment."""
 
@@ -295,6 +790,7 @@ def _create_candidate_from_github(user: Dict, stats: Dict) -> Candidate:
         email=enriched_profile.get('email'),
         current_title=enriched_profile.get('current_title'),
         current_company=enriched_profile.get('current_company'),
+        bio=enriched_profile.get('bio'),
         linkedin_url=enriched_profile.get('linkedin_url'),
         discovered_from='github_search'
     )
@@ -1,53 +1,67 @@
 from flask import Blueprint, request, jsonify
-from services.database import Database
+from services.database import get_database
 from services.grok_client import GrokClient
 
 search_bp = Blueprint('search', __name__, url_prefix='/api/search')
 
-db = Database()
+db = get_database()
 grok_client = GrokClient()
 
 
 @search_bp.route('/candidates', methods=['GET'])
 def search_candidates():
     """
-    Search candidates with various filters.
+    Search candidates with various filters, returning list summaries.
 
     Query params:
-    - q: General search query
+    - q: General search query (name, role, past employers, bio, skills)
     - tier: Priority tier (top, high, medium, low)
     - min_score: Minimum total score
     - company: Company name (current or past)
-    - skill: Technical skill
+    - min_months: Minimum total months at `company` (or in `background`)
+    - background: Ever worked at a faang, frontier_lab or top_tech company
+    - school: Institution attended
+    - language: GitHub top language (case-insensitive)
+    - skill: Technical skill (alias of language)
+    - min_stars: Minimum total GitHub stars
+    - min_followers: Minimum GitHub followers
     - limit: Results limit (default 50)
     - offset: Pagination offset (default 0)
+    - cursor: Opaque token from a previous response's next_cursor (replaces offset)
     """
     try:
         query = request.args.get('q')
         tier = request.args.get('tier')
         min_score = request.args.get('min_score', type=float)
         company = request.args.get('company')
+        min_months = request.args.get('min_months', type=int)
+        background = request.args.get('background')
+        school = request.args.get('school')
+        language = request.args.get('language') or request.args.get('skill')
+        min_stars = request.args.get('min_stars', type=int)
+        min_followers = request.args.get('min_followers', type=int)
         limit = request.args.get('limit', 50, type=int)
         offset = request.args.get('offset', 0, type=int)
+        cursor = request.args.get('cursor')
 
         # Use database search
-        candidates = db.search_candidates(
+        candidates = db.search_candidate_summaries(
             priority_tier=tier,
             min_score=min_score,
             company=company,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor,
+            query=query,
+            min_months=min_months,
+            background=background,
+            school=school,
+            language=language,
+            min_stars=min_stars,
+            min_followers=min_followers
         )
-
-        # If general query provided, filter results
-        if query and candidates:
-            query_lower = query.lower()
-            candidates = [
-                c for c in candidates
-                if query_lower in c.name.lower()
-                or (c.current_company and query_lower in c.current_company.lower())
-                or (c.current_title and query_lower in c.current_title.lower())
-            ]
+        # Relevance-ranked text search pages with offset only
+        next_cursor = None if query else db.next_cursor(candidates, limit)
 
         return jsonify({
             'success': True,
@@ -56,35 +70,91 @@ def search_candidates():
                 'q': query,
                 'tier': tier,
                 'min_score': min_score,
-                'company': company
+                'company': company,
+                'min_months': min_months,
+                'background': background,
+                'school': school,
+                'language': language,
+                'min_stars': min_stars,
+                'min_followers': min_followers
             },
-            'results': [c.dict() for c in candidates]
+            'results': candidates,
+            'next_cursor': next_cursor
         })
 
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@search_bp.route('/rerank', methods=['POST'])
+def rerank_candidates():
+    """
+    Rank candidates with custom scoring weights, without saving anything.
+
+    JSON body:
+    - weights: SCORING_WEIGHTS overrides, e.g. {"frontier_labs_experience": 50}
+    - limit: Results limit (default 50)
+    - tier, company, min_months, background, school, language (or skill),
+      min_stars, min_followers: Same filters as /candidates
+    - min_score: Minimum re-weighted total score
+    """
+    try:
+        data = request.get_json(silent=True) or {}
+        weights = data.get('weights') or {}
+        if not isinstance(weights, dict):
+            return jsonify({'success': False, 'error': 'weights must be an object'}), 400
+        limit = int(data.get('limit', 50))
+        if limit < 1:
+            return jsonify({'success': False, 'error': 'limit must be positive'}), 400
+
+        filters = {
+            'priority_tier': data.get('tier'),
+            'min_score': _number(data, 'min_score', float),
+            'company': data.get('company'),
+            'min_months': _number(data, 'min_months', int),
+            'background': data.get('background'),
+            'school': data.get('school'),
+            'language': data.get('language') or data.get('skill'),
+            'min_stars': _number(data, 'min_stars', int),
+            'min_followers': _number(data, 'min_followers', int)
+        }
+        candidates = db.rerank(weights, limit=limit, **filters)
+        if candidates is None:
+            return jsonify({'success': False, 'error': 'Failed to rerank candidates'}), 500
+
+        return jsonify({
+            'success': True,
+            'count': len(candidates),
+            'weights': {**db.scoring.weights, **weights},
+            'results': candidates
+        })
+
+    except (TypeError, ValueError) as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
 @search_bp.route('/by-tier', methods=['GET'])
 def search_by_tier():
-    """Get candidates grouped by priority tier."""
+    """
+    Get candidates grouped by priority tier.
+
+    Query params:
+    - limit: Maximum candidates per tier (default 50)
+
+    Each tier carries its exact size and the top candidates as summaries
+    (id, name, title, company, tier, total_score); fetch full profiles
+    from /api/candidates/<id>.
+    """
     try:
-        tiers = {
-            'top': db.get_candidates_by_tier('top'),
-            'high': db.get_candidates_by_tier('high'),
-            'medium': db.get_candidates_by_tier('medium'),
-            'low': db.get_candidates_by_tier('low')
-        }
+        limit = request.args.get('limit', 50, type=int)
 
         return jsonify({
             'success': True,
-            'tiers': {
-                tier: {
-                    'count': len(candidates),
-                    'candidates': [c.dict() for c in candidates]
-                }
-                for tier, candidates in tiers.items()
-            }
+            'tiers': db.get_candidates_grouped_by_tier(per_tier=limit)
         })
 
     except Exception as e:
@@ -95,36 +165,11 @@ def search_by_tier():
 def get_search_stats():
     """Get overall statistics about candidates."""
     try:
-        all_candidates = db.get_all_candidates()
-
-        # Calculate statistics
-        total_count = len(all_candidates)
-        tier_counts = {
-            'top': len([c for c in all_candidates if c.priority_tier == 'top']),
-            'high': len([c for c in all_candidates if c.priority_tier == 'high']),
-            'medium': len([c for c in all_candidates if c.priority_tier == 'medium']),
-            'low': len([c for c in all_candidates if c.priority_tier == 'low'])
-        }
-
-        # Average score
-        avg_score = sum(c.score.total_score for c in all_candidates) / total_count if total_count > 0 else 0
-
-        # Top companies
-        companies = {}
-        for c in all_candidates:
-            if c.current_company:
-                companies[c.current_company] = companies.get(c.current_company, 0) + 1
-
-        top_companies = sorted(companies.items(), key=lambda x: x[1], reverse=True)[:10]
+        stats = db.candidate_stats()
 
         return jsonify({
             'success': True,
-            'stats': {
-                'total_candidates': total_count,
-                'tier_distribution': tier_counts,
-                'average_score': round(avg_score, 2),
-                'top_companies': [{'company': name, 'count': count} for name, count in top_companies]
-            }
+            'stats': stats
         })
 
     except Exception as e:
@@ -149,3 +194,14 @@ def get_search_suggestions():
 
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
+
+
+def _number(data: dict, key: str, cast: type):
+    """Helper function to read an optional numeric JSON field, as the GET filters do with type=."""
+    value = data.get(key)
+    if value is None:
+        return None
+    try:
+        return cast(value)
+    except (TypeError, ValueError):
+        raise ValueError(f'{key} must be a number')
@@ -0,0 +1,176 @@
+"""
+Bulk Import Service
+Streams NDJSON candidate records into the database in scored batches
+"""
+
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+from pydantic import ValidationError
+from models.candidate import Candidate, candidate_identity_keys, conflicting_identity
+from .database import Database
+from .profile_enrichment import ProfileEnrichment
+from .scoring_service import ScoringService
+
+# Validation messages kept in the import report
+MAX_REPORTED_ERRORS = 20
+
+
+class BulkImporter:
+    """Validate, score and load NDJSON candidates batch by batch."""
+
+    def __init__(
+        self,
+        database: Database,
+        scoring_service: Optional[ScoringService] = None,
+        batch_size: int = 5000,
+        profile_enrichment: Optional[ProfileEnrichment] = None
+    ):
+        self.database = database
+        self.scoring = scoring_service or ScoringService()
+        self.batch_size = batch_size
+        self.enrichment = profile_enrichment or ProfileEnrichment()
+
+    def import_lines(
+        self,
+        lines: Iterable[Union[str, bytes]],
+        on_batch: Optional[Callable[[Dict], None]] = None
+    ) -> Dict:
+        """
+        Import candidates from an iterable of NDJSON lines.
+
+        Each line is validated into a Candidate, scored, and written with
+        Database.copy_candidates() once ``batch_size`` records have
+        accumulated. Invalid lines are counted and skipped.
+
+        Lines of one batch sharing a GitHub, X or LinkedIn handle are merged
+        into the earlier line (see ProfileEnrichment.merge_profiles). A line
+        whose handles belong to two different people, in the batch or in the
+        database, is invalid: writing it would break the unique identity
+        indexes and fail the whole batch.
+
+        Args:
+            lines: NDJSON lines (a file object, request stream, ...)
+            on_batch: Called with the running report after every batch
+
+        Returns:
+            Report with rows read, imported, merged (into an earlier line),
+            invalid and failed counts, the first validation errors, elapsed
+            seconds and rows per second
+        """
+        report = {
+            'rows': 0,
+            'imported': 0,
+            'merged': 0,
+            'invalid': 0,
+            'failed': 0,
+            'errors': [],
+            'seconds': 0.0,
+            'rows_per_sec': 0.0
+        }
+        start = time.perf_counter()
+        batch: List[Tuple[int, Candidate]] = []
+
+        for line_number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            report['rows'] += 1
+
+            try:
+                batch.append((line_number, Candidate.model_validate_json(line)))
+            except ValidationError as e:
+                self._reject(report, line_number, e.errors()[0]['msg'])
+                continue
+
+            if len(batch) >= self.batch_size:
+                self._load(batch, report, start, on_batch)
+                batch = []
+
+        if batch:
+            self._load(batch, report, start, on_batch)
+
+        self._update_timing(report, start)
+        return report
+
+    def _load(self, lines: List[Tuple[int, Candidate]], report: Dict, start: float, on_batch) -> None:
+        """Score a batch and write it, updating the running report."""
+        lines = self._fold_duplicates(lines, report)
+
+        # Rows for people already stored overwrite them instead of tripping the identity indexes
+        batch = [candidate for _, candidate in lines]
+        for candidate, stored in zip(batch, self.database.find_by_identity(batch)):
+            if stored is not None:
+                candidate.id = stored.id
+
+        owners = self.database.identity_owners(candidate_identity_keys(candidate) for candidate in batch) or {}
+        batch = []
+        for line_number, candidate in lines:
+            other = next((
+                column for column, handle in candidate_identity_keys(candidate).items()
+                if handle and owners.get((column, handle), candidate.id) != candidate.id
+            ), None)
+            if other:
+                self._reject(report, line_number, f"{other} belongs to another stored candidate")
+            else:
+                batch.append(candidate)
+
+        # Imported history flags are client input: always reclassify
+        for candidate in batch:
+            self.scoring.classify_history(candidate, force=True)
+        scores, tiers = self.scoring.score_batch(batch)
+        for candidate, score, tier in zip(batch, scores, tiers):
+            candidate.score = score
+            candidate.priority_tier = tier
+
+        ids = self.database.copy_candidates(batch)
+        written = sum(1 for candidate_id in ids if candidate_id)
+        report['imported'] += written
+        report['failed'] += len(batch) - written
+
+        self._update_timing(report, start)
+        if on_batch:
+            on_batch(report)
+
+    def _fold_duplicates(self, lines: List[Tuple[int, Candidate]], report: Dict) -> List[Tuple[int, Candidate]]:
+        """Merge lines of a batch that share a handle; reject lines naming two different people."""
+        folded = []       # (first line number, candidate)
+        keys = []         # identity keys per folded entry
+        by_handle = {}    # identity key -> index into folded
+
+        for line_number, candidate in lines:
+            candidate_keys = candidate_identity_keys(candidate)
+            matches = {by_handle[key] for key in candidate_keys.items() if key in by_handle}
+            if len(matches) > 1:
+                self._reject(report, line_number, "handles of two different candidates in this batch")
+                continue
+
+            if matches:
+                index = matches.pop()
+                column = conflicting_identity(keys[index], candidate_keys)
+                if column:
+                    self._reject(report, line_number, f"shares a handle with line {folded[index][0]} but not its {column}")
+                    continue
+                folded[index] = (folded[index][0], self.enrichment.merge_profiles(folded[index][1], candidate))
+                keys[index] = candidate_identity_keys(folded[index][1])
+                report['merged'] += 1
+            else:
+                index = len(folded)
+                folded.append((line_number, candidate))
+                keys.append(candidate_keys)
+
+            for key in keys[index].items():
+                if key[1]:
+                    by_handle[key] = index
+        return folded
+
+    @staticmethod
+    def _reject(report: Dict, line_number: int, message: str) -> None:
+        """Count an invalid line, keeping the first messages."""
+        report['invalid'] += 1
+        if len(report['errors']) < MAX_REPORTED_ERRORS:
+            report['errors'].append(f"line {line_number}: {message}")
+
+    def _update_timing(self, report: Dict, start: float) -> None:
+        """Refresh elapsed time and throughput."""
+        elapsed = time.perf_counter() - start
+        report['seconds'] = round(elapsed, 3)
+        report['rows_per_sec'] = round(report['rows'] / elapsed, 1) if elapsed > 0 else 0.0
@@ -1,54 +1,543 @@
-import os
-from typing import Dict, List, Optional
-from sqlalchemy import create_engine, desc
+import base64
+import bisect
+import csv
+import fnmatch
+import io
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+import numpy as np
+from sqlalchemy import (
+    desc, and_, or_, func, select, insert, update, delete, bindparam, literal, literal_column, case, inspect,
+    exists, values, column, Float, String
+)
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import sessionmaker, Session
-from models.candidate import Candidate, CandidateModel, Base
+from sqlalchemy.dialects import postgresql, sqlite
+from models.candidate import (
+    Candidate, CandidateModel, CandidateSummary, CandidateTombstoneModel, Base, SCORE_COLUMNS, IDENTITY_COLUMNS,
+    IDENTITY_SOURCES, SEARCH_DOCUMENT_FIELDS, ExperienceModel, EducationModel,
+    build_search_document, build_history_rows, github_languages_expression, identity_keys, normalize_org
+)
+from services import migrations
+from services.engine import get_engine, pool_stats
+from services.scoring_service import ScoringService, SCORE_INPUTS, SCORE_WEIGHT_KEYS, TIER_THRESHOLDS
+from config import Config
 import json
-from datetime import datetime
+import uuid
+from datetime import datetime, timedelta, timezone
+
+PRIORITY_TIERS = ('top', 'high', 'medium', 'low')
+
+# ``background`` filter values -> candidate_experiences flag column
+BACKGROUND_FLAGS = {
+    'faang': 'is_faang',
+    'frontier_lab': 'is_frontier_lab',
+    'top_tech': 'is_top_tech'
+}
+SCORE_PERCENTILES = (0.5, 0.75, 0.9, 0.99)
+
+# Candidate fields a partial update may set (scores via the ``score`` key)
+PATCHABLE_FIELDS = frozenset(Candidate.model_fields) - {'id', 'score', 'discovery_date', 'last_updated'}
+
+# Columns returned by a partial update: the summary plus search_document inputs
+PATCH_RETURNING = (
+    'id', 'name', 'current_title', 'current_company', 'priority_tier', 'total_score',
+    'github_profile', 'x_profile', 'experiences', 'education', 'bio', 'notes'
+)
+
+# Experiences shown on list cards (CandidateSummary.top_experiences)
+SUMMARY_EXPERIENCES = 3
+
+# Rows per bulk score UPDATE statement (keeps bind parameters well under driver limits)
+SCORE_WRITE_CHUNK = 1000
+
+
+def encode_cursor(total_score: float, candidate_id: str) -> str:
+    """Encode a ranked-list position as an opaque, URL-safe cursor token."""
+    payload = json.dumps([total_score, candidate_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[float, str]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        total_score, candidate_id = json.loads(base64.urlsafe_b64decode(padded))
+        return float(total_score), str(candidate_id)
+    except Exception:
+        raise ValueError('Invalid cursor')
+
+
+def encode_change_token(candidates_at: Tuple[datetime, str], deletes_at: Tuple[datetime, str]) -> str:
+    """Encode change-feed positions (candidates and tombstones) as an opaque token."""
+    payload = json.dumps(
+        [candidates_at[0].isoformat(), candidates_at[1], deletes_at[0].isoformat(), deletes_at[1]],
+        separators=(',', ':')
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_change_token(since: str) -> Tuple[Tuple[datetime, str], Tuple[datetime, str]]:
+    """
+    Decode a change-feed ``since`` value.
+
+    Accepts a token from encode_change_token or an ISO-8601 timestamp, which
+    starts both feeds at that instant.
+
+    Raises:
+        ValueError: If the value is neither
+    """
+    try:
+        start = datetime.fromisoformat(since.replace('Z', '+00:00'))
+        if start.tzinfo:
+            start = start.astimezone(timezone.utc).replace(tzinfo=None)
+        return (start, ''), (start, '')
+    except ValueError:
+        pass
+
+    try:
+        padded = since + '=' * (-len(since) % 4)
+        updated_at, updated_id, deleted_at, deleted_id = json.loads(base64.urlsafe_b64decode(padded))
+        return (
+            (datetime.fromisoformat(updated_at), str(updated_id)),
+            (datetime.fromisoformat(deleted_at), str(deleted_id))
+        )
+    except Exception:
+        raise ValueError('Invalid since token')
+
+
+class CandidateCache:
+    """In-process LRU cache of candidates with a per-entry TTL."""
+
+    def __init__(self, max_size: int = 2048, ttl: float = 300):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Candidate]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, candidate_id: str) -> Optional[Candidate]:
+        """
+        Return the cached candidate, or None on a miss or expired entry.
+
+        Cached instances are shared between callers; treat them as read-only.
+        """
+        with self._lock:
+            entry = self._entries.get(candidate_id)
+            if entry and entry[0] > time.monotonic():
+                self._entries.move_to_end(candidate_id)
+                self.hits += 1
+                return entry[1]
+            if entry:
+                del self._entries[candidate_id]
+            self.misses += 1
+            return None
+
+    def set(self, candidate_id: str, candidate: Candidate) -> None:
+        """Cache a candidate, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[candidate_id] = (time.monotonic() + self.ttl, candidate)
+            self._entries.move_to_end(candidate_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *candidate_ids: str) -> None:
+        """Drop cached entries for the given ids."""
+        with self._lock:
+            for candidate_id in candidate_ids:
+                self._entries.pop(candidate_id, None)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters and current size."""
+        lookups = self.hits + self.misses
+        return {
+            'backend': 'memory',
+            'size': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+
+class LocalCacheBackend:
+    """
+    In-process stand-in for a shared key-value cache such as Redis.
+
+    Implements the subset of the redis-py client used by SharedCandidateCache,
+    so the shared cache path runs without a Redis server (local dev, tests).
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[float, bytes]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+            self._data.pop(key, None)
+            return None
+
+    def setex(self, key: str, ttl: int, value) -> None:
+        with self._lock:
+            if isinstance(value, str):
+                value = value.encode()
+            self._data[key] = (time.monotonic() + ttl, value)
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def scan_iter(self, match: str = '*'):
+        with self._lock:
+            keys = [key for key in self._data if fnmatch.fnmatch(key, match)]
+        return iter(keys)
+
+
+class SharedCandidateCache:
+    """
+    Candidate cache in a shared key-value store (Redis or LocalCacheBackend).
+
+    Entries are stored as JSON, so every worker process sees the same cache
+    and invalidations from any worker apply to all of them.
+    """
+
+    KEY_PREFIX = 'candidate:'
+
+    def __init__(self, client, ttl: float = 300):
+        self.client = client
+        self.ttl = int(ttl)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, candidate_id: str) -> Optional[Candidate]:
+        try:
+            payload = self.client.get(self.KEY_PREFIX + candidate_id)
+        except Exception as e:
+            print(f"Candidate cache unavailable: {e}")
+            payload = None
+
+        if payload is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return Candidate.model_validate_json(payload)
+
+    def set(self, candidate_id: str, candidate: Candidate) -> None:
+        try:
+            self.client.setex(self.KEY_PREFIX + candidate_id, self.ttl, candidate.model_dump_json())
+        except Exception as e:
+            print(f"Candidate cache unavailable: {e}")
+
+    def invalidate(self, *candidate_ids: str) -> None:
+        if not candidate_ids:
+            return
+        try:
+            self.client.delete(*[self.KEY_PREFIX + candidate_id for candidate_id in candidate_ids])
+        except Exception as e:
+            print(f"Candidate cache unavailable: {e}")
+
+    def clear(self) -> None:
+        try:
+            keys = list(self.client.scan_iter(match=self.KEY_PREFIX + '*'))
+            if keys:
+                self.client.delete(*keys)
+        except Exception as e:
+            print(f"Candidate cache unavailable: {e}")
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            'backend': self.client.__class__.__name__,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+
+def build_candidate_cache():
+    """
+    Create the candidate cache selected by Config.CANDIDATE_CACHE_BACKEND.
+
+    ``memory`` (default) is a per-process LRU. ``shared`` uses Redis at
+    Config.REDIS_URL, falling back to the in-process LocalCacheBackend stand-in
+    when no URL is set or the redis package is not installed.
+    """
+    if Config.CANDIDATE_CACHE_BACKEND != 'shared':
+        return CandidateCache(max_size=Config.CANDIDATE_CACHE_SIZE, ttl=Config.CANDIDATE_CACHE_TTL)
+
+    client = None
+    if Config.REDIS_URL:
+        try:
+            import redis
+            client = redis.Redis.from_url(Config.REDIS_URL)
+        except ImportError:
+            print("Warning: redis package not installed, using local cache stand-in.")
+    return SharedCandidateCache(client or LocalCacheBackend(), ttl=Config.CANDIDATE_CACHE_TTL)
+
+
+class Leaderboard:
+    """
+    In-process top-N of candidate summaries, ordered by (total_score, id) descending.
+
+    The board always holds the true top ``len(board)`` candidates: every row
+    outside it ranks below its lowest entry. Writes keep that invariant
+    incrementally (a row is admitted only if it beats the lowest entry,
+    removed and demoted rows just leave), so the board can shrink; when it
+    no longer covers a requested limit, or is older than ``ttl`` seconds
+    (writes from other processes are not seen), top() reports a miss and
+    the caller reloads it with one index scan.
+    """
+
+    def __init__(self, size: int = 500, ttl: float = 60):
+        self.size = size
+        self.ttl = ttl
+        self._entries: Dict[str, CandidateSummary] = {}
+        self._order: List[Tuple[float, str]] = []  # ascending; the best entry is last
+        self._complete = False  # the board holds every candidate in the table
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def top(self, limit: int) -> Optional[List[CandidateSummary]]:
+        """Return the best ``limit`` summaries in O(limit), or None if the board must be reloaded."""
+        if limit <= 0:
+            return []
+        with self._lock:
+            covered = self._complete or len(self._order) >= limit
+            if limit > self.size or not covered or self._expires_at <= time.monotonic():
+                self.misses += 1
+                return None
+            self.hits += 1
+            return [self._entries[candidate_id] for _, candidate_id in reversed(self._order[-limit:])]
+
+    def load(self, summaries: List[CandidateSummary]) -> None:
+        """Replace the board with the first ``size`` rows of the ranked listing."""
+        with self._lock:
+            self._entries = {summary['id']: summary for summary in summaries}
+            self._order = sorted(self._key(summary) for summary in summaries)
+            self._complete = len(summaries) < self.size
+            self._expires_at = time.monotonic() + self.ttl
+
+    def upsert(self, summaries: Iterable[CandidateSummary]) -> None:
+        """Apply written (inserted, updated or rescored) candidates."""
+        with self._lock:
+            for summary in summaries:
+                self._discard(summary['id'])
+                key = self._key(summary)
+                if not self._complete:
+                    # An empty partial board cannot tell where the row ranks among
+                    # the ones it never loaded; keep it empty so top() reloads
+                    if not self._order or key < self._order[0]:
+                        continue
+                bisect.insort(self._order, key)
+                self._entries[summary['id']] = summary
+                if len(self._order) > self.size:
+                    _, dropped = self._order.pop(0)
+                    del self._entries[dropped]
+                    self._complete = False
+
+    def remove(self, *candidate_ids: str) -> None:
+        """Apply deleted candidates."""
+        with self._lock:
+            for candidate_id in candidate_ids:
+                self._discard(candidate_id)
+
+    def clear(self) -> None:
+        """Forget the board; the next top() reloads it."""
+        with self._lock:
+            self._entries.clear()
+            self._order.clear()
+            self._complete = False
+            self._expires_at = 0.0
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters and current size."""
+        return {'size': len(self._order), 'capacity': self.size, 'hits': self.hits, 'misses': self.misses}
+
+    def _discard(self, candidate_id: str) -> None:
+        summary = self._entries.pop(candidate_id, None)
+        if summary is not None:
+            index = bisect.bisect_left(self._order, self._key(summary))
+            del self._order[index]
+
+    @staticmethod
+    def _key(summary: CandidateSummary) -> Tuple[float, str]:
+        return (summary['total_score'], summary['id'])
+
+
+class ScoreSnapshot:
+    """
+    Columnar in-process copy of every candidate's stored sub-scores, for what-if ranking.
+
+    Rows are held in id order as an id list, a tier code array and one
+    float matrix with a column per SCORE_WEIGHT_KEYS entry, so a weighted
+    total for the whole pool is a single matrix-vector product. The snapshot
+    is reloaded wholesale once older than ``ttl`` seconds; writes made in
+    between are not seen.
+    """
+
+    def __init__(self, ttl: float = 60):
+        self.ttl = ttl
+        self._data = None  # (ids, row index by id, tiers, scores)
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def current(self) -> Optional[Tuple]:
+        """
+        The snapshot data if loaded and younger than ``ttl``, else None.
+
+        The returned tuple stays valid for top() even if the snapshot is
+        cleared or reloaded meanwhile.
+        """
+        with self._lock:
+            if self._data is not None and self._expires_at > time.monotonic():
+                return self._data
+            return None
+
+    def load(self, rows: List[Tuple]) -> Tuple:
+        """Replace the snapshot with (id, priority_tier, *sub-scores) rows sorted by id, returning its data."""
+        ids = [row[0] for row in rows]
+        codes = {tier: code for code, tier in enumerate(PRIORITY_TIERS)}
+        tiers = np.array([codes.get(row[1], codes['low']) for row in rows], dtype=np.int8)
+        scores = np.array([row[2:] for row in rows], dtype=np.float64).reshape(len(rows), len(SCORE_WEIGHT_KEYS))
+        data = (ids, {candidate_id: i for i, candidate_id in enumerate(ids)}, tiers, scores)
+        with self._lock:
+            self._data = data
+            self._expires_at = time.monotonic() + self.ttl
+        return data
+
+    def clear(self) -> None:
+        """Forget the snapshot; the next use reloads it."""
+        with self._lock:
+            self._data = None
+            self._expires_at = 0.0
+
+    def __len__(self) -> int:
+        data = self._data
+        return len(data[0]) if data else 0
+
+    @staticmethod
+    def top(
+        data: Tuple,
+        weights: np.ndarray,
+        limit: int,
+        candidate_ids: Optional[Iterable[str]] = None,
+        priority_tier: Optional[str] = None,
+        min_score: Optional[float] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Rank snapshot data by a weight vector.
+
+        Args:
+            data: Snapshot data from current() or load()
+            weights: One weight per SCORE_WEIGHT_KEYS entry, in that order
+            limit: Number of results
+            candidate_ids: Only rank these candidates (None for everyone)
+            priority_tier: Only rank candidates with this stored tier
+            min_score: Minimum weighted total
+
+        Returns:
+            (candidate id, weighted total) pairs, best first, ties by id descending
+        """
+        ids, index, tiers, scores = data
+        totals = scores @ (weights / 100)
+
+        mask = np.ones(len(ids), dtype=bool)
+        if candidate_ids is not None:
+            mask[:] = False
+            mask[[index[candidate_id] for candidate_id in candidate_ids if candidate_id in index]] = True
+        if priority_tier:
+            mask &= tiers == PRIORITY_TIERS.index(priority_tier)
+        if min_score is not None:
+            mask &= totals >= min_score
+
+        rows = np.flatnonzero(mask)
+        if len(rows) > limit:
+            # Partial selection: everything scoring at least the limit-th best total
+            cutoff = np.partition(totals[rows], len(rows) - limit)[len(rows) - limit]
+            rows = rows[totals[rows] >= cutoff]
+        # Rows are in id order, so the row number breaks ties like the id does
+        best = rows[np.lexsort((rows, totals[rows]))[::-1][:limit]]
+        return [(ids[row], float(totals[row])) for row in best]
 
 
 class Database:
     """Database service for PostgreSQL operations using SQLAlchemy."""
 
-    def __init__(self):
-        url = os.getenv('DATABASE_URL')
-        
-        if not url:
+    def __init__(self, url: Optional[str] = None):
+        """
+        Args:
+            url: Database URL (defaults to Config.DATABASE_URL)
+
+        No connection is made here; the shared engine for the URL is created
+        on first use and connects when a session first needs a connection.
+        """
+        self.url = url or Config.DATABASE_URL
+        self._session_factory = None
+        self._stats_cache = None  # (expires_at, stats)
+        self.cache = build_candidate_cache()
+        self.leaderboard = Leaderboard(size=Config.LEADERBOARD_SIZE, ttl=Config.LEADERBOARD_TTL)
+        self.score_snapshot = ScoreSnapshot(ttl=Config.RERANK_SNAPSHOT_TTL)
+        self.scoring = ScoringService()
+
+        if not self.url:
             print("Warning: DATABASE_URL not found. Database operations will fail.")
-            self.engine = None
-            self.SessionLocal = None
-        else:
-            import time
-            from sqlalchemy.exc import OperationalError
-            
-            retries = 5
-            while retries > 0:
-                try:
-                    self.engine = create_engine(url)
-                    # Test connection
-                    with self.engine.connect() as conn:
-                        pass
-                    self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
-                    print("Successfully connected to database.")
-                    break
-                except OperationalError as e:
-                    retries -= 1
-                    print(f"Database connection failed. Retrying in 5 seconds... ({retries} retries left)")
-                    time.sleep(5)
-            
-            if retries == 0:
-                print("Failed to connect to database after multiple attempts.")
-                self.engine = None
-                self.SessionLocal = None
+        elif self.url == Config.DEV_DATABASE_URL:
+            print(f"Using the development SQLite database ({self.url})")
+
+    @property
+    def engine(self) -> Optional[Engine]:
+        """Process-wide engine for this database's URL."""
+        return get_engine(self.url) if self.url else None
+
+    @property
+    def SessionLocal(self) -> Optional[sessionmaker]:
+        """Session factory bound to the shared engine."""
+        if self._session_factory is None and self.engine is not None:
+            self._session_factory = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        return self._session_factory
 
     def init_schema(self):
         """Initialize database schema."""
         if self.engine:
-            Base.metadata.create_all(bind=self.engine)
+            try:
+                existing = set(inspect(self.engine).get_table_names())
+                Base.metadata.create_all(bind=self.engine)
+                migrations.migrate(self.engine, new_tables=set(Base.metadata.tables) - existing)
+            except OperationalError as e:
+                print(f"Database unavailable, schema not initialized: {e}")
+                return "Database unavailable"
             print("Database schema initialized.")
             return "Schema initialized"
         return "Database not configured"
 
+    def pool_stats(self) -> Dict:
+        """Connection pool occupancy and checkout wait times."""
+        return pool_stats(self.url) if self.url else {}
+
+    def cache_stats(self) -> Dict:
+        """Candidate cache hit/miss counters."""
+        return self.cache.stats()
+
     def get_db(self):
         """Get database session."""
         if not self.SessionLocal:
@@ -69,6 +558,8 @@ class Database:
             return None
 
         try:
+            # Persist experience/education classification so scoring need not redo it
+            self.scoring.classify_history(candidate)
             # Convert Pydantic model to SQLAlchemy model
             candidate_data = self._candidate_to_dict(candidate)
             # Remove id if it's None so database generates it
@@ -77,8 +568,12 @@ class Database:
             
             db_candidate = CandidateModel(**candidate_data)
             db.add(db_candidate)
+            db.flush()
+            self._replace_history(db, [{**candidate_data, 'id': db_candidate.id}])
             db.commit()
             db.refresh(db_candidate)
+            self.cache.invalidate(db_candidate.id)
+            self.leaderboard.upsert([self._storage_summary({**candidate_data, 'id': db_candidate.id})])
             return db_candidate.id
         except Exception as e:
             print(f"Error adding candidate: {e}")
@@ -87,37 +582,511 @@ class Database:
         finally:
             db.close()
 
-    def update_candidate(self, candidate_id: str, updates: Dict) -> bool:
+    def upsert_candidates(self, candidates: List[Candidate]) -> List[Optional[str]]:
         """
-        Update a candidate's information.
+        Insert or update a batch of candidates in a single transaction.
+
+        One ``INSERT ... ON CONFLICT (id) DO UPDATE`` statement is compiled and
+        executed with the whole parameter list; SQLAlchemy's insertmanyvalues
+        sends it to PostgreSQL as multi-row VALUES pages, so a batch costs one
+        round trip per page and a single commit.
+
+        Args:
+            candidates: Candidates to write; ones without an id get a new one
+
+        Returns:
+            Candidate ids in input order (all None if the write failed)
+        """
+        if not candidates:
+            return []
+
+        db = self.get_db()
+        if not db:
+            return [None] * len(candidates)
+
+        ids, rows_by_id = self._prepare_rows(candidates)
+        rows = list(rows_by_id.values())
+
+        try:
+            stmt = self._dialect_insert()(CandidateModel.__table__)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[CandidateModel.id],
+                set_={
+                    column: stmt.excluded[column]
+                    for column in rows[0]
+                    if column not in ('id', 'discovery_date')
+                }
+            )
+            db.execute(stmt, rows)
+            self._replace_history(db, rows)
+            db.commit()
+            self.cache.invalidate(*rows_by_id)
+            self.leaderboard.upsert(self._storage_summary(row) for row in rows)
+            return ids
+        except Exception as e:
+            print(f"Error upserting candidates: {e}")
+            db.rollback()
+            return [None] * len(candidates)
+        finally:
+            db.close()
+
+    def copy_candidates(self, candidates: List[Candidate]) -> List[Optional[str]]:
+        """
+        Bulk-load candidates with PostgreSQL COPY, merging into existing rows.
+
+        The batch is streamed as CSV into a temporary staging table and then
+        merged with ``INSERT ... SELECT ... ON CONFLICT (id) DO UPDATE`` in the
+        same transaction. On other backends this falls back to
+        upsert_candidates().
+
+        Args:
+            candidates: Scored candidates to write; ones without an id get a new one
+
+        Returns:
+            Candidate ids in input order (all None if the load failed)
+        """
+        if not candidates:
+            return []
+        if not self.engine or self.engine.dialect.name != 'postgresql':
+            return self.upsert_candidates(candidates)
+
+        ids, rows_by_id = self._prepare_rows(candidates)
+
+        columns = list(next(iter(rows_by_id.values())))
+        experience_rows, education_rows = self._history_rows(rows_by_id.values())
+
+        column_list = ', '.join(columns)
+        updates = ', '.join(
+            f"{column} = EXCLUDED.{column}" for column in columns if column not in ('id', 'discovery_date')
+        )
+
+        conn = self.engine.raw_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                "CREATE TEMP TABLE candidates_staging (LIKE candidates INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+            self._copy_rows(cursor, 'candidates_staging', columns, rows_by_id.values(), not_null=('name',))
+            cursor.execute(
+                f"INSERT INTO candidates ({column_list}) SELECT {column_list} FROM candidates_staging "
+                f"ON CONFLICT (id) DO UPDATE SET {updates}"
+            )
+
+            # Rewrite the experience/education child rows of the batch
+            batch_ids = list(rows_by_id)
+            cursor.execute("DELETE FROM candidate_experiences WHERE candidate_id = ANY(%s)", (batch_ids,))
+            cursor.execute("DELETE FROM candidate_education WHERE candidate_id = ANY(%s)", (batch_ids,))
+            if experience_rows:
+                self._copy_rows(cursor, 'candidate_experiences', list(experience_rows[0]), experience_rows,
+                                not_null=('company',))
+            if education_rows:
+                self._copy_rows(cursor, 'candidate_education', list(education_rows[0]), education_rows,
+                                not_null=('institution',))
+            conn.commit()
+            self.cache.invalidate(*rows_by_id)
+            self.leaderboard.upsert(self._storage_summary(row) for row in rows_by_id.values())
+            return ids
+        except Exception as e:
+            print(f"Error copying candidates: {e}")
+            conn.rollback()
+            return [None] * len(candidates)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _copy_rows(cursor, table: str, columns: List[str], rows: Iterable[Dict], not_null: Tuple = ()) -> None:
+        """Stream dict rows into a table with COPY ... FROM STDIN (CSV, JSON values serialized)."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow([
+                json.dumps(row[column]) if isinstance(row[column], (dict, list)) else row[column]
+                for column in columns
+            ])
+        buffer.seek(0)
+
+        options = f", FORCE_NOT_NULL ({', '.join(not_null)})" if not_null else ''
+        cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv{options})", buffer)
+
+    def _history_rows(self, rows: Iterable[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        """Build candidate_experiences / candidate_education rows for storage rows."""
+        experience_rows, education_rows = [], []
+        for row in rows:
+            experiences, education = build_history_rows(
+                row['id'], row.get('experiences'), row.get('education'),
+                self.scoring.classify_company, self.scoring.is_top_university
+            )
+            experience_rows.extend(experiences)
+            education_rows.extend(education)
+        return experience_rows, education_rows
+
+    def _replace_history(self, db: Session, rows: List[Dict]) -> None:
+        """Rewrite the child rows of the given candidates inside the caller's transaction."""
+        ids = [row['id'] for row in rows]
+        experience_rows, education_rows = self._history_rows(rows)
+
+        db.execute(delete(ExperienceModel).where(ExperienceModel.candidate_id.in_(ids)))
+        db.execute(delete(EducationModel).where(EducationModel.candidate_id.in_(ids)))
+        if experience_rows:
+            db.execute(insert(ExperienceModel), experience_rows)
+        if education_rows:
+            db.execute(insert(EducationModel), education_rows)
+
+    def find_by_identity(self, candidates: List[Candidate]) -> List[Optional[Candidate]]:
+        """
+        Look up stored candidates sharing a GitHub, X or LinkedIn identity.
+
+        All handles of the batch are matched in one query against the unique
+        identity indexes.
+
+        Args:
+            candidates: Candidates about to be written
+
+        Returns:
+            The stored match for each input candidate (None when new), in input order
+        """
+        keys = [identity_keys(self._candidate_to_dict(candidate)) for candidate in candidates]
+        conditions = self._identity_conditions(keys)
+        if not conditions:
+            return [None] * len(candidates)
+
+        db = self.get_db()
+        if not db:
+            return [None] * len(candidates)
+
+        try:
+            stored = {}
+            for model in db.query(CandidateModel).filter(or_(*conditions)).all():
+                candidate = self._model_to_candidate(model)
+                for column in IDENTITY_COLUMNS:
+                    if getattr(model, column):
+                        stored[(column, getattr(model, column))] = candidate
+
+            return [
+                next((stored[(column, key[column])] for column in IDENTITY_COLUMNS
+                      if (column, key[column]) in stored), None)
+                for key in keys
+            ]
+        except Exception as e:
+            print(f"Error finding candidates by identity: {e}")
+            return [None] * len(candidates)
+        finally:
+            db.close()
+
+    def identity_owners(self, keys: Iterable[Dict[str, Optional[str]]]) -> Optional[Dict[Tuple[str, str], str]]:
+        """
+        Look up which stored candidates own a set of handles.
+
+        Args:
+            keys: identity_keys() dicts
+
+        Returns:
+            (identity column, handle) -> id of the candidate holding it, or
+            None if the lookup failed
+        """
+        conditions = self._identity_conditions(keys)
+        if not conditions:
+            return {}
+
+        db = self.get_db()
+        if not db:
+            return {}
+
+        try:
+            columns = [getattr(CandidateModel, column) for column in IDENTITY_COLUMNS]
+            owners = {}
+            for candidate_id, *handles in db.query(CandidateModel.id, *columns).filter(or_(*conditions)):
+                for column, handle in zip(IDENTITY_COLUMNS, handles):
+                    if handle:
+                        owners[(column, handle)] = candidate_id
+            return owners
+        except Exception as e:
+            print(f"Error looking up identity owners: {e}")
+            return None
+        finally:
+            db.close()
+
+    def duplicate_identity_groups(self, columns: Iterable[str] = IDENTITY_COLUMNS) -> Optional[List[List[str]]]:
+        """
+        Find stored candidates that share a handle.
+
+        Rows linked through any of ``columns`` form one group, so a row sharing
+        its GitHub handle with one candidate and its X handle with another
+        puts all three together.
+
+        Returns:
+            Candidate id groups (two or more ids each), or None if the lookup failed
+        """
+        db = self.get_db()
+        if not db:
+            return []
+
+        try:
+            parent = {}
+
+            def root(candidate_id: str) -> str:
+                while parent.setdefault(candidate_id, candidate_id) != candidate_id:
+                    candidate_id = parent[candidate_id]
+                return candidate_id
+
+            for column in columns:
+                handle = getattr(CandidateModel, column)
+                duplicated = select(handle).where(handle.isnot(None)).group_by(handle).having(func.count() > 1)
+                first = {}
+                for candidate_id, value in db.query(CandidateModel.id, handle).filter(handle.in_(duplicated)):
+                    if value in first:
+                        parent[root(candidate_id)] = root(first[value])
+                    else:
+                        first[value] = candidate_id
+
+            groups = {}
+            for candidate_id in parent:
+                groups.setdefault(root(candidate_id), []).append(candidate_id)
+            return sorted(sorted(ids) for ids in groups.values() if len(ids) > 1)
+        except Exception as e:
+            print(f"Error finding duplicate candidates: {e}")
+            return None
+        finally:
+            db.close()
+
+    def merge_duplicates(self, merged: Candidate, duplicate_ids: List[str]) -> bool:
+        """
+        Replace duplicate rows by one merged candidate in a single transaction.
+
+        The duplicates are deleted with tombstones (so change-feed consumers
+        see them go) and ``merged`` is written over its own stored row.
+
+        Args:
+            merged: Candidate to keep, carrying the id of an existing row
+            duplicate_ids: Rows folded into it
+
+        Returns:
+            Whether the merge was written
         """
         db = self.get_db()
         if not db:
             return False
 
         try:
-            db_candidate = db.query(CandidateModel).filter(CandidateModel.id == candidate_id).first()
-            if not db_candidate:
-                return False
+            _, rows_by_id = self._prepare_rows([merged])
+            row = rows_by_id[merged.id]
 
-            for key, value in updates.items():
-                if hasattr(db_candidate, key):
-                    setattr(db_candidate, key, value)
-            
-            db_candidate.last_updated = datetime.utcnow()
+            db.execute(delete(ExperienceModel).where(ExperienceModel.candidate_id.in_(duplicate_ids)))
+            db.execute(delete(EducationModel).where(EducationModel.candidate_id.in_(duplicate_ids)))
+            db.execute(delete(CandidateModel).where(CandidateModel.id.in_(duplicate_ids)))
+            for candidate_id in duplicate_ids:
+                db.merge(CandidateTombstoneModel(id=candidate_id, deleted_at=row['last_updated']))
+
+            db.execute(
+                update(CandidateModel).where(CandidateModel.id == merged.id)
+                .values(**{column: value for column, value in row.items() if column != 'id'})
+            )
+            self._replace_history(db, [row])
             db.commit()
+
+            self.cache.invalidate(merged.id, *duplicate_ids)
+            self.leaderboard.remove(*duplicate_ids)
+            self.leaderboard.upsert([self._storage_summary(row)])
+            self.score_snapshot.clear()
             return True
         except Exception as e:
-            print(f"Error updating candidate: {e}")
+            print(f"Error merging duplicate candidates: {e}")
             db.rollback()
             return False
         finally:
             db.close()
 
+    @staticmethod
+    def _identity_conditions(keys: Iterable[Dict[str, Optional[str]]]) -> List:
+        """OR-able conditions matching any of the handles in identity_keys() dicts."""
+        keys = list(keys)
+        handles = {
+            column: {key[column] for key in keys if key[column]}
+            for column in IDENTITY_COLUMNS
+        }
+        return [
+            getattr(CandidateModel, column).in_(values)
+            for column, values in handles.items() if values
+        ]
+
+    def update_candidate(self, candidate_id: str, updates: Dict) -> bool:
+        """
+        Update a candidate's information.
+
+        See patch_candidates() for the accepted fields and rescoring.
+        """
+        results = self.patch_candidates([{**updates, 'id': candidate_id}])
+        return bool(results and results[0])
+
+    def patch_candidate(self, candidate_id: str, updates: Dict) -> Optional[CandidateSummary]:
+        """
+        Partially update one candidate.
+
+        Returns:
+            Updated summary, or None if the candidate does not exist or the
+            write failed
+
+        Raises:
+            ValueError: If the update is empty or fails validation
+        """
+        results = self.patch_candidates([{**updates, 'id': candidate_id}])
+        return results[0] if results else None
+
+    def patch_candidates(self, patches: List[Dict]) -> Optional[List[Optional[CandidateSummary]]]:
+        """
+        Apply partial updates without reading the rows first.
+
+        Each patch becomes a single ``UPDATE ... RETURNING`` that sets only
+        the given columns. When scoring inputs change (see SCORE_INPUTS) only
+        the affected sub-scores are recomputed; total_score and priority_tier
+        are derived in the same statement from the new sub-scores and the
+        stored ones. search_document is rewritten from the returned row when
+        one of its inputs changed. All patches share one transaction.
+
+        Args:
+            patches: Dicts with the candidate ``id`` and the fields to change.
+                     A ``score`` dict overrides individual score columns.
+
+        Returns:
+            Updated summary per patch in input order (None for unknown ids),
+            or None if the transaction failed
+
+        Raises:
+            ValueError: If a patch has no id, no updatable fields, or invalid values
+        """
+        prepared = [self._prepare_patch(patch) for patch in patches]
+        if not prepared:
+            return []
+
+        db = self.get_db()
+        if not db:
+            return None
+
+        table = CandidateModel.__table__
+        returning = [table.c[column] for column in PATCH_RETURNING]
+        try:
+            summaries = []
+            documents = []
+            history = []
+            for candidate_id, values, reindex in prepared:
+                row = db.execute(
+                    update(table).where(table.c.id == candidate_id).values(**values).returning(*returning)
+                ).mappings().first()
+                if row is None:
+                    summaries.append(None)
+                    continue
+                summaries.append(self._storage_summary(row))
+                if reindex:
+                    documents.append({'row_id': candidate_id, 'document': build_search_document(dict(row))})
+                if values.keys() & {'experiences', 'education'}:
+                    history.append(dict(row))
+
+            if history:
+                self._replace_history(db, history)
+
+            if documents:
+                db.execute(
+                    update(table).where(table.c.id == bindparam('row_id'))
+                    .values(search_document=bindparam('document')),
+                    documents
+                )
+            db.commit()
+
+            written = [summary for summary in summaries if summary]
+            self.cache.invalidate(*(summary['id'] for summary in written))
+            self.leaderboard.upsert(written)
+            return summaries
+        except Exception as e:
+            print(f"Error patching candidates: {e}")
+            db.rollback()
+            return None
+        finally:
+            db.close()
+
+    def _prepare_patch(self, patch: Dict) -> Tuple[str, Dict, bool]:
+        """
+        Validate a patch and build its UPDATE values.
+
+        Returns:
+            (candidate id, column values, whether search_document needs rebuilding)
+        """
+        patch = dict(patch)
+        candidate_id = patch.pop('id', None)
+        if not candidate_id:
+            raise ValueError('Each update needs a candidate id')
+
+        score_overrides = {
+            key: float(value) for key, value in (patch.pop('score', None) or {}).items()
+            if key in SCORE_COLUMNS
+        }
+        fields = {key: value for key, value in patch.items() if key in PATCHABLE_FIELDS}
+        if not fields and not score_overrides:
+            raise ValueError(f'No updatable fields for candidate {candidate_id}')
+
+        # Validate through the Candidate model and convert to storage form;
+        # client-sent history flags are never trusted
+        parsed = Candidate(**{'name': '', **fields})
+        self.scoring.classify_history(parsed, force=True)
+        storage = self._candidate_to_dict(parsed)
+        values = {key: storage[key] for key in fields}
+
+        if 'current_company' in fields:
+            values['current_company_key'] = storage['current_company_key']
+
+        identities = identity_keys(storage)
+        for field, column in IDENTITY_SOURCES.items():
+            if field in fields:
+                values[column] = identities[column]
+
+        sub_scores = self.scoring.score_fields(parsed, fields)
+        sub_scores.update({key: value for key, value in score_overrides.items() if key != 'total_score'})
+        if sub_scores:
+            values.update(sub_scores)
+            values['total_score'] = self._total_score_expression(sub_scores)
+        if 'total_score' in score_overrides:
+            values['total_score'] = score_overrides['total_score']
+        if 'total_score' in values and 'priority_tier' not in fields:
+            values['priority_tier'] = self._priority_tier_expression(values['total_score'])
+
+        values['last_updated'] = datetime.utcnow()
+        return candidate_id, values, bool(fields.keys() & set(SEARCH_DOCUMENT_FIELDS))
+
+    def _total_score_expression(self, sub_scores: Dict[str, float]):
+        """
+        total_score as a SQL expression of new and stored sub-scores.
+
+        Mirrors ScoringService.weighted_total() term by term, so the result
+        matches a full rescore.
+        """
+        table = CandidateModel.__table__
+        weights = self.scoring.weights
+        total = literal(0.0)
+        for name, weight_key in SCORE_WEIGHT_KEYS.items():
+            value = literal(sub_scores[name]) if name in sub_scores else table.c[name]
+            total = total + value * weights[weight_key] / 100
+        return total
+
+    @staticmethod
+    def _priority_tier_expression(total_score):
+        """priority_tier for a total_score value or expression (see determine_priority_tier)."""
+        if isinstance(total_score, (int, float)):
+            total_score = literal(total_score)
+        return case(
+            *[(total_score >= threshold, tier) for tier, threshold in TIER_THRESHOLDS],
+            else_='low'
+        )
+
     def get_candidate(self, candidate_id: str) -> Optional[Candidate]:
         """
         Get a candidate by ID.
+
+        Reads through the candidate cache; writes through this class
+        invalidate the affected entries.
         """
+        cached = self.cache.get(candidate_id)
+        if cached is not None:
+            return cached
+
         db = self.get_db()
         if not db:
             return None
@@ -125,7 +1094,9 @@ class Database:
         try:
             db_candidate = db.query(CandidateModel).filter(CandidateModel.id == candidate_id).first()
             if db_candidate:
-                return self._model_to_candidate(db_candidate)
+                candidate = self._model_to_candidate(db_candidate)
+                self.cache.set(candidate_id, candidate)
+                return candidate
             return None
         except Exception as e:
             print(f"Error getting candidate: {e}")
@@ -139,45 +1110,101 @@ class Database:
         min_score: Optional[float] = None,
         company: Optional[str] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        query: Optional[str] = None,
+        min_months: Optional[int] = None,
+        background: Optional[str] = None,
+        school: Optional[str] = None,
+        language: Optional[str] = None,
+        min_stars: Optional[int] = None,
+        min_followers: Optional[int] = None
     ) -> List[Candidate]:
         """
         Search candidates with filters.
+
+        Results are ranked by (total_score, id) descending. Pass the token from
+        next_cursor() as ``cursor`` to continue after the previous page; when a
+        cursor is given, ``offset`` is ignored.
+
+        With ``query``, only candidates whose search document matches are
+        returned, ranked by text relevance blended with total_score. Text
+        search pages with ``offset`` only.
+
+        ``company`` matches the current or any past employer by normalized
+        name. ``background`` (faang, frontier_lab, top_tech) requires an
+        experience in that category, and ``school`` an education entry at the
+        institution. ``min_months`` requires at least that many months in
+        total at ``company`` (or in the ``background`` category).
+
+        ``language`` (case-insensitive, one of the GitHub top languages),
+        ``min_stars`` and ``min_followers`` filter on github_profile through
+        its JSONB indexes.
+
+        Raises:
+            ValueError: If ``cursor`` is malformed or combined with ``query``,
+                or ``background`` is unknown
         """
+        return self._search(
+            [CandidateModel], self._model_to_candidate,
+            priority_tier=priority_tier, min_score=min_score, company=company,
+            limit=limit, offset=offset, cursor=cursor, query=query,
+            min_months=min_months, background=background, school=school,
+            language=language, min_stars=min_stars, min_followers=min_followers
+        )
+
+    def search_candidate_summaries(self, **filters) -> List[CandidateSummary]:
+        """
+        Search candidates, returning list projections instead of full profiles.
+
+        Accepts the same filters and pagination as search_candidates() but
+        selects only the summary columns, skipping the JSON profile blobs and
+        pydantic validation.
+        """
+        return self._search(
+            self._summary_columns(), self._row_to_summary, finish=self._attach_top_experiences, **filters
+        )
+
+    def _search(
+        self,
+        entities: List,
+        convert,
+        finish: Optional[Callable[[Session, List], None]] = None,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        **filters
+    ) -> List:
+        """
+        Run a filtered, ranked candidate query (see _filtered_query) and convert each result row.
+
+        ``finish`` gets the session and the converted page before the session closes.
+        """
+        if cursor and filters.get('query'):
+            raise ValueError('cursor cannot be combined with a text query')
+        after = decode_cursor(cursor) if cursor else None
+        self._check_filters(**filters)
+
         db = self.get_db()
         if not db:
             return []
 
         try:
-            query = db.query(CandidateModel)
+            q = self._filtered_query(db.query(*entities), **filters)
 
-            if priority_tier:
-                query = query.filter(CandidateModel.priority_tier == priority_tier)
-
-            # Note: JSON querying in SQLAlchemy depends on dialect, 
-            # but for simple score filtering we might need to cast or extract.
-            # For now, we'll filter in Python if complex JSON query is needed, 
-            # or assume score is stored in a way we can query. 
-            # Since score is JSON, we can't easily do > comparison without specific PG operators.
-            # Let's fetch and filter for min_score if it's critical, or rely on ordering.
-            
-            if company:
-                query = query.filter(CandidateModel.current_company.ilike(f'%{company}%'))
+            if after:
+                # Keyset pagination: strictly after the last row of the previous page
+                after_score, after_id = after
+                q = q.filter(or_(
+                    CandidateModel.total_score < after_score,
+                    and_(CandidateModel.total_score == after_score, CandidateModel.id < after_id)
+                ))
+                offset = 0
 
-            # Order by total score descending
-            # We need to cast the JSON value to float for ordering
-            # This syntax is specific to PostgreSQL
-            from sqlalchemy import text
-            query = query.order_by(text("(score->>'total_score')::float DESC"))
-
-            results = query.limit(limit).offset(offset).all()
-            
-            candidates = [self._model_to_candidate(row) for row in results]
-            
-            if min_score is not None:
-                candidates = [c for c in candidates if c.score.total_score >= min_score]
-                
-            return candidates
+            results = [convert(row) for row in q.limit(limit).offset(offset).all()]
+            if finish:
+                finish(db, results)
+            return results
 
         except Exception as e:
             print(f"Error searching candidates: {e}")
@@ -185,9 +1212,403 @@ class Database:
         finally:
             db.close()
 
-    def get_top_candidates(self, limit: int = 20) -> List[Candidate]:
-        """Get top-ranked candidates."""
-        return self.search_candidates(limit=limit)
+    def iter_candidates(self, batch_size: int = 1000, **filters) -> Iterator[Dict]:
+        """
+        Stream every matching candidate in ranking order.
+
+        Rows come from a server-side cursor ``batch_size`` at a time and are
+        yielded as storage dictionaries (CandidateModel.to_dict()), so memory
+        stays constant however large the table is. The session stays open
+        until the iterator is exhausted or closed.
+
+        Args:
+            batch_size: Rows fetched per round trip
+            **filters: Same filters as search_candidates()
+
+        Raises:
+            ValueError: On an invalid filter, before anything is streamed
+        """
+        self._check_filters(**filters)
+        return self._iter_models(batch_size, **filters)
+
+    def _iter_models(self, batch_size: int, **filters) -> Iterator[Dict]:
+        """Generator behind iter_candidates()."""
+        db = self.get_db()
+        if not db:
+            return
+
+        try:
+            q = self._filtered_query(db.query(CandidateModel), **filters)
+            for model in q.yield_per(batch_size):
+                yield model.to_dict()
+                # Rows are only read, don't let the identity map grow with the export
+                db.expunge(model)
+        except Exception as e:
+            print(f"Error streaming candidates: {e}")
+        finally:
+            db.close()
+
+    def iter_score_inputs(
+        self,
+        after: Optional[str] = None,
+        batch_size: int = 1000,
+        limit: Optional[int] = None
+    ) -> Iterator[List[Dict]]:
+        """
+        Stream the scoring inputs and stored scores of every candidate, by id.
+
+        Rows come from a server-side cursor as lists of ``batch_size`` dicts
+        holding the id, priority_tier, the score columns and the SCORE_INPUTS
+        fields. The connection is only used for reading, so callers can write
+        each batch back on other connections while iterating.
+
+        Args:
+            after: Only stream candidates with a greater id (resume point)
+            batch_size: Rows per yielded batch and per round trip
+            limit: Stop after this many candidates
+        """
+        engine = self.engine
+        if engine is None:
+            return
+
+        table = CandidateModel.__table__
+        columns = [table.c.id, table.c.priority_tier, *(table.c[name] for name in SCORE_COLUMNS),
+                   *(table.c[field] for field in SCORE_INPUTS)]
+        q = select(*columns).order_by(table.c.id)
+        if after:
+            q = q.where(table.c.id > after)
+        if limit:
+            q = q.limit(limit)
+
+        with engine.connect() as conn:
+            result = conn.execution_options(stream_results=True, yield_per=batch_size).execute(q)
+            for rows in result.mappings().partitions():
+                yield [dict(row) for row in rows]
+
+    def write_scores(self, rows: List[Dict]) -> Optional[int]:
+        """
+        Overwrite stored scores in bulk.
+
+        On PostgreSQL each chunk is one ``UPDATE ... FROM (VALUES ...)``;
+        SQLite gets an executemany UPDATE. last_updated is bumped so the
+        change feed picks the new scores up, and cached copies, the
+        leaderboard and the rerank snapshot are dropped.
+
+        Rows that also carry ``experiences`` and ``education`` (entries
+        reclassified by ScoringService.classify_history()) get those columns
+        and their candidate_experiences / candidate_education rows rewritten.
+
+        Args:
+            rows: Dicts with ``id``, ``priority_tier`` and every SCORE_COLUMNS
+                  value, optionally ``experiences`` and ``education``
+
+        Returns:
+            Number of rows updated, or None if the transaction failed
+        """
+        if not rows:
+            return 0
+
+        db = self.get_db()
+        if not db:
+            return None
+
+        table = CandidateModel.__table__
+        now = datetime.utcnow()
+        try:
+            updated = 0
+            if db.get_bind().dialect.name == 'postgresql':
+                for start in range(0, len(rows), SCORE_WRITE_CHUNK):
+                    chunk = rows[start:start + SCORE_WRITE_CHUNK]
+                    scores = values(
+                        column('id', String), column('priority_tier', String),
+                        *(column(name, Float) for name in SCORE_COLUMNS),
+                        name='new_scores'
+                    ).data([
+                        (row['id'], row['priority_tier'], *(row[name] for name in SCORE_COLUMNS))
+                        for row in chunk
+                    ])
+                    result = db.execute(
+                        update(table).where(table.c.id == scores.c.id).values(
+                            priority_tier=scores.c.priority_tier, last_updated=now,
+                            **{name: scores.c[name] for name in SCORE_COLUMNS}
+                        )
+                    )
+                    updated += result.rowcount
+            else:
+                result = db.execute(
+                    update(table).where(table.c.id == bindparam('row_id')).values(
+                        priority_tier=bindparam('new_priority_tier'), last_updated=now,
+                        **{name: bindparam(f'new_{name}') for name in SCORE_COLUMNS}
+                    ),
+                    [
+                        {'row_id': row['id'], 'new_priority_tier': row['priority_tier'],
+                         **{f'new_{name}': row[name] for name in SCORE_COLUMNS}}
+                        for row in rows
+                    ]
+                )
+                updated = result.rowcount
+
+            history = [row for row in rows if 'experiences' in row]
+            if history:
+                db.execute(
+                    update(table).where(table.c.id == bindparam('row_id')).values(
+                        experiences=bindparam('new_experiences'), education=bindparam('new_education')
+                    ),
+                    [
+                        {'row_id': row['id'], 'new_experiences': row['experiences'], 'new_education': row['education']}
+                        for row in history
+                    ]
+                )
+                self._replace_history(db, history)
+            db.commit()
+
+            self.cache.invalidate(*(row['id'] for row in rows))
+            # Summaries carry more than scores; let the next top() reload the board
+            self.leaderboard.clear()
+            self.score_snapshot.clear()
+            return updated
+        except Exception as e:
+            print(f"Error writing scores: {e}")
+            db.rollback()
+            return None
+        finally:
+            db.close()
+
+    def _filtered_query(
+        self,
+        q,
+        priority_tier: Optional[str] = None,
+        min_score: Optional[float] = None,
+        company: Optional[str] = None,
+        query: Optional[str] = None,
+        min_months: Optional[int] = None,
+        background: Optional[str] = None,
+        school: Optional[str] = None,
+        language: Optional[str] = None,
+        min_stars: Optional[int] = None,
+        min_followers: Optional[int] = None
+    ):
+        """Apply the search_candidates() filters and ranking to a query."""
+        if priority_tier:
+            q = q.filter(CandidateModel.priority_tier == priority_tier)
+
+        if min_score is not None:
+            q = q.filter(CandidateModel.total_score >= min_score)
+
+        if company or background:
+            history = self._experience_match(company, background, min_months)
+            if company and not background and not min_months:
+                # The current employer may be missing from the experience list
+                history = or_(history, CandidateModel.current_company_key == normalize_org(company))
+            q = q.filter(history)
+
+        if language:
+            q = q.filter(self._language_match(language))
+
+        if min_stars is not None:
+            q = q.filter(CandidateModel.github_profile['total_stars'].as_integer() >= min_stars)
+
+        if min_followers is not None:
+            q = q.filter(CandidateModel.github_profile['followers'].as_integer() >= min_followers)
+
+        if school:
+            q = q.filter(CandidateModel.id.in_(
+                select(EducationModel.candidate_id).where(EducationModel.institution_key == normalize_org(school))
+            ))
+
+        if query:
+            match, relevance = self._text_search(query)
+            weight = Config.SEARCH_RELEVANCE_WEIGHT
+            return q.filter(match).order_by(
+                (relevance * weight + CandidateModel.total_score / 100 * (1 - weight)).desc(),
+                CandidateModel.id.desc()
+            )
+
+        # Order by total score descending, served by idx_candidates_total_score
+        # (or idx_candidates_tier_total_score when filtering by tier)
+        return q.order_by(CandidateModel.total_score.desc(), CandidateModel.id.desc())
+
+    @staticmethod
+    def _check_filters(background: Optional[str] = None, **_) -> None:
+        """Reject filter values that would otherwise silently match nothing."""
+        if background and background not in BACKGROUND_FLAGS:
+            raise ValueError(f"background must be one of: {', '.join(BACKGROUND_FLAGS)}")
+
+    @staticmethod
+    def _experience_match(company: Optional[str], background: Optional[str], min_months: Optional[int]):
+        """
+        Condition on candidates.id for a company-history filter.
+
+        Served by idx_experiences_company (company_key, candidate_id,
+        duration_months) or the partial background indexes; with
+        ``min_months`` the matching stints are summed per candidate.
+        """
+        history = select(ExperienceModel.candidate_id)
+        if company:
+            history = history.where(ExperienceModel.company_key == normalize_org(company))
+        if background:
+            history = history.where(getattr(ExperienceModel, BACKGROUND_FLAGS[background]).is_(True))
+        if min_months:
+            history = history.group_by(ExperienceModel.candidate_id).having(
+                func.sum(ExperienceModel.duration_months) >= min_months
+            )
+        return CandidateModel.id.in_(history)
+
+    def _language_match(self, language: str):
+        """
+        Condition: ``language`` is one of the candidate's GitHub top languages.
+
+        PostgreSQL tests key existence in the lowercased JSONB array, served
+        by the idx_candidates_github_languages GIN index; SQLite walks the
+        array with json_each.
+        """
+        language = language.strip().lower()
+        if self.engine.dialect.name == 'postgresql':
+            return github_languages_expression(CandidateModel.github_profile).has_key(language)
+
+        languages = func.json_each(CandidateModel.github_profile, '$.top_languages').table_valued('value')
+        return exists().select_from(languages).where(func.lower(languages.c.value) == language)
+
+    def _text_search(self, query: str):
+        """
+        Build the match condition and relevance expression for a text query.
+
+        PostgreSQL uses the tsvector GIN index for word matches and the pg_trgm
+        index for substrings; relevance is ts_rank plus word similarity. Other
+        backends fall back to requiring every term as a substring, with exact
+        name matches ranked first.
+
+        Returns:
+            (match condition, relevance expression in roughly [0, 1])
+        """
+        text_query = query.strip().lower()
+        document = CandidateModel.search_document
+        pattern = f"%{text_query}%"
+
+        if self.engine.dialect.name == 'postgresql':
+            tsquery = func.plainto_tsquery(literal_column("'simple'"), text_query)
+            tsvector = func.to_tsvector(literal_column("'simple'"), document)
+            match = or_(tsvector.op('@@')(tsquery), document.ilike(pattern))
+            relevance = (func.ts_rank(tsvector, tsquery) + func.word_similarity(literal(text_query), document)) / 2
+            return match, relevance
+
+        terms = text_query.split() or [text_query]
+        match = and_(*[document.like(f"%{term}%") for term in terms])
+        relevance = case((func.lower(CandidateModel.name) == text_query, 1.0), else_=0.0)
+        return match, relevance
+
+    def next_cursor(self, candidates: List, limit: int) -> Optional[str]:
+        """
+        Return the cursor for the page after ``candidates``, or None on the last page.
+
+        Accepts a page of either Candidate objects or CandidateSummary rows.
+        """
+        if not candidates or len(candidates) < limit:
+            return None
+        last = candidates[-1]
+        if isinstance(last, dict):
+            return encode_cursor(last['total_score'], last['id'])
+        return encode_cursor(last.score.total_score, last.id)
+
+    def get_top_candidates(self, limit: int = 20) -> List[CandidateSummary]:
+        """
+        Get top-ranked candidates as list summaries.
+
+        Served from the in-process leaderboard; a miss reloads it from the
+        ranked index. Limits beyond Config.LEADERBOARD_SIZE query directly.
+        """
+        if limit > self.leaderboard.size:
+            return self.search_candidate_summaries(limit=limit)
+
+        top = self.leaderboard.top(limit)
+        if top is None:
+            summaries = self.search_candidate_summaries(limit=self.leaderboard.size)
+            if summaries:
+                self.leaderboard.load(summaries)
+            top = summaries[:limit]
+        return top
+
+    def rerank(self, weights: Dict[str, float], limit: int = 50, **filters) -> Optional[List[Dict]]:
+        """
+        Rank candidates as if SCORING_WEIGHTS were different, without writing anything.
+
+        Weighted totals are computed from the stored sub-scores over the
+        in-process ScoreSnapshot (reloaded every Config.RERANK_SNAPSHOT_TTL
+        seconds). History, school and GitHub filters are resolved to a set of
+        ids with one SQL query first.
+
+        Args:
+            weights: SCORING_WEIGHTS entries to override; missing keys keep
+                     their configured value
+            limit: Number of results
+            **filters: search_candidates() filters except ``query``;
+                       ``priority_tier`` is the stored tier and ``min_score``
+                       applies to the re-weighted total
+
+        Returns:
+            Candidate summaries best first, each with its ``rerank_score``,
+            or None if ranking failed
+
+        Raises:
+            ValueError: On an unknown weight key, a negative weight or an invalid filter
+        """
+        merged = dict(self.scoring.weights)
+        for key, value in weights.items():
+            if key not in merged:
+                raise ValueError(f'Unknown weight: {key}')
+            value = float(value)
+            if not math.isfinite(value) or value < 0:
+                raise ValueError(f'Weight {key} must be a non-negative number')
+            merged[key] = value
+        if filters.get('query'):
+            raise ValueError('rerank does not support a text query')
+        self._check_filters(**filters)
+
+        priority_tier = filters.pop('priority_tier', None)
+        if priority_tier and priority_tier not in PRIORITY_TIERS:
+            raise ValueError(f"tier must be one of: {', '.join(PRIORITY_TIERS)}")
+        min_score = filters.pop('min_score', None)
+        filters = {key: value for key, value in filters.items() if value is not None}
+        vector = np.array([merged[weight_key] for weight_key in SCORE_WEIGHT_KEYS.values()], dtype=np.float64)
+
+        db = self.get_db()
+        if not db:
+            return []
+
+        try:
+            snapshot = self.score_snapshot.current()
+            if snapshot is None:
+                table = CandidateModel.__table__
+                snapshot = self.score_snapshot.load(db.execute(
+                    select(table.c.id, table.c.priority_tier, *(table.c[name] for name in SCORE_WEIGHT_KEYS))
+                    .order_by(table.c.id)
+                ).all())
+
+            candidate_ids = None
+            if filters:
+                q = self._filtered_query(db.query(CandidateModel.id), **filters).order_by(None)
+                candidate_ids = [candidate_id for candidate_id, in q]
+
+            ranked = ScoreSnapshot.top(snapshot, vector, limit, candidate_ids, priority_tier, min_score)
+            if not ranked:
+                return []
+
+            rows = db.query(*self._summary_columns()).filter(
+                CandidateModel.id.in_([candidate_id for candidate_id, _ in ranked])
+            ).all()
+            summaries = {row.id: self._row_to_summary(row) for row in rows}
+            self._attach_top_experiences(db, summaries.values())
+            return [
+                {**summaries[candidate_id], 'rerank_score': round(total, 4)}
+                for candidate_id, total in ranked
+                if candidate_id in summaries
+            ]
+
+        except Exception as e:
+            print(f"Error reranking candidates: {e}")
+            return None
+        finally:
+            db.close()
 
     def get_candidates_by_tier(self, tier: str) -> List[Candidate]:
         """Get all candidates in a specific priority tier."""
@@ -202,8 +1623,14 @@ class Database:
         try:
             db_candidate = db.query(CandidateModel).filter(CandidateModel.id == candidate_id).first()
             if db_candidate:
+                db.execute(delete(ExperienceModel).where(ExperienceModel.candidate_id == candidate_id))
+                db.execute(delete(EducationModel).where(EducationModel.candidate_id == candidate_id))
                 db.delete(db_candidate)
+                # Recorded in the same transaction so the change feed never misses a delete
+                db.merge(CandidateTombstoneModel(id=candidate_id, deleted_at=datetime.utcnow()))
                 db.commit()
+                self.cache.invalidate(candidate_id)
+                self.leaderboard.remove(candidate_id)
                 return True
             return False
         except Exception as e:
@@ -213,6 +1640,73 @@ class Database:
         finally:
             db.close()
 
+    def changes_since(self, since: Optional[str] = None, limit: int = 500) -> Optional[Dict]:
+        """
+        Get candidates written and deleted after a change-feed position.
+
+        Both feeds are keyset-paged on (timestamp, id) and served from
+        idx_candidates_last_updated and idx_candidate_tombstones_deleted_at.
+        Writes from the last CHANGE_FEED_SETTLE_SECONDS are held back until
+        the next poll.
+
+        Args:
+            since: Token from a previous call, an ISO-8601 timestamp, or None
+                   to start from the beginning
+            limit: Maximum changed and maximum deleted rows returned
+
+        Returns:
+            {'changed': [candidate dicts], 'deleted': [ids], 'next_token': str,
+            'has_more': bool}, or None if the database is unavailable
+
+        Raises:
+            ValueError: If ``since`` cannot be decoded
+        """
+        if since:
+            updated_at, deleted_at = decode_change_token(since)
+        else:
+            updated_at = deleted_at = (datetime.min, '')
+
+        db = self.get_db()
+        if not db:
+            return None
+
+        horizon = datetime.utcnow() - timedelta(seconds=Config.CHANGE_FEED_SETTLE_SECONDS)
+        try:
+            changed = db.query(CandidateModel).filter(
+                self._after(CandidateModel.last_updated, CandidateModel.id, updated_at),
+                CandidateModel.last_updated <= horizon
+            ).order_by(CandidateModel.last_updated, CandidateModel.id).limit(limit + 1).all()
+
+            deleted = db.query(CandidateTombstoneModel).filter(
+                self._after(CandidateTombstoneModel.deleted_at, CandidateTombstoneModel.id, deleted_at),
+                CandidateTombstoneModel.deleted_at <= horizon
+            ).order_by(CandidateTombstoneModel.deleted_at, CandidateTombstoneModel.id).limit(limit + 1).all()
+
+            has_more = len(changed) > limit or len(deleted) > limit
+            changed, deleted = changed[:limit], deleted[:limit]
+            if changed:
+                updated_at = (changed[-1].last_updated, changed[-1].id)
+            if deleted:
+                deleted_at = (deleted[-1].deleted_at, deleted[-1].id)
+
+            return {
+                'changed': [model.to_dict() for model in changed],
+                'deleted': [tombstone.id for tombstone in deleted],
+                'next_token': encode_change_token(updated_at, deleted_at),
+                'has_more': has_more
+            }
+        except Exception as e:
+            print(f"Error reading candidate changes: {e}")
+            return None
+        finally:
+            db.close()
+
+    @staticmethod
+    def _after(timestamp_column, id_column, position: Tuple[datetime, str]):
+        """Keyset condition (timestamp, id) > position, spelled out for index use."""
+        timestamp, row_id = position
+        return or_(timestamp_column > timestamp, and_(timestamp_column == timestamp, id_column > row_id))
+
     def get_all_candidates(self, limit: int = 1000) -> List[Candidate]:
         """Get all candidates."""
         db = self.get_db()
@@ -228,9 +1722,167 @@ class Database:
         finally:
             db.close()
 
+    def candidate_stats(self, top_companies: int = 10) -> Dict:
+        """
+        Aggregate statistics over the whole candidate table.
+
+        Everything is computed with GROUP BY / aggregate queries, so no rows are
+        hydrated. Results are memoized for Config.STATS_CACHE_TTL seconds since
+        dashboards poll this endpoint.
+
+        Args:
+            top_companies: Number of current companies to return
+
+        Returns:
+            Dictionary with total count, tier distribution, average score,
+            score percentiles and the most common current companies
+        """
+        now = time.monotonic()
+        if self._stats_cache and self._stats_cache[0] > now:
+            return self._stats_cache[1]
+
+        db = self.get_db()
+        if not db:
+            return {}
+
+        try:
+            total_count, avg_score = db.query(
+                func.count(CandidateModel.id), func.avg(CandidateModel.total_score)
+            ).one()
+
+            company_count = func.count(CandidateModel.id).label('count')
+            company_rows = db.query(CandidateModel.current_company, company_count) \
+                .filter(CandidateModel.current_company.isnot(None)) \
+                .group_by(CandidateModel.current_company) \
+                .order_by(company_count.desc(), CandidateModel.current_company) \
+                .limit(top_companies).all()
+
+            stats = {
+                'total_candidates': total_count,
+                'tier_distribution': self._tier_counts(db),
+                'average_score': round(avg_score or 0.0, 2),
+                'score_percentiles': self._score_percentiles(db, total_count),
+                'top_companies': [{'company': name, 'count': count} for name, count in company_rows]
+            }
+            self._stats_cache = (now + Config.STATS_CACHE_TTL, stats)
+            return stats
+        except Exception as e:
+            print(f"Error computing candidate stats: {e}")
+            return {}
+        finally:
+            db.close()
+
+    def get_candidates_grouped_by_tier(self, per_tier: int = 50) -> Dict[str, Dict]:
+        """
+        Get the best candidates of every tier with one window-function query.
+
+        Args:
+            per_tier: Maximum candidates returned per tier
+
+        Returns:
+            Mapping of tier -> {'count': exact tier size, 'candidates': CandidateSummary rows}
+        """
+        grouped = {tier: {'count': 0, 'candidates': []} for tier in PRIORITY_TIERS}
+
+        db = self.get_db()
+        if not db:
+            return grouped
+
+        try:
+            # Untiered rows count as 'low', so they must share its partition and limit
+            tier = func.coalesce(CandidateModel.priority_tier, 'low')
+            tier_rank = func.row_number().over(
+                partition_by=tier,
+                order_by=(CandidateModel.total_score.desc(), CandidateModel.id.desc())
+            ).label('tier_rank')
+            ranked = select(*self._summary_columns(), tier.label('tier'), tier_rank).subquery()
+
+            rows = db.execute(
+                select(ranked)
+                .where(ranked.c.tier_rank <= per_tier)
+                .order_by(ranked.c.tier, ranked.c.tier_rank)
+            ).all()
+
+            summaries = [self._row_to_summary(row) for row in rows]
+            self._attach_top_experiences(db, summaries)
+            for summary in summaries:
+                tier = summary['priority_tier']
+                grouped.setdefault(tier, {'count': 0, 'candidates': []})['candidates'].append(summary)
+
+            for tier, count in self._tier_counts(db).items():
+                grouped.setdefault(tier, {'count': 0, 'candidates': []})['count'] = count
+
+            return grouped
+        except Exception as e:
+            print(f"Error grouping candidates by tier: {e}")
+            return grouped
+        finally:
+            db.close()
+
+    def _tier_counts(self, db: Session) -> Dict[str, int]:
+        """Exact number of candidates per priority tier."""
+        tier_counts = {tier: 0 for tier in PRIORITY_TIERS}
+        tier_rows = db.query(
+            CandidateModel.priority_tier, func.count(CandidateModel.id)
+        ).group_by(CandidateModel.priority_tier).all()
+        for tier, count in tier_rows:
+            tier_counts[tier or 'low'] = tier_counts.get(tier or 'low', 0) + count
+        return tier_counts
+
+    def _score_percentiles(self, db: Session, total_count: int) -> Dict[str, float]:
+        """Nearest-rank total_score percentiles (p50, p75, ...)."""
+        if not total_count:
+            return {f'p{int(p * 100)}': 0.0 for p in SCORE_PERCENTILES}
+
+        if self.engine.dialect.name == 'postgresql':
+            values = db.query(*[
+                func.percentile_disc(p).within_group(CandidateModel.total_score)
+                for p in SCORE_PERCENTILES
+            ]).one()
+        else:
+            # No ordered-set aggregates: seek to each rank on the total_score index
+            values = [
+                db.query(CandidateModel.total_score)
+                .order_by(CandidateModel.total_score)
+                .offset(max(math.ceil(p * total_count) - 1, 0))
+                .limit(1).scalar()
+                for p in SCORE_PERCENTILES
+            ]
+
+        return {f'p{int(p * 100)}': round(value or 0.0, 2) for p, value in zip(SCORE_PERCENTILES, values)}
+
+    def _prepare_rows(self, candidates: List[Candidate]) -> Tuple[List[str], Dict[str, Dict]]:
+        """
+        Classify and convert a batch to storage rows for a multi-row write.
+
+        Returns:
+            (ids in input order, rows keyed by id). A repeated id in one
+            statement is rejected by ON CONFLICT, so only the last row per id
+            is kept.
+        """
+        ids = []
+        rows_by_id = {}
+        now = datetime.utcnow()
+        for candidate in candidates:
+            # Persist experience/education classification so scoring need not redo it
+            self.scoring.classify_history(candidate)
+            row = self._candidate_to_dict(candidate)
+            if not row.get('id'):
+                row['id'] = str(uuid.uuid4())
+            row['last_updated'] = now
+            ids.append(row['id'])
+            rows_by_id[row['id']] = row
+        return ids, rows_by_id
+
+    def _dialect_insert(self):
+        """Return the dialect-specific ``insert`` construct supporting ON CONFLICT."""
+        if self.engine.dialect.name == 'sqlite':
+            return sqlite.insert
+        return postgresql.insert
+
     def _candidate_to_dict(self, candidate: Candidate) -> Dict:
-        """Convert Candidate object to dictionary for database storage."""
-        return {
+        """Convert Candidate object to dictionary for database storage (classify it first)."""
+        data = {
             'id': candidate.id,
             'name': candidate.name,
             'email': candidate.email,
@@ -239,16 +1891,97 @@ class Database:
             'linkedin_url': candidate.linkedin_url,
             'current_title': candidate.current_title,
             'current_company': candidate.current_company,
+            'current_company_key': normalize_org(candidate.current_company),
+            'bio': candidate.bio,
             'experiences': [exp.dict() for exp in candidate.experiences],
             'total_years_experience': candidate.total_years_experience,
             'education': [edu.dict() for edu in candidate.education],
             'publications': [pub.dict() for pub in candidate.publications],
-            'score': candidate.score.dict(),
+            **candidate.score.dict(),
             'priority_tier': candidate.priority_tier,
             'discovered_from': candidate.discovered_from,
             'discovery_date': candidate.discovery_date,
             'notes': candidate.notes
         }
+        data['search_document'] = build_search_document(data)
+        data.update(identity_keys(data))
+        return data
+
+    def _summary_columns(self) -> List:
+        """Columns selected for CandidateSummary projections."""
+        return [
+            CandidateModel.id,
+            CandidateModel.name,
+            CandidateModel.current_title,
+            CandidateModel.current_company,
+            CandidateModel.priority_tier,
+            CandidateModel.total_score,
+            CandidateModel.github_profile['username'].as_string().label('github_username'),
+            CandidateModel.x_profile['username'].as_string().label('x_username')
+        ]
+
+    @staticmethod
+    def _storage_summary(row: Dict) -> CandidateSummary:
+        """Build a CandidateSummary from a storage row (see _candidate_to_dict)."""
+        github_username = (row.get('github_profile') or {}).get('username')
+        return {
+            'id': row['id'],
+            'name': row.get('name'),
+            'current_title': row.get('current_title'),
+            'current_company': row.get('current_company'),
+            'priority_tier': row.get('priority_tier') or 'low',
+            'total_score': row.get('total_score') or 0.0,
+            'github_username': github_username,
+            'x_username': (row.get('x_profile') or {}).get('username'),
+            'avatar_url': f"https://github.com/{github_username}.png" if github_username else None,
+            'top_experiences': [
+                {
+                    'company': exp['company'],
+                    'is_faang': exp.get('is_faang', False),
+                    'is_frontier_lab': exp.get('is_frontier_lab', False),
+                    'is_top_tech': exp.get('is_top_tech', False)
+                }
+                for exp in (row.get('experiences') or [])[:SUMMARY_EXPERIENCES]
+            ]
+        }
+
+    @staticmethod
+    def _row_to_summary(row) -> CandidateSummary:
+        """Convert a row selected with _summary_columns() to a CandidateSummary."""
+        github_username = row.github_username
+        return {
+            'id': row.id,
+            'name': row.name,
+            'current_title': row.current_title,
+            'current_company': row.current_company,
+            'priority_tier': row.priority_tier or 'low',
+            'total_score': row.total_score or 0.0,
+            'github_username': github_username,
+            'x_username': row.x_username,
+            'avatar_url': f"https://github.com/{github_username}.png" if github_username else None,
+            'top_experiences': []  # see _attach_top_experiences
+        }
+
+    @staticmethod
+    def _attach_top_experiences(db: Session, summaries: Iterable[CandidateSummary]) -> None:
+        """Fill in top_experiences of summaries from candidate_experiences, in one indexed query."""
+        by_id = {summary['id']: summary for summary in summaries}
+        if not by_id:
+            return
+        rows = db.query(
+            ExperienceModel.candidate_id, ExperienceModel.company, ExperienceModel.is_faang,
+            ExperienceModel.is_frontier_lab, ExperienceModel.is_top_tech
+        ).filter(
+            ExperienceModel.candidate_id.in_(list(by_id)),
+            ExperienceModel.position < SUMMARY_EXPERIENCES
+        ).order_by(ExperienceModel.candidate_id, ExperienceModel.position)
+        for candidate_id, company, is_faang, is_frontier_lab, is_top_tech in rows:
+            by_id[candidate_id]['top_experiences'].append({
+                'company': company,
+                'is_faang': is_faang,
+                'is_frontier_lab': is_frontier_lab,
+                'is_top_tech': is_top_tech
+            })
 
     def _model_to_candidate(self, model: CandidateModel) -> Candidate:
         """Convert database model to Candidate object."""
@@ -261,14 +1994,26 @@ class Database:
             linkedin_url=model.linkedin_url,
             current_title=model.current_title,
             current_company=model.current_company,
+            bio=model.bio,
             experiences=model.experiences or [],
             total_years_experience=model.total_years_experience or 0.0,
             education=model.education or [],
             publications=model.publications or [],
-            score=model.score or {},
+            score=model.score_dict(),
             priority_tier=model.priority_tier or 'low',
             discovered_from=model.discovered_from,
             discovery_date=model.discovery_date,
             last_updated=model.last_updated,
             notes=model.notes
         )
+
+
+_shared_database: Optional[Database] = None
+
+
+def get_database() -> Database:
+    """Return the process-wide Database shared by the app and all blueprints."""
+    global _shared_database
+    if _shared_database is None:
+        _shared_database = Database()
+    return _shared_database
@@ -0,0 +1,112 @@
+"""
+Duplicate Merge Job
+One-off cleanup for databases written before candidates were deduplicated by
+GitHub, X and LinkedIn identity: merges the rows sharing a handle so the
+unique identity indexes can be created
+"""
+
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from models.candidate import Candidate
+from . import migrations
+from .database import Database
+from .profile_enrichment import ProfileEnrichment
+from .scoring_service import ScoringService
+
+
+class Deduplicator:
+    """Fold every group of candidates sharing a handle into its most recently updated row."""
+
+    def __init__(
+        self,
+        database: Database,
+        scoring_service: Optional[ScoringService] = None,
+        profile_enrichment: Optional[ProfileEnrichment] = None
+    ):
+        self.database = database
+        self.scoring = scoring_service or ScoringService()
+        self.enrichment = profile_enrichment or ProfileEnrichment()
+
+    def run(self, dry_run: bool = False, on_group: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """
+        Merge duplicate candidates, then create the missing unique identity indexes.
+
+        Only identity columns whose unique index does not exist yet are
+        scanned; once all three indexes exist this is a no-op.
+
+        Args:
+            dry_run: Report the groups without writing anything
+            on_group: Called with the running report after every group
+
+        Returns:
+            Report with the columns scanned, duplicate groups found, groups
+            merged, rows removed (or to be removed on a dry run), failed groups
+            and elapsed seconds
+        """
+        report = {
+            'columns': migrations.missing_identity_indexes(self.database.engine),
+            'groups': 0,
+            'merged': 0,
+            'removed': 0,
+            'failed': 0,
+            'seconds': 0.0
+        }
+        start = time.perf_counter()
+        if not report['columns']:
+            return report
+
+        groups = self.database.duplicate_identity_groups(report['columns'])
+        if groups is None:
+            report['failed'] += 1
+            return report
+        report['groups'] = len(groups)
+
+        for ids in groups:
+            candidates = [self.database.get_candidate(candidate_id) for candidate_id in ids]
+            candidates = [candidate for candidate in candidates if candidate is not None]
+            if len(candidates) < 2:
+                continue
+
+            merged, duplicate_ids = self.merge_group(candidates)
+            if dry_run or self.database.merge_duplicates(merged, duplicate_ids):
+                report['merged'] += 1
+                report['removed'] += len(duplicate_ids)
+            else:
+                report['failed'] += 1
+
+            report['seconds'] = round(time.perf_counter() - start, 3)
+            if on_group:
+                on_group(report)
+
+        if not dry_run and not report['failed']:
+            # Same path as startup: creates the unique indexes now that they can hold
+            self.database.init_schema()
+
+        report['seconds'] = round(time.perf_counter() - start, 3)
+        return report
+
+    def merge_group(self, candidates: List[Candidate]) -> Tuple[Candidate, List[str]]:
+        """
+        Fold duplicates into the most recently updated one (highest id on ties).
+
+        Profiles are merged oldest first with ProfileEnrichment.merge_profiles(),
+        so newer data wins field by field while the first discovery date and
+        source survive. Recruiter notes of all rows are kept, newest first.
+
+        Returns:
+            (rescored merged candidate carrying the kept id, ids of the rows it replaces)
+        """
+        ordered = sorted(candidates, key=lambda candidate: (candidate.last_updated or datetime.min, candidate.id))
+        merged = ordered[0]
+        for newer in ordered[1:]:
+            merged = self.enrichment.merge_profiles(merged, newer)
+        merged.id = ordered[-1].id
+
+        notes = [candidate.notes for candidate in reversed(ordered) if candidate.notes]
+        merged.notes = '\n\n'.join(dict.fromkeys(notes)) or None
+
+        self.scoring.classify_history(merged)
+        merged.score = self.scoring.score_candidate(merged)
+        merged.priority_tier = self.scoring.determine_priority_tier(merged.score)
+        return merged, [candidate.id for candidate in ordered[:-1]]
@@ -0,0 +1,151 @@
+"""
+Database Engine Registry
+Keeps one pooled SQLAlchemy engine per database URL for the whole process.
+Engines are created on first use and never connect until a session needs one.
+
+PostgreSQL and SQLite are both supported. SQLite file databases run in WAL
+mode; ``sqlite://`` (or ``sqlite:///:memory:``) is a single in-memory
+database shared by every session of the process.
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import QueuePool, StaticPool
+from config import Config
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - start
+            with self._stats_lock:
+                self.checkouts += 1
+                self.total_wait += waited
+                self.max_wait = max(self.max_wait, waited)
+
+    def wait_stats(self) -> Dict:
+        """Return checkout count and wait times in milliseconds."""
+        with self._stats_lock:
+            return {
+                'checkouts': self.checkouts,
+                'avg_wait_ms': round(self.total_wait / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+                'max_wait_ms': round(self.max_wait * 1000, 3)
+            }
+
+
+_engines: Dict[str, Engine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_engine(url: Optional[str] = None) -> Optional[Engine]:
+    """
+    Get the shared engine for a database URL, creating it on first use.
+
+    Args:
+        url: Database URL (defaults to Config.DATABASE_URL)
+
+    Returns:
+        Shared Engine, or None if no URL is configured
+    """
+    url = url or Config.DATABASE_URL
+    if not url:
+        return None
+
+    with _engines_lock:
+        engine = _engines.get(url)
+        if engine is None:
+            engine = create_engine(url, **_engine_options(url))
+            if engine.dialect.name == 'sqlite':
+                event.listen(engine, 'connect', _configure_sqlite)
+            _engines[url] = engine
+        return engine
+
+
+def pool_stats(url: Optional[str] = None) -> Dict:
+    """
+    Report pool occupancy and checkout wait times for a URL's engine.
+
+    Returns an empty dict if the engine has not been created yet.
+    """
+    url = url or Config.DATABASE_URL
+    engine = _engines.get(url) if url else None
+    if engine is None:
+        return {}
+
+    pool = engine.pool
+    stats = {'pool': pool.__class__.__name__}
+    if isinstance(pool, QueuePool):
+        stats.update({
+            'size': pool.size(),
+            'checked_out': pool.checkedout(),
+            'overflow': pool.overflow(),
+            'idle': pool.checkedin()
+        })
+    if isinstance(pool, TimedQueuePool):
+        stats.update(pool.wait_stats())
+    return stats
+
+
+def dispose_engines() -> None:
+    """
+    Close every pooled connection and forget all engines.
+
+    Call this in a child process after fork (e.g. a gunicorn post_fork hook
+    when the app is preloaded) so workers never share sockets.
+    """
+    with _engines_lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+
+
+def is_memory_url(url: str) -> bool:
+    """Whether a URL names an in-memory SQLite database."""
+    parsed = make_url(url)
+    return parsed.get_backend_name() == 'sqlite' and (
+        parsed.database in (None, '', ':memory:') or parsed.query.get('mode') == 'memory'
+    )
+
+
+def _configure_sqlite(dbapi_connection, connection_record) -> None:
+    """Per-connection SQLite settings: WAL for concurrent readers during writes."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")  # in-memory databases keep 'memory'
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={int(Config.SQLITE_BUSY_TIMEOUT * 1000)}")
+    cursor.close()
+
+
+def _engine_options(url: str) -> Dict:
+    """Build create_engine() keyword arguments for a URL."""
+    if url.startswith('sqlite'):
+        # Flask serves requests from several threads
+        options = {'connect_args': {'check_same_thread': False}}
+        if is_memory_url(url):
+            # One connection, so every session sees the same in-memory database
+            options['poolclass'] = StaticPool
+        return options
+
+    return {
+        'poolclass': TimedQueuePool,
+        'pool_size': Config.DB_POOL_SIZE,
+        'max_overflow': Config.DB_MAX_OVERFLOW,
+        'pool_timeout': Config.DB_POOL_TIMEOUT,
+        'pool_pre_ping': Config.DB_POOL_PRE_PING,
+        'pool_recycle': Config.DB_POOL_RECYCLE
+    }
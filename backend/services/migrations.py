@@ -0,0 +1,253 @@
+"""
+Schema Migrations
+Idempotent, additive migrations that bring an existing candidates table up to
+the current CandidateModel. Fresh databases get everything from create_all().
+"""
+
+from typing import Iterable, List, Set
+from sqlalchemy import inspect, text, select, insert, update, bindparam
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import Connection, Engine
+from models.candidate import (
+    CandidateModel, ExperienceModel, EducationModel, SCORE_COLUMNS, IDENTITY_COLUMNS,
+    build_search_document, build_history_rows, identity_keys, normalize_org
+)
+from services.scoring_service import ScoringService
+
+# Rows read and rewritten per round trip by Python-side backfills
+BACKFILL_BATCH_SIZE = 1000
+
+# Unique "one candidate per handle" index -> identity column it covers
+IDENTITY_INDEXES = {f'uq_candidates_{column}': column for column in IDENTITY_COLUMNS}
+
+
+def migrate(engine: Engine, new_tables: Iterable[str] = ()) -> None:
+    """
+    Run all migration steps against an existing schema.
+
+    Every step checks the live schema first, so running this on an
+    up-to-date database is a no-op.
+
+    Args:
+        engine: Engine bound to the target database
+        new_tables: Tables create_all() just created, whose rows are derived
+                    from existing candidates and need a backfill
+    """
+    with engine.begin() as conn:
+        inspector = inspect(conn)
+        if not inspector.has_table(CandidateModel.__tablename__):
+            return
+
+        live_columns = inspector.get_columns(CandidateModel.__tablename__)
+        columns = {column['name'] for column in live_columns}
+
+        _add_score_columns(conn, columns)
+        _add_columns(conn, columns, ['bio', 'search_document'])
+        _backfill_search_documents(conn)
+
+        added = [column for column in IDENTITY_COLUMNS if column not in columns]
+        _add_columns(conn, columns, list(IDENTITY_COLUMNS))
+        if added:
+            _backfill_identity_keys(conn)
+
+        if 'current_company_key' not in columns:
+            _add_columns(conn, columns, ['current_company_key'])
+            _backfill_company_keys(conn)
+        if ExperienceModel.__tablename__ in new_tables:
+            _backfill_history(conn)
+
+        _convert_github_profile_to_jsonb(conn, live_columns)
+
+        _create_indexes(conn)
+
+
+def _add_score_columns(conn: Connection, columns: set) -> None:
+    """Promote the legacy ``score`` JSON blob to one FLOAT column per sub-score."""
+    missing = [column for column in SCORE_COLUMNS if column not in columns]
+    if not missing:
+        return
+
+    print(f"Migrating: adding score columns {', '.join(missing)}")
+    for column in missing:
+        conn.execute(text(f"ALTER TABLE candidates ADD COLUMN {column} FLOAT NOT NULL DEFAULT 0"))
+
+    if 'score' not in columns:
+        return
+
+    # Backfill from the JSON blob the columns replace
+    if conn.dialect.name == 'sqlite':
+        extract = "COALESCE(json_extract(score, '$.{0}'), 0)"
+    else:
+        extract = "COALESCE((score->>'{0}')::float, 0)"
+
+    assignments = ', '.join(f"{column} = {extract.format(column)}" for column in missing)
+    conn.execute(text(f"UPDATE candidates SET {assignments} WHERE score IS NOT NULL"))
+
+
+def _add_columns(conn: Connection, columns: set, names: list) -> None:
+    """Add nullable CandidateModel columns that the live table is missing."""
+    table = CandidateModel.__table__
+    for name in names:
+        if name in columns:
+            continue
+        print(f"Migrating: adding column {name}")
+        column_type = table.c[name].type.compile(dialect=conn.dialect)
+        conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {name} {column_type}"))
+        columns.add(name)
+
+
+def _backfill_search_documents(conn: Connection) -> None:
+    """Populate search_document for rows written before it existed."""
+    table = CandidateModel.__table__
+    source = select(
+        table.c.id, table.c.name, table.c.current_title, table.c.current_company,
+        table.c.bio, table.c.notes, table.c.experiences, table.c.github_profile
+    ).where(table.c.search_document.is_(None)).limit(BACKFILL_BATCH_SIZE)
+    write = update(table).where(table.c.id == bindparam('row_id')).values(search_document=bindparam('document'))
+
+    while True:
+        rows = conn.execute(source).mappings().all()
+        if not rows:
+            return
+        print(f"Migrating: indexing {len(rows)} candidates for search")
+        conn.execute(write, [
+            {'row_id': row['id'], 'document': build_search_document(dict(row))}
+            for row in rows
+        ])
+
+
+def _backfill_identity_keys(conn: Connection) -> None:
+    """Populate the identity columns from the stored profiles, keyset-paged by id."""
+    table = CandidateModel.__table__
+    write = update(table).where(table.c.id == bindparam('row_id')).values(
+        **{column: bindparam(f'new_{column}') for column in IDENTITY_COLUMNS}
+    )
+    last_id = ''
+
+    while True:
+        rows = conn.execute(
+            select(table.c.id, table.c.github_profile, table.c.x_profile, table.c.linkedin_url)
+            .where(table.c.id > last_id)
+            .order_by(table.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).mappings().all()
+        if not rows:
+            return
+        print(f"Migrating: computing identity keys for {len(rows)} candidates")
+        conn.execute(write, [
+            {'row_id': row['id'], **{f'new_{k}': v for k, v in identity_keys(dict(row)).items()}}
+            for row in rows
+        ])
+        last_id = rows[-1]['id']
+
+
+def _backfill_company_keys(conn: Connection) -> None:
+    """Populate current_company_key, keyset-paged by id."""
+    table = CandidateModel.__table__
+    write = update(table).where(table.c.id == bindparam('row_id')).values(current_company_key=bindparam('key'))
+    last_id = ''
+
+    while True:
+        rows = conn.execute(
+            select(table.c.id, table.c.current_company)
+            .where(table.c.id > last_id, table.c.current_company.isnot(None))
+            .order_by(table.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+        print(f"Migrating: normalizing current company of {len(rows)} candidates")
+        conn.execute(write, [{'row_id': row_id, 'key': normalize_org(company)} for row_id, company in rows])
+        last_id = rows[-1][0]
+
+
+def _backfill_history(conn: Connection) -> None:
+    """Fill candidate_experiences / candidate_education from the JSON columns."""
+    scoring = ScoringService()
+
+    table = CandidateModel.__table__
+    last_id = ''
+    while True:
+        rows = conn.execute(
+            select(table.c.id, table.c.experiences, table.c.education)
+            .where(table.c.id > last_id)
+            .order_by(table.c.id)
+            .limit(BACKFILL_BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+        print(f"Migrating: indexing work history of {len(rows)} candidates")
+
+        experience_rows, education_rows = [], []
+        for row_id, experiences, education in rows:
+            experience_batch, education_batch = build_history_rows(
+                row_id, experiences, education, scoring.classify_company, scoring.is_top_university
+            )
+            experience_rows.extend(experience_batch)
+            education_rows.extend(education_batch)
+
+        if experience_rows:
+            conn.execute(insert(ExperienceModel.__table__), experience_rows)
+        if education_rows:
+            conn.execute(insert(EducationModel.__table__), education_rows)
+        last_id = rows[-1][0]
+
+
+def _convert_github_profile_to_jsonb(conn: Connection, live_columns: list) -> None:
+    """Switch github_profile from JSON to JSONB on PostgreSQL so it can be GIN-indexed."""
+    if conn.dialect.name != 'postgresql':
+        return
+
+    column_type = next(column['type'] for column in live_columns if column['name'] == 'github_profile')
+    if isinstance(column_type, JSONB):
+        return
+
+    print("Migrating: converting github_profile to JSONB")
+    conn.execute(text("ALTER TABLE candidates ALTER COLUMN github_profile TYPE JSONB USING github_profile::jsonb"))
+
+
+def missing_identity_indexes(engine: Engine) -> List[str]:
+    """Identity columns whose unique index does not exist yet (see dedupe_candidates.py)."""
+    with engine.connect() as conn:
+        existing = _existing_indexes(conn)
+    return [column for name, column in IDENTITY_INDEXES.items() if name not in existing]
+
+
+def _existing_indexes(conn: Connection) -> Set[str]:
+    """Names of the indexes on the candidates table."""
+    table = CandidateModel.__table__
+    if conn.dialect.name == 'sqlite':
+        # SQLite reflection skips expression indexes, so look them up by name
+        return set(conn.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = :table"),
+            {'table': table.name}
+        ).scalars())
+    return {index['name'] for index in inspect(conn).get_indexes(table.name)}
+
+
+def _has_duplicates(conn: Connection, column: str) -> bool:
+    """Whether two candidates share a value of an identity column."""
+    handle = CandidateModel.__table__.c[column]
+    return conn.execute(
+        select(handle).where(handle.isnot(None)).group_by(handle).having(text('COUNT(*) > 1')).limit(1)
+    ).first() is not None
+
+
+def _create_indexes(conn: Connection) -> None:
+    """
+    Create any CandidateModel index that does not exist yet.
+
+    A unique identity index is left out while its column still holds
+    duplicates from before candidates were deduplicated; dedupe_candidates.py
+    merges them and creates it.
+    """
+    existing = _existing_indexes(conn)
+    for index in CandidateModel.__table__.indexes:
+        if index.name in existing:
+            continue
+        column = IDENTITY_INDEXES.get(index.name)
+        if column and _has_duplicates(conn, column):
+            print(f"Warning: candidates share {column} values, {index.name} not created. "
+                  f"Run dedupe_candidates.py to merge them")
+            continue
+        index.create(bind=conn)
@@ -0,0 +1,97 @@
+"""
+Organization Matcher
+Classifies company and institution names against the Config category lists
+with precompiled, word-bounded regular expressions.
+"""
+
+import hashlib
+import json
+import re
+from functools import lru_cache
+from typing import Iterable, NamedTuple, Optional
+from config import Config
+
+
+class OrgFlags(NamedTuple):
+    """Categories an organization name belongs to."""
+    is_faang: bool = False
+    is_frontier_lab: bool = False
+    is_top_tech: bool = False
+    is_top_university: bool = False
+
+
+NO_FLAGS = OrgFlags()
+
+
+def compile_names(names: Iterable[str]) -> re.Pattern:
+    """
+    Compile a list of names into one case-insensitive alternation.
+
+    Each name must appear as whole words: 'X' matches 'X Corp' but not
+    'Xerox' or 'SpaceX', and 'Meta' does not match 'Metabase'. Longer names
+    are tried first so 'Google DeepMind' wins over 'Google'.
+    """
+    alternatives = sorted({name.strip() for name in names if name.strip()}, key=len, reverse=True)
+    pattern = '|'.join(re.escape(name) for name in alternatives)
+    return re.compile(rf'(?<!\w)(?:{pattern})(?!\w)', re.IGNORECASE)
+
+
+class OrgMatcher:
+    """Compiled category matchers with a memoized classify()."""
+
+    def __init__(
+        self,
+        faang: Iterable[str],
+        frontier_labs: Iterable[str],
+        top_tech: Iterable[str],
+        universities: Iterable[str],
+        cache_size: int = 65536
+    ):
+        lists = [sorted(set(names)) for names in (faang, frontier_labs, top_tech, universities)]
+        faang, frontier_labs, top_tech, universities = lists
+        # Identifies the lists, so flags classified with other lists can be told apart
+        self.fingerprint = hashlib.sha1(json.dumps(lists).encode()).hexdigest()[:12]
+
+        # One pattern per category: a name can belong to several (e.g. 'Google DeepMind')
+        self._faang = compile_names(faang)
+        self._frontier_labs = compile_names(frontier_labs)
+        self._top_tech = compile_names(top_tech)
+        self._universities = compile_names(universities)
+        self.classify = lru_cache(maxsize=cache_size)(self._classify)
+
+    @classmethod
+    def from_config(cls) -> 'OrgMatcher':
+        """Build a matcher from the Config company and university lists."""
+        return cls(
+            Config.FAANG_COMPANIES,
+            Config.FRONTIER_LABS,
+            Config.TOP_TECH_COMPANIES,
+            Config.TOP_UNIVERSITIES,
+            cache_size=Config.ORG_CACHE_SIZE
+        )
+
+    def _classify(self, name: Optional[str]) -> OrgFlags:
+        if not name:
+            return NO_FLAGS
+        return OrgFlags(
+            is_faang=self._faang.search(name) is not None,
+            is_frontier_lab=self._frontier_labs.search(name) is not None,
+            is_top_tech=self._top_tech.search(name) is not None,
+            is_top_university=self._universities.search(name) is not None
+        )
+
+
+_matcher: Optional[OrgMatcher] = None
+
+
+def get_org_matcher() -> OrgMatcher:
+    """Get the process-wide matcher built from Config (shared memo cache)."""
+    global _matcher
+    if _matcher is None:
+        _matcher = OrgMatcher.from_config()
+    return _matcher
+
+
+def classify_org(name: Optional[str]) -> OrgFlags:
+    """Classify an organization name with the shared matcher."""
+    return get_org_matcher().classify(name)
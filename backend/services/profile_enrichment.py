@@ -4,7 +4,8 @@ Cross-references GitHub, X/Twitter, and LinkedIn profiles to build complete cand
 """
 
 import re
-from typing import Dict, Optional, List
+from typing import Dict, Iterable, Optional, List
+from models.candidate import Candidate
 from .github_analyzer import GitHubAnalyzer
 from .x_analyzer import XAnalyzer
 from .linkedin_scraper import LinkedInScraper
@@ -14,6 +15,19 @@ from .grok_client import GrokClient
 class ProfileEnrichment:
     """Service to enrich candidate profiles by cross-referencing multiple platforms."""
 
+    # Scored candidate fields that enrichment can fill in
+    ENRICHED_FIELDS = ('github_profile', 'x_profile')
+
+    # Profile fields a rediscovery can overwrite in merge_profiles()
+    MERGED_FIELDS = ('name', 'email', 'current_title', 'current_company', 'bio', 'linkedin_url',
+                     'x_profile', 'github_profile', 'experiences', 'education', 'publications')
+
+    # Upstream API calls every enrich_from_<source>() makes before any optional lookup
+    MIN_UPSTREAM_CALLS = {
+        'github': 4,  # GitHub profile, then calculate_github_stats(): profile, repositories, events
+        'x': 1        # X profile
+    }
+
     def __init__(self):
         self.github = GitHubAnalyzer()
         self.x_analyzer = XAnalyzer()
@@ -41,6 +55,7 @@ class ProfileEnrichment:
         enriched_profile = {
             'name': github_profile.get('name') or github_username,
             'email': github_profile.get('email'),
+            'bio': github_profile.get('bio'),
             'github_profile': self.github.calculate_github_stats(github_username),
             'sources': ['github']
         }
@@ -91,6 +106,7 @@ class ProfileEnrichment:
 
         enriched_profile = {
             'name': x_profile.get('name') or x_username,
+            'bio': x_profile.get('bio'),
             'x_profile': {
                 'username': x_profile['username'],
                 'bio': x_profile.get('bio'),
@@ -160,6 +176,40 @@ class ProfileEnrichment:
 
         return enriched_candidates
 
+    def merge_profiles(
+        self,
+        existing: Candidate,
+        incoming: Candidate,
+        fields: Optional[Iterable[str]] = None
+    ) -> Candidate:
+        """
+        Merge a rediscovered profile into the stored candidate.
+
+        Freshly fetched data wins: new GitHub/X stats replace the stored ones
+        and non-empty incoming fields overwrite stored fields. Stored data is
+        kept where the new discovery found nothing, and the stored id,
+        discovery metadata and recruiter notes are always preserved.
+        Scores are left for the caller to recompute.
+
+        Args:
+            existing: Candidate currently in the database
+            incoming: Newly discovered candidate for the same person
+            fields: Fields fetched for ``incoming`` (default MERGED_FIELDS);
+                every other field keeps its stored value
+
+        Returns:
+            Merged candidate carrying the stored id
+        """
+        merged = existing.model_copy(deep=True)
+
+        for field in fields or self.MERGED_FIELDS:
+            value = getattr(incoming, field)
+            if value:
+                setattr(merged, field, value)
+
+        merged.total_years_experience = max(existing.total_years_experience, incoming.total_years_experience)
+        return merged
+
     def _enrich_from_x(self, x_username: str) -> Optional[Dict]:
         """Helper to get X profile data."""
         x_profile = self.x_analyzer.get_user_profile(x_username)
@@ -0,0 +1,138 @@
+"""
+Rescore Job
+Recomputes stored scores for the whole candidate pool after SCORING_WEIGHTS
+or the company/university lists change
+"""
+
+import time
+from collections import Counter
+from typing import Callable, Dict, List, Optional
+from pydantic import ValidationError
+from models.candidate import Candidate, SCORE_COLUMNS
+from .database import Database
+from .scoring_service import ScoringService, SCORE_INPUTS
+
+# Score differences at or below this are float noise, not a change worth writing
+SCORE_TOLERANCE = 1e-9
+
+
+class Rescorer:
+    """Stream candidates by id, score them in batches and write back what changed."""
+
+    def __init__(
+        self,
+        database: Database,
+        scoring_service: Optional[ScoringService] = None,
+        batch_size: int = 2000
+    ):
+        self.database = database
+        self.scoring = scoring_service or ScoringService()
+        self.batch_size = batch_size
+
+    def run(
+        self,
+        after: Optional[str] = None,
+        limit: Optional[int] = None,
+        on_batch: Optional[Callable[[Dict], None]] = None
+    ) -> Dict:
+        """
+        Rescore candidates in id order.
+
+        Experience and education entries classified with older company lists
+        (or never classified) are reclassified and written back along with
+        the scores.
+
+        Every batch is committed before the next one is read, and the report's
+        ``last_id`` is the last candidate of the last committed batch, so an
+        interrupted or limited run resumes with ``after=report['last_id']``.
+
+        Args:
+            after: Resume after this candidate id
+            limit: Stop after this many candidates (None for the whole pool)
+            on_batch: Called with the running report after every batch
+
+        Returns:
+            Report with rows read, changed, unchanged, reclassified, invalid
+            and failed counts, the resume point (``last_id``), whether the pool is
+            finished (``done``), old->new tier moves, elapsed seconds and rows
+            per second
+        """
+        report = {
+            'rows': 0,
+            'changed': 0,
+            'unchanged': 0,
+            'reclassified': 0,
+            'invalid': 0,
+            'failed': 0,
+            'last_id': after,
+            'done': False,
+            'tier_changes': {},
+            'seconds': 0.0,
+            'rows_per_sec': 0.0
+        }
+        start = time.perf_counter()
+        tier_changes = Counter()
+
+        for rows in self.database.iter_score_inputs(after, batch_size=self.batch_size, limit=limit):
+            if not self._rescore(rows, report, tier_changes):
+                break
+            report['last_id'] = rows[-1]['id']
+            report['tier_changes'] = dict(tier_changes.most_common())
+
+            self._update_timing(report, start)
+            if on_batch:
+                on_batch(report)
+        else:
+            report['done'] = limit is None or report['rows'] < limit
+
+        self._update_timing(report, start)
+        return report
+
+    def _rescore(self, rows: List[Dict], report: Dict, tier_changes: Counter) -> bool:
+        """Score one batch and write the changed rows; False if the write failed."""
+        candidates, stored, reclassified, invalid = [], [], [], 0
+        for row in rows:
+            inputs = {field: row[field] for field in SCORE_INPUTS if row[field] is not None}
+            try:
+                candidate = Candidate(id=row['id'], name='', **inputs)
+            except ValidationError:
+                invalid += 1
+                continue
+            candidates.append(candidate)
+            stored.append(row)
+            reclassified.append(self.scoring.classify_history(candidate))
+
+        scores, tiers = self.scoring.score_batch(candidates)
+        changed, moves = [], Counter()
+        for candidate, row, score, tier, history in zip(candidates, stored, scores, tiers, reclassified):
+            new = {name: getattr(score, name) for name in SCORE_COLUMNS}
+            if not history and tier == row['priority_tier'] and all(
+                row[name] is not None and abs(new[name] - row[name]) <= SCORE_TOLERANCE
+                for name in SCORE_COLUMNS
+            ):
+                continue
+            update = {'id': row['id'], 'priority_tier': tier, **new}
+            if history:
+                update['experiences'] = [exp.dict() for exp in candidate.experiences]
+                update['education'] = [edu.dict() for edu in candidate.education]
+            changed.append(update)
+            if tier != row['priority_tier']:
+                moves[f"{row['priority_tier']}->{tier}"] += 1
+
+        if self.database.write_scores(changed) is None:
+            report['failed'] += len(rows)
+            return False
+
+        report['rows'] += len(rows)
+        report['changed'] += len(changed)
+        report['unchanged'] += len(stored) - len(changed)
+        report['reclassified'] += sum(reclassified)
+        report['invalid'] += invalid
+        tier_changes.update(moves)
+        return True
+
+    def _update_timing(self, report: Dict, start: float) -> None:
+        """Refresh elapsed time and throughput."""
+        elapsed = time.perf_counter() - start
+        report['seconds'] = round(elapsed, 3)
+        report['rows_per_sec'] = round(report['rows'] / elapsed, 1) if elapsed > 0 else 0.0
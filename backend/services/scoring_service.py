@@ -1,6 +1,89 @@
-from typing import Dict, List
+import hashlib
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+import numpy as np
 from models.candidate import Candidate, CandidateScore, Experience, Education, GitHubStats
 from config import Config
+from .org_matcher import get_org_matcher
+
+# Config.SCORING_WEIGHTS key of each sub-score, in total_score summation order
+SCORE_WEIGHT_KEYS = {
+    'faang_score': 'faang_experience',
+    'frontier_labs_score': 'frontier_labs_experience',
+    'top_tech_score': 'top_tech_companies',
+    'github_score': 'github_activity',
+    'x_engagement_score': 'x_engagement',
+    'research_score': 'research_publications',
+    'education_score': 'education_tier',
+    'experience_score': 'years_experience',
+    'open_source_score': 'open_source_contributions',
+    'leadership_score': 'leadership_roles'
+}
+
+# Sub-scores that depend on each candidate field
+SCORE_INPUTS = {
+    'experiences': ('faang_score', 'frontier_labs_score', 'top_tech_score', 'leadership_score'),
+    'github_profile': ('github_score', 'open_source_score'),
+    'x_profile': ('x_engagement_score',),
+    'publications': ('research_score',),
+    'education': ('education_score',),
+    'total_years_experience': ('experience_score',)
+}
+
+# Title words that mark a leadership role
+LEADERSHIP_KEYWORDS = (
+    'lead', 'principal', 'staff', 'senior', 'director',
+    'manager', 'head', 'vp', 'chief', 'architect'
+)
+
+# Title words that mark a senior role
+SENIOR_KEYWORDS = ('senior', 'staff', 'principal', 'lead', 'director', 'architect')
+
+# Minimum total_score per priority tier, best first ("low" otherwise)
+TIER_THRESHOLDS = (('top', 75), ('high', 60), ('medium', 40))
+
+# Every sub-score is capped at this
+SUB_SCORE_MAX = 100.0
+
+
+class TitleFlags(NamedTuple):
+    """What a job title says about the role."""
+    leadership_points: Optional[int]  # None: not a leadership role
+    is_senior: bool
+    is_research: bool
+
+
+class ExperienceFlags(NamedTuple):
+    """Scoring flags of one experience entry (see Experience)."""
+    is_faang: bool
+    is_frontier_lab: bool
+    is_top_tech: bool
+    leadership_points: Optional[int]
+    is_senior: bool
+    is_research: bool
+
+
+@lru_cache(maxsize=Config.ORG_CACHE_SIZE)
+def classify_title(title: Optional[str]) -> TitleFlags:
+    """Parse leadership level, seniority and research focus from a job title."""
+    title_lower = (title or '').lower()
+
+    if not any(keyword in title_lower for keyword in LEADERSHIP_KEYWORDS):
+        points = None
+    elif 'director' in title_lower or 'vp' in title_lower or 'chief' in title_lower:
+        points = 30
+    elif 'principal' in title_lower or 'staff' in title_lower:
+        points = 20
+    elif 'lead' in title_lower or 'senior' in title_lower:
+        points = 10
+    else:
+        points = 0
+
+    return TitleFlags(
+        leadership_points=points,
+        is_senior=any(keyword in title_lower for keyword in SENIOR_KEYWORDS),
+        is_research='research' in title_lower
+    )
 
 
 class ScoringService:
@@ -12,6 +95,11 @@ class ScoringService:
         self.frontier_labs = Config.FRONTIER_LABS
         self.top_tech_companies = Config.TOP_TECH_COMPANIES
         self.top_universities = Config.TOP_UNIVERSITIES
+        self.org_matcher = get_org_matcher()
+        # Stamped on classified experience/education entries; changes with the lists or title keywords
+        self.classification_key = hashlib.sha1(
+            repr((self.org_matcher.fingerprint, LEADERSHIP_KEYWORDS, SENIOR_KEYWORDS)).encode()
+        ).hexdigest()[:12]
 
     def score_candidate(self, candidate: Candidate) -> CandidateScore:
         """
@@ -23,56 +111,247 @@ class ScoringService:
         Returns:
             CandidateScore object with detailed scoring breakdown
         """
-        score = CandidateScore()
+        score = CandidateScore(**self.score_fields(candidate, SCORE_INPUTS))
+        score.total_score = self.weighted_total(score.dict())
 
-        # Score FAANG experience
-        score.faang_score = self._score_faang_experience(candidate.experiences)
+        return score
 
-        # Score Frontier Labs experience
-        score.frontier_labs_score = self._score_frontier_labs_experience(candidate.experiences)
+    def score_fields(self, candidate: Candidate, fields: Iterable[str]) -> Dict[str, float]:
+        """
+        Recompute only the sub-scores that depend on the given fields.
 
-        # Score top tech companies experience
-        score.top_tech_score = self._score_top_tech_experience(candidate.experiences)
+        Args:
+            candidate: Candidate carrying (at least) the values of ``fields``
+            fields: Changed candidate fields; see SCORE_INPUTS
 
-        # Score GitHub activity
-        if candidate.github_profile:
-            score.github_score = self._score_github(candidate.github_profile)
+        Returns:
+            New value of each affected sub-score column
+        """
+        affected = {name for field in fields for name in SCORE_INPUTS.get(field, ())}
+        experiences = candidate.experiences
+        github = candidate.github_profile
+        scorers = {
+            'faang_score': lambda: self._score_faang_experience(experiences),
+            'frontier_labs_score': lambda: self._score_frontier_labs_experience(experiences),
+            'top_tech_score': lambda: self._score_top_tech_experience(experiences),
+            'github_score': lambda: self._score_github(github) if github else 0.0,
+            'x_engagement_score': lambda: (
+                self._score_x_engagement(candidate.x_profile.engagement_score) if candidate.x_profile else 0.0
+            ),
+            'research_score': lambda: self._score_research(candidate.publications),
+            'education_score': lambda: self._score_education(candidate.education),
+            'experience_score': lambda: self._score_years_experience(candidate.total_years_experience),
+            'open_source_score': lambda: self._score_open_source(github) if github else 0.0,
+            'leadership_score': lambda: self._score_leadership(experiences)
+        }
+        return {name: scorer() for name, scorer in scorers.items() if name in affected}
+
+    def score_upper_bound(self, candidate: Candidate, pending: Iterable[str] = ()) -> float:
+        """
+        Highest total_score a partially known candidate could still reach.
 
-        # Score X/Twitter engagement
-        if candidate.x_profile:
-            score.x_engagement_score = self._score_x_engagement(candidate.x_profile.engagement_score)
+        Sub-scores fed by a ``pending`` field (one that enrichment may still
+        fill in; see SCORE_INPUTS) count at SUB_SCORE_MAX. All others are
+        computed from what the candidate already carries.
 
-        # Score research publications
-        score.research_score = self._score_research(candidate.publications)
+        Args:
+            candidate: Candidate with the data known so far
+            pending: Candidate fields that are not known yet
 
-        # Score education
-        score.education_score = self._score_education(candidate.education)
+        Returns:
+            Optimistic total_score
+        """
+        pending = set(pending)
+        sub_scores = self.score_fields(candidate, set(SCORE_INPUTS) - pending)
+        sub_scores.update({name: SUB_SCORE_MAX for field in pending for name in SCORE_INPUTS.get(field, ())})
+        return self.weighted_total(sub_scores)
 
-        # Score years of experience
-        score.experience_score = self._score_years_experience(candidate.total_years_experience)
+    def can_reach_tier(self, candidate: Candidate, tier: str, pending: Iterable[str] = ()) -> bool:
+        """
+        Check whether a partially known candidate could still end up in ``tier`` or better.
 
-        # Score open source contributions
-        if candidate.github_profile:
-            score.open_source_score = self._score_open_source(candidate.github_profile)
+        Raises:
+            ValueError: If ``tier`` is not a priority tier
+        """
+        if tier == 'low':
+            return True
+        thresholds = dict(TIER_THRESHOLDS)
+        if tier not in thresholds:
+            raise ValueError(f"Unknown priority tier: {tier}")
+        return self.score_upper_bound(candidate, pending) >= thresholds[tier]
+
+    def weighted_total(self, sub_scores: Dict) -> float:
+        """Combine sub-scores (by column name) into total_score using the configured weights."""
+        total = 0.0
+        for name, weight_key in SCORE_WEIGHT_KEYS.items():
+            total += sub_scores[name] * self.weights[weight_key] / 100
+        return total
+
+    def score_batch(self, candidates: List[Candidate]) -> Tuple[List[CandidateScore], List[str]]:
+        """
+        Score many candidates at once.
 
-        # Score leadership roles
-        score.leadership_score = self._score_leadership(candidate.experiences)
+        Produces exactly the scores and tiers score_candidate() and
+        determine_priority_tier() would, one candidate at a time.
 
-        # Calculate weighted total score
-        score.total_score = (
-            score.faang_score * self.weights['faang_experience'] / 100 +
-            score.frontier_labs_score * self.weights['frontier_labs_experience'] / 100 +
-            score.top_tech_score * self.weights['top_tech_companies'] / 100 +
-            score.github_score * self.weights['github_activity'] / 100 +
-            score.x_engagement_score * self.weights['x_engagement'] / 100 +
-            score.research_score * self.weights['research_publications'] / 100 +
-            score.education_score * self.weights['education_tier'] / 100 +
-            score.experience_score * self.weights['years_experience'] / 100 +
-            score.open_source_score * self.weights['open_source_contributions'] / 100 +
-            score.leadership_score * self.weights['leadership_roles'] / 100
+        Args:
+            candidates: Candidates to score
+
+        Returns:
+            (CandidateScore per candidate, priority tier per candidate)
+        """
+        columns = self.score_arrays(candidates)
+        tiers = self.priority_tiers(columns['total_score'])
+        names = list(columns)
+        rows = zip(*(columns[name].tolist() for name in names))
+        # Values are already plain floats; skip re-validation
+        return [CandidateScore.model_construct(**dict(zip(names, row))) for row in rows], tiers.tolist()
+
+    def score_arrays(self, candidates: List[Candidate]) -> Dict[str, np.ndarray]:
+        """
+        Compute every score column for a batch as NumPy arrays.
+
+        Features are extracted from the candidates in one pass; each sub-score
+        and the weighted total are then array expressions that mirror the
+        scalar _score_* methods operation for operation, so results match
+        score_candidate() bit for bit.
+
+        Returns:
+            Score column name (see SCORE_COLUMNS) -> float64 array, in input order
+        """
+        f = self._extract_features(candidates)
+        scores = {}
+
+        faang = 50.0 + np.minimum(f['faang_months'] / 36 * 30, 30) + np.where(f['faang_senior'], 20, 0)
+        scores['faang_score'] = np.where(f['has_faang'], np.minimum(faang, 100), 0.0)
+
+        frontier = 60.0 + np.minimum(f['frontier_months'] / 24 * 30, 30) + np.where(f['frontier_research'], 10, 0)
+        scores['frontier_labs_score'] = np.where(f['has_frontier'], np.minimum(frontier, 100), 0.0)
+
+        top_tech = (
+            40.0 + np.minimum(f['top_tech_months'] / 36 * 40, 40)
+            + np.minimum(f['top_tech_companies'] * 5, 20)
         )
+        scores['top_tech_score'] = np.where(f['top_tech_companies'] > 0, np.minimum(top_tech, 100), 0.0)
+
+        github = 0.0 + np.minimum(f['followers'] / 500 * 20, 20)
+        github = github + np.minimum(f['stars'] / 1000 * 30, 30)
+        github = github + np.minimum(f['contributions'] / 500 * 25, 25)
+        github = github + np.minimum(f['notable_projects'] * 3, 15)
+        github = github + np.minimum(f['repos'] / 50 * 10, 10)
+        scores['github_score'] = np.where(f['has_github'], np.minimum(github, 100), 0.0)
+
+        scores['x_engagement_score'] = np.where(f['has_x'], np.minimum(f['engagement'], 100), 0.0)
+
+        research = 0.0 + np.minimum(f['publications'] * 10, 40)
+        research = research + np.minimum(f['citations'] / 100 * 40, 40)
+        research = research + np.minimum(f['recent_publications'] * 5, 20)
+        scores['research_score'] = np.where(f['publications'] > 0, np.minimum(research, 100), 0.0)
+
+        education = np.where(
+            f['has_top_university'],
+            60.0 + f['top_degree_points'],
+            30.0 + np.where(f['advanced_degree'], 20, 0)
+        )
+        scores['education_score'] = np.where(f['education'] > 0, np.minimum(education, 100), 0.0)
 
-        return score
+        years = f['years']
+        scores['experience_score'] = np.select(
+            [years <= 0, years < 2, years < 5, years < 15],
+            [0.0, years * 25, 50 + (years - 2) * 10, 80 + (years - 5) * 2],
+            100.0
+        )
+
+        open_source = 0.0 + np.minimum(f['repos'] / 30 * 30, 30)
+        open_source = open_source + np.minimum(f['stars'] / 500 * 40, 40)
+        open_source = open_source + np.minimum(f['notable_projects'] * 6, 30)
+        scores['open_source_score'] = np.where(f['has_github'], np.minimum(open_source, 100), 0.0)
+
+        leadership = 40.0 + f['leadership_points'] + np.minimum(f['leadership_months'] / 36 * 20, 20)
+        scores['leadership_score'] = np.where(f['has_leadership'], np.minimum(leadership, 100), 0.0)
+
+        total = np.zeros(len(candidates))
+        for name, weight_key in SCORE_WEIGHT_KEYS.items():
+            total = total + scores[name] * self.weights[weight_key] / 100
+
+        return {'total_score': total, **{name: scores[name].astype(np.float64) for name in SCORE_WEIGHT_KEYS}}
+
+    def priority_tiers(self, totals: np.ndarray) -> np.ndarray:
+        """Vectorized determine_priority_tier() over an array of total scores."""
+        return np.select(
+            [totals >= threshold for _, threshold in TIER_THRESHOLDS],
+            [tier for tier, _ in TIER_THRESHOLDS],
+            'low'
+        )
+
+    def _extract_features(self, candidates: List[Candidate]) -> Dict[str, np.ndarray]:
+        """Flatten the inputs of every sub-score into one array per feature."""
+        names = [
+            'has_faang', 'faang_months', 'faang_senior',
+            'has_frontier', 'frontier_months', 'frontier_research',
+            'top_tech_months', 'top_tech_companies',
+            'has_github', 'followers', 'stars', 'contributions', 'notable_projects', 'repos',
+            'has_x', 'engagement',
+            'publications', 'citations', 'recent_publications',
+            'education', 'has_top_university', 'top_degree_points', 'advanced_degree',
+            'years', 'has_leadership', 'leadership_points', 'leadership_months'
+        ]
+        rows = []
+
+        for candidate in candidates:
+            faang, frontier, top_tech, leadership = [], [], [], []
+            for exp in candidate.experiences:
+                flags = self._experience_flags(exp)
+                if flags.is_faang:
+                    faang.append((exp, flags))
+                if flags.is_frontier_lab:
+                    frontier.append((exp, flags))
+                if flags.is_top_tech and not flags.is_faang and not flags.is_frontier_lab:
+                    top_tech.append((exp, flags))
+                if flags.leadership_points is not None:
+                    leadership.append((exp, flags))
+
+            github = candidate.github_profile
+            x_profile = candidate.x_profile
+            publications = candidate.publications
+            education = candidate.education
+            top_education = []
+            for edu in education:
+                if self._is_top_education(edu):
+                    top_education.append(edu)
+
+            rows.append((
+                bool(faang),
+                sum(exp.duration_months for exp, _ in faang),
+                any(flags.is_senior for _, flags in faang),
+                bool(frontier),
+                sum(exp.duration_months for exp, _ in frontier),
+                any(flags.is_research for _, flags in frontier),
+                sum(exp.duration_months for exp, _ in top_tech),
+                len(set(exp.company for exp, _ in top_tech)),
+                github is not None,
+                github.followers if github else 0,
+                github.total_stars if github else 0,
+                github.contributions_last_year if github else 0,
+                len(github.notable_projects) if github else 0,
+                github.public_repos if github else 0,
+                x_profile is not None,
+                x_profile.engagement_score if x_profile else 0.0,
+                len(publications),
+                sum(pub.citations for pub in publications if pub.citations),
+                sum(1 for pub in publications if pub.year and pub.year >= 2022),
+                len(education),
+                bool(top_education),
+                sum(self._degree_points(edu.degree) for edu in top_education),
+                any(edu.degree and ('PhD' in edu.degree or 'Master' in edu.degree) for edu in education),
+                candidate.total_years_experience,
+                bool(leadership),
+                sum(flags.leadership_points for _, flags in leadership),
+                sum(exp.duration_months for exp, _ in leadership)
+            ))
+
+        columns = list(zip(*rows)) if rows else [()] * len(names)
+        return {name: np.array(column, dtype=float) for name, column in zip(names, columns)}
 
     def determine_priority_tier(self, score: CandidateScore) -> str:
         """
@@ -86,21 +365,17 @@ class ScoringService:
         """
         total = score.total_score
 
-        if total >= 75:
-            return "top"
-        elif total >= 60:
-            return "high"
-        elif total >= 40:
-            return "medium"
-        else:
-            return "low"
+        for tier, threshold in TIER_THRESHOLDS:
+            if total >= threshold:
+                return tier
+        return "low"
 
     def _score_faang_experience(self, experiences: List[Experience]) -> float:
         """Score FAANG company experience (0-100)."""
         if not experiences:
             return 0.0
 
-        faang_exp = [exp for exp in experiences if self._is_faang_company(exp.company)]
+        faang_exp = [exp for exp in experiences if self._experience_flags(exp).is_faang]
 
         if not faang_exp:
             return 0.0
@@ -113,7 +388,7 @@ class ScoringService:
         score += min((total_months / 36) * 30, 30)  # Up to 30 points for 3+ years
 
         # Add points for seniority
-        senior_roles = [exp for exp in faang_exp if self._is_senior_role(exp.title)]
+        senior_roles = [exp for exp in faang_exp if self._experience_flags(exp).is_senior]
         if senior_roles:
             score += 20
 
@@ -124,7 +399,7 @@ class ScoringService:
         if not experiences:
             return 0.0
 
-        frontier_exp = [exp for exp in experiences if self._is_frontier_lab(exp.company)]
+        frontier_exp = [exp for exp in experiences if self._experience_flags(exp).is_frontier_lab]
 
         if not frontier_exp:
             return 0.0
@@ -137,7 +412,7 @@ class ScoringService:
         score += min((total_months / 24) * 30, 30)  # Up to 30 points for 2+ years
 
         # Add points for research roles
-        research_roles = [exp for exp in frontier_exp if 'research' in exp.title.lower()]
+        research_roles = [exp for exp in frontier_exp if self._experience_flags(exp).is_research]
         if research_roles:
             score += 10
 
@@ -148,12 +423,11 @@ class ScoringService:
         if not experiences:
             return 0.0
 
-        top_tech_exp = [
-            exp for exp in experiences
-            if self._is_top_tech_company(exp.company)
-            and not self._is_faang_company(exp.company)
-            and not self._is_frontier_lab(exp.company)
-        ]
+        top_tech_exp = []
+        for exp in experiences:
+            flags = self._experience_flags(exp)
+            if flags.is_top_tech and not flags.is_faang and not flags.is_frontier_lab:
+                top_tech_exp.append(exp)
 
         if not top_tech_exp:
             return 0.0
@@ -225,19 +499,13 @@ class ScoringService:
         score = 0.0
 
         # Top university (max 60 points)
-        top_uni_degrees = [edu for edu in education if self._is_top_university(edu.institution)]
+        top_uni_degrees = [edu for edu in education if self._is_top_education(edu)]
         if top_uni_degrees:
             score += 60
 
             # Add points for advanced degrees
             for edu in top_uni_degrees:
-                if edu.degree:
-                    if 'PhD' in edu.degree or 'Ph.D' in edu.degree:
-                        score += 30
-                    elif 'Master' in edu.degree or 'MS' in edu.degree or 'M.S' in edu.degree:
-                        score += 20
-                    elif 'Bachelor' in edu.degree or 'BS' in edu.degree or 'B.S' in edu.degree:
-                        score += 10
+                score += self._degree_points(edu.degree)
 
         else:
             # Any degree gets base points
@@ -287,15 +555,11 @@ class ScoringService:
         if not experiences:
             return 0.0
 
-        leadership_keywords = [
-            'lead', 'principal', 'staff', 'senior', 'director',
-            'manager', 'head', 'vp', 'chief', 'architect'
-        ]
-
-        leadership_roles = [
-            exp for exp in experiences
-            if any(keyword in exp.title.lower() for keyword in leadership_keywords)
-        ]
+        leadership_roles = []
+        for exp in experiences:
+            points = self._experience_flags(exp).leadership_points
+            if points is not None:
+                leadership_roles.append((exp, points))
 
         if not leadership_roles:
             return 0.0
@@ -304,48 +568,107 @@ class ScoringService:
         score = 40.0
 
         # Add points for seniority level
-        for exp in leadership_roles:
-            title_lower = exp.title.lower()
-            if 'director' in title_lower or 'vp' in title_lower or 'chief' in title_lower:
-                score += 30
-            elif 'principal' in title_lower or 'staff' in title_lower:
-                score += 20
-            elif 'lead' in title_lower or 'senior' in title_lower:
-                score += 10
+        for _, points in leadership_roles:
+            score += points
 
         # Add points for duration in leadership
-        total_months = sum(exp.duration_months for exp in leadership_roles)
+        total_months = sum(exp.duration_months for exp, _ in leadership_roles)
         score += min((total_months / 36) * 20, 20)
 
         return min(score, 100)
 
-    def _is_faang_company(self, company: str) -> bool:
-        """Check if company is FAANG."""
-        if not company:
-            return False
-        return any(faang.lower() in company.lower() for faang in self.faang_companies)
-
-    def _is_frontier_lab(self, company: str) -> bool:
-        """Check if company is a frontier AI lab."""
-        if not company:
-            return False
-        return any(lab.lower() in company.lower() for lab in self.frontier_labs)
-
-    def _is_top_tech_company(self, company: str) -> bool:
-        """Check if company is a top tech company."""
-        if not company:
-            return False
-        return any(tech.lower() in company.lower() for tech in self.top_tech_companies)
-
-    def _is_top_university(self, institution: str) -> bool:
-        """Check if institution is a top university."""
-        if not institution:
-            return False
-        return any(uni.lower() in institution.lower() for uni in self.top_universities)
-
-    def _is_senior_role(self, title: str) -> bool:
-        """Check if title indicates a senior role."""
-        if not title:
-            return False
-        senior_keywords = ['senior', 'staff', 'principal', 'lead', 'director', 'architect']
-        return any(keyword in title.lower() for keyword in senior_keywords)
+    def classify_company(self, company: str) -> Dict[str, bool]:
+        """
+        Classify an employer into the scored company categories.
+
+        Returns:
+            {'is_faang', 'is_frontier_lab', 'is_top_tech'} flags, as stored on
+            candidate_experiences rows
+        """
+        flags = self.org_matcher.classify(company)
+        return {
+            'is_faang': flags.is_faang,
+            'is_frontier_lab': flags.is_frontier_lab,
+            'is_top_tech': flags.is_top_tech
+        }
+
+    def is_top_university(self, institution: str) -> bool:
+        """Check if institution is one of the configured top universities."""
+        return self.org_matcher.classify(institution).is_top_university
+
+    def classify_history(self, candidate: Candidate, force: bool = False) -> bool:
+        """
+        Stamp classification flags on a candidate's experience and education entries.
+
+        Entries already classified with the current lists (matching
+        classification_key) are left alone, so this is cheap to call on every
+        write. Scoring then reads the stored flags instead of matching text.
+
+        The key only identifies the lists, not the entry's company or title,
+        so it vouches for flags read back from the database and nothing else.
+
+        Args:
+            candidate: Candidate to classify in place
+            force: Reclassify every entry; use for client input, whose flags
+                   may be stale (edited company/title) or forged
+
+        Returns:
+            Whether any entry was (re)classified
+        """
+        changed = False
+        for index, exp in enumerate(candidate.experiences):
+            if force or exp.classification_key != self.classification_key:
+                candidate.experiences[index] = self._stamp(exp, self._classify_experience(exp)._asdict())
+                changed = True
+
+        for index, edu in enumerate(candidate.education):
+            if force or edu.classification_key != self.classification_key:
+                flags = {'is_top_university': self.is_top_university(edu.institution)}
+                candidate.education[index] = self._stamp(edu, flags)
+                changed = True
+        return changed
+
+    def _stamp(self, entry, flags: Dict):
+        """
+        Return a copy of an entry carrying flags and the classification key.
+
+        model_copy(update=...) sets every field in one step, about three times
+        faster than assigning them one by one.
+        """
+        return entry.model_copy(update={**flags, 'classification_key': self.classification_key})
+
+    def _experience_flags(self, exp: Experience) -> ExperienceFlags:
+        """Stored flags of an experience entry, classified on the fly when missing or stale."""
+        if exp.classification_key == self.classification_key:
+            return ExperienceFlags(
+                exp.is_faang, exp.is_frontier_lab, exp.is_top_tech,
+                exp.leadership_points, exp.is_senior, exp.is_research
+            )
+        return self._classify_experience(exp)
+
+    def _classify_experience(self, exp: Experience) -> ExperienceFlags:
+        """Classify an experience entry from its company and title."""
+        org = self.org_matcher.classify(exp.company)
+        title = classify_title(exp.title)
+        return ExperienceFlags(
+            org.is_faang, org.is_frontier_lab, org.is_top_tech,
+            title.leadership_points, title.is_senior, title.is_research
+        )
+
+    def _is_top_education(self, edu: Education) -> bool:
+        """Stored top-university flag of an education entry, classified on the fly when missing or stale."""
+        if edu.classification_key == self.classification_key:
+            return edu.is_top_university
+        return self.is_top_university(edu.institution)
+
+    def _degree_points(self, degree: str) -> int:
+        """Education bonus for a degree from a top university."""
+        if not degree:
+            return 0
+        if 'PhD' in degree or 'Ph.D' in degree:
+            return 30
+        if 'Master' in degree or 'MS' in degree or 'M.S' in degree:
+            return 20
+        if 'Bachelor' in degree or 'BS' in degree or 'B.S' in degree:
+            return 10
+        return 0
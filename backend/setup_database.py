@@ -25,6 +25,8 @@ def setup_database():
 
     # SQL to create the table
     sql = """
+    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
     CREATE TABLE IF NOT EXISTS candidates (
         id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
         name TEXT NOT NULL,
@@ -34,21 +36,91 @@ def setup_database():
         linkedin_url TEXT,
         current_title TEXT,
         current_company TEXT,
+        current_company_key TEXT,
+        bio TEXT,
         experiences JSONB,
         total_years_experience NUMERIC DEFAULT 0,
         education JSONB,
         publications JSONB,
-        score JSONB,
+        total_score DOUBLE PRECISION NOT NULL DEFAULT 0,
+        faang_score DOUBLE PRECISION NOT NULL DEFAULT 0,
+        frontier_labs_score DOUBLE PRECISION NOT NULL DEFAULT 0,
+        top_tech_score DOUBLE PRECISION NOT NULL DEFAULT 0,
+        github_score DOUBLE PRECISION NOT NULL DEFAULT 0,
+        x_engagement_score DOUBLE PRECISION NOT NULL DEFAULT 0,
+        research_score DOUBLE PRECISION NOT NULL DEFAULT 0,
+        education_score DOUBLE PRECISION NOT NULL DEFAULT 0,
+        experience_score DOUBLE PRECISION NOT NULL DEFAULT 0,
+        open_source_score DOUBLE PRECISION NOT NULL DEFAULT 0,
+        leadership_score DOUBLE PRECISION NOT NULL DEFAULT 0,
         priority_tier TEXT DEFAULT 'low',
         discovered_from TEXT,
         discovery_date TIMESTAMP DEFAULT NOW(),
         last_updated TIMESTAMP DEFAULT NOW(),
         notes TEXT,
+        github_username TEXT,
+        x_username TEXT,
+        linkedin_slug TEXT,
+        search_document TEXT,
         CONSTRAINT priority_tier_check CHECK (priority_tier IN ('low', 'medium', 'high', 'top'))
     );
 
     CREATE INDEX IF NOT EXISTS idx_candidates_priority_tier ON candidates(priority_tier);
-    CREATE INDEX IF NOT EXISTS idx_candidates_score ON candidates((score->>'total_score') DESC);
+    CREATE INDEX IF NOT EXISTS idx_candidates_total_score ON candidates(total_score DESC, id DESC);
+    CREATE INDEX IF NOT EXISTS idx_candidates_tier_total_score ON candidates(priority_tier, total_score DESC, id DESC);
+    CREATE UNIQUE INDEX IF NOT EXISTS uq_candidates_github_username ON candidates(github_username) WHERE github_username IS NOT NULL;
+    CREATE UNIQUE INDEX IF NOT EXISTS uq_candidates_x_username ON candidates(x_username) WHERE x_username IS NOT NULL;
+    CREATE UNIQUE INDEX IF NOT EXISTS uq_candidates_linkedin_slug ON candidates(linkedin_slug) WHERE linkedin_slug IS NOT NULL;
+    CREATE INDEX IF NOT EXISTS idx_candidates_last_updated ON candidates(last_updated, id);
+
+    CREATE INDEX IF NOT EXISTS idx_candidates_current_company_key ON candidates(current_company_key);
+    CREATE INDEX IF NOT EXISTS idx_candidates_github_stars ON candidates(((github_profile->>'total_stars')::int));
+    CREATE INDEX IF NOT EXISTS idx_candidates_github_followers ON candidates(((github_profile->>'followers')::int));
+    CREATE INDEX IF NOT EXISTS idx_candidates_github_languages ON candidates USING gin ((lower(github_profile->>'top_languages')::jsonb));
+    CREATE INDEX IF NOT EXISTS idx_candidates_search_fts ON candidates USING gin (to_tsvector('simple', search_document));
+    CREATE INDEX IF NOT EXISTS idx_candidates_search_trgm ON candidates USING gin (search_document gin_trgm_ops);
+
+    CREATE TABLE IF NOT EXISTS candidate_experiences (
+        id SERIAL PRIMARY KEY,
+        candidate_id UUID NOT NULL REFERENCES candidates(id) ON DELETE CASCADE,
+        position INTEGER NOT NULL,
+        company TEXT NOT NULL,
+        company_key TEXT,
+        title TEXT,
+        duration_months INTEGER NOT NULL DEFAULT 0,
+        is_faang BOOLEAN NOT NULL DEFAULT FALSE,
+        is_frontier_lab BOOLEAN NOT NULL DEFAULT FALSE,
+        is_top_tech BOOLEAN NOT NULL DEFAULT FALSE
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_experiences_candidate ON candidate_experiences(candidate_id);
+    CREATE INDEX IF NOT EXISTS idx_experiences_company ON candidate_experiences(company_key, candidate_id, duration_months);
+    CREATE INDEX IF NOT EXISTS idx_experiences_faang ON candidate_experiences(candidate_id, duration_months) WHERE is_faang;
+    CREATE INDEX IF NOT EXISTS idx_experiences_frontier_lab ON candidate_experiences(candidate_id, duration_months) WHERE is_frontier_lab;
+    CREATE INDEX IF NOT EXISTS idx_experiences_top_tech ON candidate_experiences(candidate_id, duration_months) WHERE is_top_tech;
+
+    CREATE TABLE IF NOT EXISTS candidate_education (
+        id SERIAL PRIMARY KEY,
+        candidate_id UUID NOT NULL REFERENCES candidates(id) ON DELETE CASCADE,
+        position INTEGER NOT NULL,
+        institution TEXT NOT NULL,
+        institution_key TEXT,
+        degree TEXT,
+        field TEXT,
+        end_year INTEGER,
+        is_top_university BOOLEAN NOT NULL DEFAULT FALSE
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_education_candidate ON candidate_education(candidate_id);
+    CREATE INDEX IF NOT EXISTS idx_education_institution ON candidate_education(institution_key, candidate_id);
+    CREATE INDEX IF NOT EXISTS idx_education_top_university ON candidate_education(candidate_id) WHERE is_top_university;
+
+    CREATE TABLE IF NOT EXISTS candidate_tombstones (
+        id TEXT PRIMARY KEY,
+        deleted_at TIMESTAMP NOT NULL DEFAULT NOW()
+    );
+
+    CREATE INDEX IF NOT EXISTS idx_candidate_tombstones_deleted_at ON candidate_tombstones(deleted_at, id);
     """
 
     try:
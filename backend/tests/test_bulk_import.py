@@ -0,0 +1,49 @@
+import json
+import pytest
+from services.bulk_import import BulkImporter
+from services.database import Database
+
+
+@pytest.fixture
+def database(tmp_path):
+    db = Database(f"sqlite:///{tmp_path / 'candidates.db'}")
+    db.init_schema()
+    return db
+
+
+def _line(name, github=None, x=None, **fields):
+    record = {'name': name, **fields}
+    if github:
+        record['github_profile'] = {'username': github, 'url': f'https://github.com/{github}'}
+    if x:
+        record['x_profile'] = {'platform': 'X/Twitter', 'username': x, 'url': f'https://x.com/{x}'}
+    return json.dumps(record)
+
+
+def test_lines_sharing_a_handle_are_merged(database):
+    report = BulkImporter(database).import_lines([
+        _line('Ada', github='ada', bio='first'),
+        _line('Grace', github='grace'),
+        _line('Ada Lovelace', github='Ada', x='ada_x')
+    ])
+
+    assert report['imported'] == 2
+    assert report['merged'] == 1
+    assert report['failed'] == 0
+    [ada] = [c for c in database.search_candidates(limit=10) if c.github_profile.username != 'grace']
+    assert ada.name == 'Ada Lovelace'
+    assert ada.bio == 'first'
+    assert ada.x_profile.username == 'ada_x'
+
+
+def test_line_naming_two_people_is_invalid(database):
+    report = BulkImporter(database).import_lines([
+        _line('Ada', github='ada', x='shared'),
+        _line('Bob', github='bob', x='shared'),
+        _line('Grace', github='grace')
+    ])
+
+    assert report['imported'] == 2
+    assert report['invalid'] == 1
+    assert report['failed'] == 0
+    assert report['errors'][0].startswith('line 2:')
@@ -0,0 +1,25 @@
+from services.database import Leaderboard
+
+
+def _summary(candidate_id, score):
+    return {'id': candidate_id, 'total_score': score}
+
+
+def test_top_with_non_positive_limit_is_empty():
+    board = Leaderboard(size=3)
+    board.load([_summary('a', 30.0), _summary('b', 20.0)])
+
+    assert board.top(0) == []
+    assert board.top(-1) == []
+    assert [summary['id'] for summary in board.top(2)] == ['a', 'b']
+
+
+def test_empty_partial_board_stays_empty_until_reloaded():
+    board = Leaderboard(size=2)
+    board.load([_summary('a', 30.0), _summary('b', 20.0)])
+    board.remove('a', 'b')
+
+    board.upsert([_summary('c', 5.0)])
+
+    assert board.stats()['size'] == 0
+    assert board.top(1) is None
@@ -250,6 +250,20 @@ export default function Home() {
     }
   };
 
+  const handleCandidateSelect = async (candidate: any) => {
+    setSelectedCandidate(candidate);
+    // List endpoints return summaries; the detail panel needs the full profile
+    if (!candidate || candidate.experiences) return;
+    try {
+      const data = await api.getCandidate(candidate.id);
+      if (data.success) {
+        setSelectedCandidate((current: any) => (current?.id === candidate.id ? data.candidate : current));
+      }
+    } catch (error) {
+      console.error('Failed to load candidate:', error);
+    }
+  };
+
   const handleDeepSearch = async () => {
     if (!searchQuery) return;
 
@@ -269,7 +283,7 @@ export default function Home() {
     <main className="relative w-full h-screen overflow-hidden bg-black text-white">
       {/* 3D Scene - Full Screen */}
       <div className="absolute inset-0 z-0">
-        <Scene candidates={candidates} onCandidateSelect={setSelectedCandidate} />
+        <Scene candidates={candidates} onCandidateSelect={handleCandidateSelect} />
       </div>
 
       {/* UI Overlay Layer */}
@@ -377,7 +391,7 @@ export default function Home() {
                 }}>
                   <div className="flex items-center gap-4 mb-6">
                     <div className="w-16 h-16 rounded-full flex items-center justify-center text-2xl font-bold bg-gradient-to-br from-blue-500 to-purple-600 border-2 border-white/30 shadow-lg">
-                      {selectedCandidate.score?.total_score ? Math.round(selectedCandidate.score.total_score) : '?'}
+                      {(selectedCandidate.total_score ?? selectedCandidate.score?.total_score) ? Math.round(selectedCandidate.total_score ?? selectedCandidate.score.total_score) : '?'}
                     </div>
                     <div>
                       <h3 className="text-2xl font-bold">{selectedCandidate.name}</h3>
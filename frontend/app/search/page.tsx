@@ -1,12 +1,12 @@
 'use client';
 
 import { useState } from 'react';
-import { Candidate } from '@/types/candidate';
+import { CandidateSummary } from '@/types/candidate';
 import CandidateCard from '@/components/CandidateCard';
 import Link from 'next/link';
 
 export default function SearchPage() {
-  const [candidates, setCandidates] = useState<Candidate[]>([]);
+  const [candidates, setCandidates] = useState<CandidateSummary[]>([]);
   const [loading, setLoading] = useState(false);
   const [searchQuery, setSearchQuery] = useState('');
   const [searchType, setSearchType] = useState<'name' | 'company' | 'skills'>('name');
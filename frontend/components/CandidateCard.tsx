@@ -1,8 +1,8 @@
-import { Candidate } from '@/types/candidate';
+import { CandidateSummary } from '@/types/candidate';
 import Link from 'next/link';
 
 interface CandidateCardProps {
-  candidate: Candidate;
+  candidate: CandidateSummary;
 }
 
 const getTierColor = (tier: string) => {
@@ -31,14 +31,19 @@ export default function CandidateCard({ candidate }: CandidateCardProps) {
     <Link href={`/candidate/${candidate.id}`}>
       <div className="border border-white/10 rounded-lg p-6 hover:border-white/20 hover:bg-white/5 transition-all duration-200 bg-black cursor-pointer group">
         <div className="flex justify-between items-start mb-4">
-          <div>
-            <h3 className="text-xl font-semibold text-white group-hover:text-white/90">{candidate.name}</h3>
-            {candidate.current_title && (
-              <p className="text-sm text-gray-400 mt-1">{candidate.current_title}</p>
-            )}
-            {candidate.current_company && (
-              <p className="text-sm font-medium text-gray-300 mt-1">{candidate.current_company}</p>
+          <div className="flex items-start gap-3">
+            {candidate.avatar_url && (
+              <img src={candidate.avatar_url} alt="" className="w-10 h-10 rounded-full border border-white/10" />
             )}
+            <div>
+              <h3 className="text-xl font-semibold text-white group-hover:text-white/90">{candidate.name}</h3>
+              {candidate.current_title && (
+                <p className="text-sm text-gray-400 mt-1">{candidate.current_title}</p>
+              )}
+              {candidate.current_company && (
+                <p className="text-sm font-medium text-gray-300 mt-1">{candidate.current_company}</p>
+              )}
+            </div>
           </div>
           <div className={`px-3 py-1 rounded-full text-xs font-medium border ${tierColor}`}>
             {tierBadge} {candidate.priority_tier.toUpperCase()}
@@ -51,35 +56,30 @@ export default function CandidateCard({ candidate }: CandidateCardProps) {
             <div className="flex-1 bg-white/10 rounded-full h-2">
               <div
                 className="bg-gradient-to-r from-blue-500 to-purple-600 h-2 rounded-full transition-all"
-                style={{ width: `${candidate.score.total_score}%` }}
+                style={{ width: `${candidate.total_score}%` }}
               />
             </div>
             <span className="text-sm font-semibold text-white">
-              {candidate.score.total_score.toFixed(1)}
+              {candidate.total_score.toFixed(1)}
             </span>
           </div>
         </div>
 
         <div className="flex flex-wrap gap-2 mb-4">
-          {candidate.github_profile && (
+          {candidate.github_username && (
             <span className="px-2 py-1 bg-white text-black text-xs rounded-md font-medium">
-              GitHub: {candidate.github_profile.total_stars}⭐
+              GitHub: @{candidate.github_username}
             </span>
           )}
-          {candidate.x_profile && (
+          {candidate.x_username && (
             <span className="px-2 py-1 bg-white text-black text-xs rounded-md font-medium">
-              X: {candidate.x_profile.followers} followers
-            </span>
-          )}
-          {candidate.total_years_experience > 0 && (
-            <span className="px-2 py-1 bg-blue-500/20 text-blue-300 text-xs rounded-md border border-blue-500/30">
-              {candidate.total_years_experience}+ years
+              X: @{candidate.x_username}
             </span>
           )}
         </div>
 
         <div className="flex flex-wrap gap-1">
-          {candidate.experiences.slice(0, 3).map((exp, idx) => (
+          {candidate.top_experiences?.map((exp, idx) => (
             <span
               key={idx}
               className={`px-2 py-1 text-xs rounded-md ${
@@ -250,7 +250,7 @@ export default function CandidateNode({ position, candidate, onClick, color = '#
         <Html distanceFactor={10}>
           <div className="bg-blue-900/90 text-white px-3 py-2 rounded-lg text-xs whitespace-nowrap pointer-events-none select-none backdrop-blur-sm border border-blue-400/50 shadow-lg">
             <div className="font-bold">{candidate.name}</div>
-            <div className="text-blue-200 text-[10px]">Score: {candidate.score?.total_score || '?'}</div>
+            <div className="text-blue-200 text-[10px]">Score: {candidate.total_score ?? candidate.score?.total_score ?? '?'}</div>
           </div>
         </Html>
       )}
@@ -28,7 +28,7 @@ export default function Scene({ candidates, onCandidateSelect }: SceneProps) {
         const theta = Math.sqrt(safeCandidates.length * Math.PI) * phi;
 
         // Calculate radius based on score - higher scores are closer (smaller radius)
-        const score = candidate.score?.total_score || 50;
+        const score = candidate.total_score ?? candidate.score?.total_score ?? 50;
         const baseRadius = 20;
         const minRadius = 8;
         // Map score (0-100) to radius (baseRadius to minRadius)
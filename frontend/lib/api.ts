@@ -1,4 +1,4 @@
-import { Candidate } from '@/types/candidate';
+import { Candidate, CandidateSummary } from '@/types/candidate';
 
 const API_BASE = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:5001';
 
@@ -10,7 +10,8 @@ export const api = {
     company?: string;
     limit?: number;
     offset?: number;
-  }): Promise<{ success: boolean; candidates: Candidate[]; count: number }> {
+    cursor?: string;
+  }): Promise<{ success: boolean; candidates: CandidateSummary[]; count: number; next_cursor: string | null }> {
     const queryParams = new URLSearchParams();
     if (params) {
       Object.entries(params).forEach(([key, value]) => {
@@ -54,7 +55,7 @@ export const api = {
     return response.json();
   },
 
-  async getTopCandidates(limit: number = 20): Promise<{ success: boolean; candidates: Candidate[] }> {
+  async getTopCandidates(limit: number = 20): Promise<{ success: boolean; candidates: CandidateSummary[] }> {
     const response = await fetch(`${API_BASE}/api/candidates/top?limit=${limit}`);
     return response.json();
   },
@@ -85,6 +86,7 @@ export const api = {
     company?: string;
     limit?: number;
     offset?: number;
+    cursor?: string;
   }) {
     const queryParams = new URLSearchParams();
     Object.entries(params).forEach(([key, value]) => {
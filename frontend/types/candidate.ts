@@ -66,6 +66,7 @@ export interface Candidate {
   linkedin_url?: string;
   current_title?: string;
   current_company?: string;
+  bio?: string;
   experiences: Experience[];
   total_years_experience: number;
   education: Education[];
@@ -77,3 +78,25 @@ export interface Candidate {
   last_updated: string;
   notes?: string;
 }
+
+export interface ExperienceHighlight {
+  company: string;
+  is_faang: boolean;
+  is_frontier_lab: boolean;
+  is_top_tech: boolean;
+}
+
+// Lightweight list projection returned by list/search endpoints.
+// Fetch the full Candidate from /api/candidates/:id.
+export interface CandidateSummary {
+  id: string;
+  name: string;
+  current_title?: string;
+  current_company?: string;
+  priority_tier: 'low' | 'medium' | 'high' | 'top';
+  total_score: number;
+  github_username?: string;
+  x_username?: string;
+  avatar_url?: string;
+  top_experiences: ExperienceHighlight[];
+}